@@ -5,6 +5,38 @@ A Model Context Protocol (MCP) server for accessing Microsoft's
 Planetary Computer geospatial data catalog.
 """
 
-from planetary_computer_mcp import core, tools
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from planetary_computer_mcp import core, tools
+
+# Subpackages imported lazily on first attribute access (PEP 562)
+_LAZY_SUBMODULES = ("core", "tools")
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a subpackage on first access.
+
+    Parameters
+    ----------
+    name : str
+        Attribute name
+
+    Returns
+    -------
+    Any
+        The requested subpackage
+
+    Raises
+    ------
+    AttributeError
+        If the name is not a subpackage
+    """
+    if name not in _LAZY_SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f"{__name__}.{name}")
+
 
 __all__ = ["core", "tools"]
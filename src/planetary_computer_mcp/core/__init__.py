@@ -1,40 +1,143 @@
 """
 Core utilities for Planetary Computer MCP server.
+
+Submodules are imported lazily on first attribute access (PEP 562), so
+importing one helper does not pull in xarray, zarr or the STAC client.
 """
 
-from planetary_computer_mcp.core.collections import (
-    COLLECTION_INFO,
-    COLLECTION_KEYWORDS,
-    COLLECTION_TYPES,
-    AmbiguousCollectionError,
-    NoCollectionMatchError,
-    detect_collection_from_query,
-    get_collection_type,
-)
-from planetary_computer_mcp.core.geocoding import (
-    calculate_bbox_area_km2,
-    clear_geocoding_cache,
-    get_cache_stats,
-    get_default_time_range,
-    place_to_bbox,
-    validate_bbox,
-)
-from planetary_computer_mcp.core.raster_utils import download_multiband_to_geotiff
-from planetary_computer_mcp.core.stac_client import PlanetaryComputerSTAC, stac_client
-from planetary_computer_mcp.core.vector_utils import (
-    get_quadkeys_for_bbox,
-    query_geoparquet_by_quadkey,
-)
-from planetary_computer_mcp.core.zarr_utils import (
-    COORD_MAPPINGS,
-    DEFAULT_VARIABLES,
-    get_available_variables,
-    get_zarr_metadata,
-    get_zarr_store_url,
-    load_and_compute_zarr,
-    load_zarr_data,
-    save_zarr_subset_as_netcdf,
-)
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from planetary_computer_mcp.core.collections import (
+        COLLECTION_INFO,
+        COLLECTION_KEYWORDS,
+        COLLECTION_TYPES,
+        AmbiguousCollectionError,
+        NoCollectionMatchError,
+        detect_collection_from_query,
+        get_collection_type,
+    )
+    from planetary_computer_mcp.core.geocoding import (
+        calculate_bbox_area_km2,
+        calculate_bbox_area_km2_batch,
+        clear_geocoding_cache,
+        get_cache_stats,
+        get_default_time_range,
+        place_to_bbox,
+        validate_bbox,
+        validate_bbox_batch,
+    )
+    from planetary_computer_mcp.core.raster_utils import download_multiband_to_geotiff
+    from planetary_computer_mcp.core.stac_client import PlanetaryComputerSTAC, stac_client
+    from planetary_computer_mcp.core.vector_utils import (
+        get_quadkeys_for_bbox,
+        query_geoparquet_by_quadkey,
+    )
+    from planetary_computer_mcp.core.zarr_utils import (
+        COORD_MAPPINGS,
+        DEFAULT_VARIABLES,
+        get_available_variables,
+        get_zarr_metadata,
+        get_zarr_store_url,
+        load_and_compute_zarr,
+        load_zarr_data,
+        save_zarr_subset_as_netcdf,
+    )
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    "COLLECTION_INFO": "collections",
+    "COLLECTION_KEYWORDS": "collections",
+    "COLLECTION_TYPES": "collections",
+    "AmbiguousCollectionError": "collections",
+    "NoCollectionMatchError": "collections",
+    "detect_collection_from_query": "collections",
+    "get_collection_type": "collections",
+    "calculate_bbox_area_km2": "geocoding",
+    "calculate_bbox_area_km2_batch": "geocoding",
+    "clear_geocoding_cache": "geocoding",
+    "get_cache_stats": "geocoding",
+    "get_default_time_range": "geocoding",
+    "place_to_bbox": "geocoding",
+    "validate_bbox": "geocoding",
+    "validate_bbox_batch": "geocoding",
+    "download_multiband_to_geotiff": "raster_utils",
+    "PlanetaryComputerSTAC": "stac_client",
+    "stac_client": "stac_client",
+    "get_quadkeys_for_bbox": "vector_utils",
+    "query_geoparquet_by_quadkey": "vector_utils",
+    "COORD_MAPPINGS": "zarr_utils",
+    "DEFAULT_VARIABLES": "zarr_utils",
+    "get_available_variables": "zarr_utils",
+    "get_zarr_metadata": "zarr_utils",
+    "get_zarr_store_url": "zarr_utils",
+    "load_and_compute_zarr": "zarr_utils",
+    "load_zarr_data": "zarr_utils",
+    "save_zarr_subset_as_netcdf": "zarr_utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a public core attribute from its submodule on first access.
+
+    Parameters
+    ----------
+    name : str
+        Attribute name
+
+    Returns
+    -------
+    Any
+        The requested attribute
+
+    Raises
+    ------
+    AttributeError
+        If the name is not a public core attribute
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f"{__name__}.{_LAZY_IMPORTS[name]}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+class _CoreModule(types.ModuleType):
+    """
+    Package module that keeps lazy public names from being shadowed.
+
+    Importing a submodule binds it as a package attribute. For
+    ``core.stac_client`` that would hide the shared ``stac_client`` instance,
+    so submodule bindings for public lazy names are skipped and the name is
+    resolved through ``__getattr__`` instead.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if isinstance(value, types.ModuleType) and name in _LAZY_IMPORTS:
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _CoreModule
+
+
+def __dir__() -> list[str]:
+    """
+    List module attributes including not-yet-imported public names.
+
+    Returns
+    -------
+    list[str]
+        Sorted attribute names
+    """
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
 
 __all__ = [
     "COLLECTION_INFO",
@@ -46,6 +149,7 @@ __all__ = [
     "NoCollectionMatchError",
     "PlanetaryComputerSTAC",
     "calculate_bbox_area_km2",
+    "calculate_bbox_area_km2_batch",
     "clear_geocoding_cache",
     "detect_collection_from_query",
     "download_multiband_to_geotiff",
@@ -63,4 +167,5 @@ __all__ = [
     "save_zarr_subset_as_netcdf",
     "stac_client",
     "validate_bbox",
+    "validate_bbox_batch",
 ]
@@ -0,0 +1,71 @@
+"""
+Cache location and in-process cache helpers shared by the core modules.
+
+Kept free of third-party imports so any module can use it without pulling
+in the geocoding or STAC dependencies.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+# Root directory of the on-disk caches (geocoding, STAC searches, quadkey index)
+CACHE_DIR = Path(
+    os.environ.get("PC_MCP_CACHE_DIR", Path.home() / ".cache" / "planetary-computer-mcp")
+)
+
+
+class _LRUCache:
+    """Thread-safe mapping that evicts its least recently used entries."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._data.clear()
+
+    def get(self, key: Any) -> Any:
+        """
+        Get a cached value, marking it as recently used.
+
+        Parameters
+        ----------
+        key : Any
+            Cache key
+
+        Returns
+        -------
+        Any
+            Cached value, or None on a miss
+        """
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: Any, value: Any) -> None:
+        """
+        Cache a value, evicting the least recently used entry when full.
+
+        Parameters
+        ----------
+        key : Any
+            Cache key
+        value : Any
+            Value to cache
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
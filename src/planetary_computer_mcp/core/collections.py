@@ -2,6 +2,12 @@
 Collection mapping and metadata for dataset auto-detection.
 """
 
+import heapq
+from collections.abc import Mapping, Sequence
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any
+
 
 class AmbiguousCollectionError(Exception):
     """
@@ -28,188 +34,235 @@ class NoCollectionMatchError(Exception):
     ----------
     message : str
         Error message describing the issue
-    available_categories : list[str]
+    available_categories : Sequence[str]
         List of available data categories for user guidance
     """
 
-    def __init__(self, message: str, available_categories: list[str]) -> None:
+    def __init__(self, message: str, available_categories: Sequence[str]) -> None:
         super().__init__(message)
         self.available_categories = available_categories
 
 
 # Collection metadata with descriptions for suggestions
-COLLECTION_INFO: dict[str, dict] = {
-    # Optical imagery
-    "sentinel-2-l2a": {
-        "name": "Sentinel-2 L2A",
-        "description": "10m optical imagery, global, 5-day revisit",
-        "keywords": ["sentinel-2", "optical", "multispectral"],
-        "category": "optical",
-    },
-    "landsat-c2-l2": {
-        "name": "Landsat Collection 2 L2",
-        "description": "30m optical imagery, global, 16-day revisit",
-        "keywords": ["landsat", "landsat-8", "landsat-9"],
-        "category": "optical",
-    },
-    "naip": {
-        "name": "NAIP Aerial Imagery",
-        "description": "0.6-1m aerial photos, US only, updated every 2-3 years",
-        "keywords": ["naip", "aerial", "high-resolution", "usda"],
-        "category": "optical",
-    },
-    # SAR
-    "sentinel-1-rtc": {
-        "name": "Sentinel-1 RTC",
-        "description": "10m radar imagery, global, works through clouds",
-        "keywords": ["sentinel-1", "sar", "radar", "microwave"],
-        "category": "sar",
-    },
-    # DEMs
-    "cop-dem-glo-30": {
-        "name": "Copernicus DEM 30m",
-        "description": "30m global elevation model",
-        "keywords": ["dem", "elevation", "terrain", "copernicus", "height"],
-        "category": "elevation",
-    },
-    "alos-dem": {
-        "name": "ALOS World 3D DEM",
-        "description": "30m global elevation from JAXA",
-        "keywords": ["alos", "dem", "elevation", "jaxa"],
-        "category": "elevation",
-    },
-    # Land cover
-    "esa-worldcover": {
-        "name": "ESA WorldCover",
-        "description": "10m global land cover classification",
-        "keywords": ["worldcover", "land cover", "landcover", "esa", "classification"],
-        "category": "land_cover",
-    },
-    "io-lulc-annual-v02": {
-        "name": "Esri Land Use/Land Cover",
-        "description": "10m annual global land use classification",
-        "keywords": ["lulc", "land use", "esri", "annual"],
-        "category": "land_cover",
-    },
-    # Climate / Weather
-    "gridmet": {
-        "name": "gridMET",
-        "description": "4km daily climate data for CONUS (1979-present)",
-        "keywords": ["gridmet", "climate", "weather", "temperature", "precipitation", "conus"],
-        "category": "climate",
-    },
-    "terraclimate": {
-        "name": "TerraClimate",
-        "description": "4km monthly climate data, global (1958-present)",
-        "keywords": ["terraclimate", "climate", "monthly", "global"],
-        "category": "climate",
-    },
-    "daymet-daily-na": {
-        "name": "Daymet Daily",
-        "description": "1km daily weather data for North America",
-        "keywords": ["daymet", "weather", "daily", "north america"],
-        "category": "climate",
-    },
-    # Vector
-    "ms-buildings": {
-        "name": "Microsoft Building Footprints",
-        "description": "AI-derived building polygons, global coverage",
-        "keywords": ["building", "buildings", "footprint", "footprints", "microsoft"],
-        "category": "vector",
-    },
-}
+COLLECTION_INFO: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        # Optical imagery
+        "sentinel-2-l2a": MappingProxyType(
+            {
+                "name": "Sentinel-2 L2A",
+                "description": "10m optical imagery, global, 5-day revisit",
+                "keywords": ("sentinel-2", "optical", "multispectral"),
+                "category": "optical",
+            }
+        ),
+        "landsat-c2-l2": MappingProxyType(
+            {
+                "name": "Landsat Collection 2 L2",
+                "description": "30m optical imagery, global, 16-day revisit",
+                "keywords": ("landsat", "landsat-8", "landsat-9"),
+                "category": "optical",
+            }
+        ),
+        "naip": MappingProxyType(
+            {
+                "name": "NAIP Aerial Imagery",
+                "description": "0.6-1m aerial photos, US only, updated every 2-3 years",
+                "keywords": ("naip", "aerial", "high-resolution", "usda"),
+                "category": "optical",
+            }
+        ),
+        # SAR
+        "sentinel-1-rtc": MappingProxyType(
+            {
+                "name": "Sentinel-1 RTC",
+                "description": "10m radar imagery, global, works through clouds",
+                "keywords": ("sentinel-1", "sar", "radar", "microwave"),
+                "category": "sar",
+            }
+        ),
+        # DEMs
+        "cop-dem-glo-30": MappingProxyType(
+            {
+                "name": "Copernicus DEM 30m",
+                "description": "30m global elevation model",
+                "keywords": ("dem", "elevation", "terrain", "copernicus", "height"),
+                "category": "elevation",
+            }
+        ),
+        "alos-dem": MappingProxyType(
+            {
+                "name": "ALOS World 3D DEM",
+                "description": "30m global elevation from JAXA",
+                "keywords": ("alos", "dem", "elevation", "jaxa"),
+                "category": "elevation",
+            }
+        ),
+        # Land cover
+        "esa-worldcover": MappingProxyType(
+            {
+                "name": "ESA WorldCover",
+                "description": "10m global land cover classification",
+                "keywords": ("worldcover", "land cover", "landcover", "esa", "classification"),
+                "category": "land_cover",
+            }
+        ),
+        "io-lulc-annual-v02": MappingProxyType(
+            {
+                "name": "Esri Land Use/Land Cover",
+                "description": "10m annual global land use classification",
+                "keywords": ("lulc", "land use", "esri", "annual"),
+                "category": "land_cover",
+            }
+        ),
+        # Climate / Weather
+        "gridmet": MappingProxyType(
+            {
+                "name": "gridMET",
+                "description": "4km daily climate data for CONUS (1979-present)",
+                "keywords": (
+                    "gridmet",
+                    "climate",
+                    "weather",
+                    "temperature",
+                    "precipitation",
+                    "conus",
+                ),
+                "category": "climate",
+            }
+        ),
+        "terraclimate": MappingProxyType(
+            {
+                "name": "TerraClimate",
+                "description": "4km monthly climate data, global (1958-present)",
+                "keywords": ("terraclimate", "climate", "monthly", "global"),
+                "category": "climate",
+            }
+        ),
+        "daymet-daily-na": MappingProxyType(
+            {
+                "name": "Daymet Daily",
+                "description": "1km daily weather data for North America",
+                "keywords": ("daymet", "weather", "daily", "north america"),
+                "category": "climate",
+            }
+        ),
+        # Vector
+        "ms-buildings": MappingProxyType(
+            {
+                "name": "Microsoft Building Footprints",
+                "description": "AI-derived building polygons, global coverage",
+                "keywords": ("building", "buildings", "footprint", "footprints", "microsoft"),
+                "category": "vector",
+            }
+        ),
+    }
+)
 
 # Backward-compatible keyword mapping (for simple lookups)
-COLLECTION_KEYWORDS: dict[str, str] = {
-    # Optical imagery
-    "sentinel-1": "sentinel-1-rtc",
-    "sentinel": "sentinel-2-l2a",
-    "sentinel-2": "sentinel-2-l2a",
-    "naip": "naip",
-    "aerial": "naip",
-    "landsat": "landsat-c2-l2",
-    # DEMs
-    "dem": "cop-dem-glo-30",
-    "elevation": "cop-dem-glo-30",
-    "terrain": "cop-dem-glo-30",
-    "copernicus": "cop-dem-glo-30",
-    "alos": "alos-dem",
-    # Land cover
-    "land cover": "esa-worldcover",
-    "landcover": "esa-worldcover",
-    "lulc": "io-lulc-annual-v02",
-    "land use": "io-lulc-annual-v02",
-    "worldcover": "esa-worldcover",
-    # Vectors
-    "building": "ms-buildings",
-    "buildings": "ms-buildings",
-    "footprint": "ms-buildings",
-    # SAR
-    "sar": "sentinel-1-rtc",
-    "radar": "sentinel-1-rtc",
-    # Climate / Weather (Zarr-based)
-    "gridmet": "gridmet",
-    "terraclimate": "terraclimate",
-    "daymet": "daymet-daily-na",
-    "climate": "gridmet",
-    "weather": "gridmet",
-    "temperature": "gridmet",
-    "precipitation": "gridmet",
-}
+COLLECTION_KEYWORDS: Mapping[str, str] = MappingProxyType(
+    {
+        # Optical imagery
+        "sentinel-1": "sentinel-1-rtc",
+        "sentinel": "sentinel-2-l2a",
+        "sentinel-2": "sentinel-2-l2a",
+        "naip": "naip",
+        "aerial": "naip",
+        "landsat": "landsat-c2-l2",
+        # DEMs
+        "dem": "cop-dem-glo-30",
+        "elevation": "cop-dem-glo-30",
+        "terrain": "cop-dem-glo-30",
+        "copernicus": "cop-dem-glo-30",
+        "alos": "alos-dem",
+        # Land cover
+        "land cover": "esa-worldcover",
+        "landcover": "esa-worldcover",
+        "lulc": "io-lulc-annual-v02",
+        "land use": "io-lulc-annual-v02",
+        "worldcover": "esa-worldcover",
+        # Vectors
+        "building": "ms-buildings",
+        "buildings": "ms-buildings",
+        "footprint": "ms-buildings",
+        # SAR
+        "sar": "sentinel-1-rtc",
+        "radar": "sentinel-1-rtc",
+        # Climate / Weather (Zarr-based)
+        "gridmet": "gridmet",
+        "terraclimate": "terraclimate",
+        "daymet": "daymet-daily-na",
+        "climate": "gridmet",
+        "weather": "gridmet",
+        "temperature": "gridmet",
+        "precipitation": "gridmet",
+    }
+)
 
 # Generic terms that match multiple collections (ambiguous)
-AMBIGUOUS_KEYWORDS: dict[str, list[str]] = {
-    "satellite": ["sentinel-2-l2a", "landsat-c2-l2", "sentinel-1-rtc"],
-    "imagery": ["sentinel-2-l2a", "landsat-c2-l2", "naip"],
-    "image": ["sentinel-2-l2a", "landsat-c2-l2", "naip"],
-    "remote sensing": ["sentinel-2-l2a", "landsat-c2-l2", "sentinel-1-rtc"],
-    "optical": ["sentinel-2-l2a", "landsat-c2-l2", "naip"],
-}
+AMBIGUOUS_KEYWORDS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "satellite": ("sentinel-2-l2a", "landsat-c2-l2", "sentinel-1-rtc"),
+        "imagery": ("sentinel-2-l2a", "landsat-c2-l2", "naip"),
+        "image": ("sentinel-2-l2a", "landsat-c2-l2", "naip"),
+        "remote sensing": ("sentinel-2-l2a", "landsat-c2-l2", "sentinel-1-rtc"),
+        "optical": ("sentinel-2-l2a", "landsat-c2-l2", "naip"),
+    }
+)
 
 # Available data categories for error messages
-AVAILABLE_CATEGORIES = [
+AVAILABLE_CATEGORIES = (
     "optical imagery (sentinel-2, landsat, naip)",
     "radar/SAR (sentinel-1)",
     "elevation/DEM (copernicus dem, alos dem)",
     "land cover (esa worldcover, esri lulc)",
     "climate/weather (gridmet, terraclimate, daymet)",
     "building footprints (ms-buildings)",
-]
+)
+
+
+def _build_keyword_index() -> dict[str, list[tuple[str, int]]]:
+    """
+    Build a reverse index from COLLECTION_INFO keywords to scored collections.
+
+    Returns
+    -------
+    dict[str, list[tuple[str, int]]]
+        Keyword -> list of (collection_id, score) pairs
+    """
+    index: dict[str, list[tuple[str, int]]] = {}
+    for collection_id, info in COLLECTION_INFO.items():
+        for keyword in info["keywords"]:
+            # Exact collection name = highest score
+            # Longer keywords = more specific = higher score
+            score = 100 if keyword == collection_id else len(keyword) * 2
+            index.setdefault(keyword, []).append((collection_id, score))
+    return index
+
+
+# COLLECTION_INFO keyword -> [(collection_id, score)], built once at import
+KEYWORD_TO_COLLECTIONS = _build_keyword_index()
 
+# Every distinct keyword, so each is scanned for only once per query
+ALL_KEYWORDS: frozenset[str] = frozenset(
+    [*KEYWORD_TO_COLLECTIONS, *COLLECTION_KEYWORDS, *AMBIGUOUS_KEYWORDS]
+)
 
-def _score_collection_match(query_lower: str, collection_id: str) -> int:
+
+def _find_keywords(query_lower: str) -> set[str]:
     """
-    Score how well a query matches a collection.
+    Find all known keywords contained in a query.
 
     Parameters
     ----------
     query_lower : str
-        Lowercase query string to match
-    collection_id : str
-        Collection ID to score against
+        Lowercase query string to scan
 
     Returns
     -------
-    int
-        Score (higher = better match). 0 = no match.
+    set[str]
+        Keywords that appear as substrings of the query
     """
-    info = COLLECTION_INFO.get(collection_id)
-    if not info:
-        return 0
-
-    score = 0
-    keywords = info.get("keywords", [])
-
-    for keyword in keywords:
-        if keyword in query_lower:
-            # Exact collection name = highest score
-            if keyword == collection_id:
-                score += 100
-            # Longer keywords = more specific = higher score
-            else:
-                score += len(keyword) * 2
-
-    return score
+    return {keyword for keyword in ALL_KEYWORDS if keyword in query_lower}
 
 
 def detect_collection_from_query(query: str) -> str:
@@ -238,27 +291,32 @@ def detect_collection_from_query(query: str) -> str:
         If query doesn't match any collection.
         Contains 'available_categories' attribute.
     """
-    query_lower = query.lower()
+    matched_keywords = _find_keywords(query.lower())
 
     # First check for ambiguous keywords - if present AND no specific term, raise early
     ambiguous_matches: list[str] = []
     for ambig_keyword, collections in AMBIGUOUS_KEYWORDS.items():
-        if ambig_keyword in query_lower:
+        if ambig_keyword in matched_keywords:
             ambiguous_matches.extend(collections)
 
     # Check for specific/exact keyword matches
     matched_collections: dict[str, int] = {}
 
+    collection_scores: dict[str, int] = {}
+    for keyword in matched_keywords:
+        for collection_id, score in KEYWORD_TO_COLLECTIONS.get(keyword, []):
+            collection_scores[collection_id] = collection_scores.get(collection_id, 0) + score
+
+    # Keep COLLECTION_INFO order so ties resolve the same way on every run
     for collection_id in COLLECTION_INFO:
-        score = _score_collection_match(query_lower, collection_id)
-        if score > 0:
-            matched_collections[collection_id] = score
+        if collection_id in collection_scores:
+            matched_collections[collection_id] = collection_scores[collection_id]
 
     # Also check the simple keyword mapping for backward compatibility
     # These are specific keywords like "sentinel-2", "landsat", "naip"
     specific_keyword_match = False
     for keyword, collection_id in COLLECTION_KEYWORDS.items():
-        if keyword in query_lower:
+        if keyword in matched_keywords:
             # Skip if this keyword is in ambiguous list (e.g., "satellite")
             if keyword in AMBIGUOUS_KEYWORDS:
                 continue
@@ -286,14 +344,16 @@ def detect_collection_from_query(query: str) -> str:
 
     # If we have a clear winner (one collection scores much higher), return it
     if matched_collections:
-        sorted_matches = sorted(matched_collections.items(), key=lambda x: x[1], reverse=True)
-        top_collection, top_score = sorted_matches[0]
+        # Only the top two scores are needed to decide; ties keep insertion order
+        top_two = heapq.nlargest(2, matched_collections.items(), key=itemgetter(1))
+        top_collection, top_score = top_two[0]
 
         # Clear winner: top score is significantly higher than second
-        if len(sorted_matches) == 1 or top_score > sorted_matches[1][1] * 1.5:
+        if len(top_two) == 1 or top_score > top_two[1][1] * 1.5:
             return top_collection
 
-        # Multiple close matches = ambiguous
+        # Multiple close matches = ambiguous (rare path, full sort is fine here)
+        sorted_matches = sorted(matched_collections.items(), key=itemgetter(1), reverse=True)
         close_matches = [c for c, s in sorted_matches if s >= top_score * 0.6]
 
         if len(close_matches) > 1:
@@ -322,28 +382,30 @@ def detect_collection_from_query(query: str) -> str:
 
 
 # Collection metadata for tool routing
-COLLECTION_TYPES: dict[str, str] = {
-    # Raster (COG-based via STAC)
-    "sentinel-2-l2a": "raster",
-    "naip": "raster",
-    "landsat-c2-l2": "raster",
-    "cop-dem-glo-30": "raster",
-    "alos-dem": "raster",
-    "esa-worldcover": "raster",
-    "io-lulc-annual-v02": "raster",
-    "sentinel-1-rtc": "raster",
-    # Zarr-based climate/weather data
-    "gridmet": "zarr",
-    "terraclimate": "zarr",
-    "daymet-daily-na": "zarr",
-    "daymet-daily-hi": "zarr",
-    "daymet-daily-pr": "zarr",
-    "daymet-monthly-na": "zarr",
-    "daymet-annual-na": "zarr",
-    "era5-pds": "zarr",
-    # Vector (GeoParquet)
-    "ms-buildings": "vector",
-}
+COLLECTION_TYPES: Mapping[str, str] = MappingProxyType(
+    {
+        # Raster (COG-based via STAC)
+        "sentinel-2-l2a": "raster",
+        "naip": "raster",
+        "landsat-c2-l2": "raster",
+        "cop-dem-glo-30": "raster",
+        "alos-dem": "raster",
+        "esa-worldcover": "raster",
+        "io-lulc-annual-v02": "raster",
+        "sentinel-1-rtc": "raster",
+        # Zarr-based climate/weather data
+        "gridmet": "zarr",
+        "terraclimate": "zarr",
+        "daymet-daily-na": "zarr",
+        "daymet-daily-hi": "zarr",
+        "daymet-daily-pr": "zarr",
+        "daymet-monthly-na": "zarr",
+        "daymet-annual-na": "zarr",
+        "era5-pds": "zarr",
+        # Vector (GeoParquet)
+        "ms-buildings": "vector",
+    }
+)
 
 
 def get_collection_type(collection_id: str) -> str:
@@ -2,71 +2,129 @@
 Geocoding utilities for converting place names to bounding boxes.
 """
 
-import hashlib
 import json
 import math
-import os
+import sqlite3
+import threading
 import time
-from datetime import datetime, timedelta
+from contextlib import closing
+from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from geopy.extra.rate_limiter import RateLimiter
-from geopy.geocoders import Nominatim
+import numpy as np
+
+from planetary_computer_mcp.core.cache import CACHE_DIR, _LRUCache
+
+if TYPE_CHECKING:
+    from geopy.extra.rate_limiter import RateLimiter
+
+# Mean Earth radius in km
+EARTH_RADIUS_KM = 6371.0
 
 # Cache configuration
 CACHE_TTL_SECONDS = 24 * 60 * 60  # 24 hours
-CACHE_DIR = Path(
-    os.environ.get("PC_MCP_CACHE_DIR", Path.home() / ".cache" / "planetary-computer-mcp")
-)
+
+
+# Entries kept in the in-process layer; older places are re-read from disk
+MEMORY_CACHE_MAX_ENTRIES = 1024
+
+# In-process layer over the SQLite cache (cache key -> entry)
+_MEMORY_CACHE = _LRUCache(MEMORY_CACHE_MAX_ENTRIES)
+
+# Striped locks so concurrent requests for one place geocode it only once;
+# a fixed pool keeps memory flat however many distinct places are seen
+PLACE_LOCK_STRIPES = 64
+_PLACE_LOCKS = tuple(threading.Lock() for _ in range(PLACE_LOCK_STRIPES))
 
 
 def _get_cache_path() -> Path:
     """
-    Get the geocoding cache file path.
+    Get the geocoding cache database path.
 
     Returns
     -------
     Path
-        Path to the cache JSON file
+        Path to the cache SQLite database
     """
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    return CACHE_DIR / "geocoding_cache.json"
+    return CACHE_DIR / "geocoding_cache.sqlite"
 
 
-def _load_cache() -> dict:
+def _connect() -> sqlite3.Connection:
     """
-    Load geocoding cache from disk.
+    Open the geocoding cache database, creating the table if needed.
 
     Returns
     -------
-    dict
-        Cache dictionary with place names as keys
+    sqlite3.Connection
+        Connection to the cache database
     """
-    cache_path = _get_cache_path()
-    if cache_path.exists():
-        try:
-            with open(cache_path) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError):
-            # Corrupted or unreadable cache, start fresh
-            return {}
-    return {}
+    conn = sqlite3.connect(_get_cache_path())
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS cache "
+        "(key TEXT PRIMARY KEY, bbox TEXT, place_name TEXT, timestamp REAL)"
+    )
+    return conn
 
 
-def _save_cache(cache: dict) -> None:
+def _load_entry(key: str) -> dict | None:
     """
-    Save geocoding cache to disk.
+    Load a single geocoding cache entry.
+
+    Checks the in-process cache first, then reads one row from disk.
 
     Parameters
     ----------
-    cache : dict
-        Cache dictionary to save
+    key : str
+        Cache key from ``_cache_key``
+
+    Returns
+    -------
+    dict or None
+        Cache entry with 'bbox', 'place_name' and 'timestamp', or None if missing
     """
-    cache_path = _get_cache_path()
+    entry = _MEMORY_CACHE.get(key)
+    if entry is not None:
+        return entry
+
     try:
-        with open(cache_path, "w") as f:
-            json.dump(cache, f, indent=2)
-    except OSError:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT bbox, place_name, timestamp FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error:
+        # Corrupted or unreadable cache, treat as a miss
+        return None
+
+    if row is None:
+        return None
+
+    entry = {"bbox": json.loads(row[0]), "place_name": row[1], "timestamp": row[2]}
+    _MEMORY_CACHE.put(key, entry)
+    return entry
+
+
+def _save_entry(key: str, entry: dict) -> None:
+    """
+    Save a single geocoding cache entry.
+
+    Parameters
+    ----------
+    key : str
+        Cache key from ``_cache_key``
+    entry : dict
+        Cache entry with 'bbox', 'place_name' and 'timestamp'
+    """
+    _MEMORY_CACHE.put(key, entry)
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                (key, json.dumps(entry["bbox"]), entry["place_name"], entry["timestamp"]),
+            )
+    except sqlite3.Error:
         # Silently fail on cache write errors
         pass
 
@@ -88,9 +146,8 @@ def _cache_key(place_name: str) -> str:
         Normalized cache key
     """
     # Normalize: lowercase, strip whitespace, collapse multiple spaces
-    normalized = " ".join(place_name.lower().split())
-    # Use BLAKE2b for deterministic, cross-platform hashing of cache keys
-    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+    # (used directly as the dict/SQLite key, so no extra hashing is needed)
+    return " ".join(place_name.lower().split())
 
 
 def _is_cache_valid(entry: dict) -> bool:
@@ -112,6 +169,27 @@ def _is_cache_valid(entry: dict) -> bool:
     return (time.time() - entry["timestamp"]) < CACHE_TTL_SECONDS
 
 
+@lru_cache(maxsize=1)
+def _get_geocoder() -> "RateLimiter":
+    """
+    Get the shared rate-limited Nominatim geocoder.
+
+    One instance is reused so the HTTP connection is kept alive and the
+    1-second Nominatim rate limit is enforced across calls.
+
+    Returns
+    -------
+    RateLimiter
+        Rate-limited ``Nominatim.geocode`` callable
+    """
+    # Deferred so importing the core package does not load geopy
+    from geopy.extra.rate_limiter import RateLimiter
+    from geopy.geocoders import Nominatim
+
+    geolocator = Nominatim(user_agent="planetary-computer-mcp")
+    return RateLimiter(geolocator.geocode, min_delay_seconds=1)
+
+
 def place_to_bbox(place_name: str, use_cache: bool = True) -> list[float]:
     """
     Convert place name to [west, south, east, north] bbox.
@@ -139,35 +217,53 @@ def place_to_bbox(place_name: str, use_cache: bool = True) -> list[float]:
     ValueError
         If geocoding fails
     """
+    if not use_cache:
+        return _geocode(place_name)
+
     cache_key_str = _cache_key(place_name)
 
-    # Try cache first
-    if use_cache:
-        cache = _load_cache()
-        if cache_key_str in cache and _is_cache_valid(cache[cache_key_str]):
-            return cache[cache_key_str]["bbox"]
+    # Concurrent lookups of the same place wait for the first one, then hit the cache
+    with _place_lock(cache_key_str):
+        entry = _load_entry(cache_key_str)
+        if entry is not None and _is_cache_valid(entry):
+            return entry["bbox"]
+
+        # Cache miss - call Nominatim
+        bbox = _geocode(place_name)
+        _save_entry(
+            cache_key_str,
+            {"bbox": bbox, "place_name": place_name, "timestamp": time.time()},
+        )
+        return bbox
 
-    # Cache miss or disabled - call Nominatim
-    geolocator = Nominatim(user_agent="planetary-computer-mcp")
-    geocode = RateLimiter(geolocator.geocode, min_delay_seconds=1)
-    location = geocode(place_name, exactly_one=True)
 
-    if location and hasattr(location, "raw") and location.raw.get("boundingbox"):
-        bb = location.raw["boundingbox"]
-        # boundingbox is [south, north, west, east] as strings
-        bbox = [float(bb[2]), float(bb[0]), float(bb[3]), float(bb[1])]
-
-        # Update cache
-        if use_cache:
-            cache = _load_cache()
-            cache[cache_key_str] = {
-                "bbox": bbox,
-                "place_name": place_name,
-                "timestamp": time.time(),
-            }
-            _save_cache(cache)
+def _geocode(place_name: str) -> list[float]:
+    """
+    Geocode a place name with Nominatim.
 
-        return bbox
+    Parameters
+    ----------
+    place_name : str
+        Human-readable place name
+
+    Returns
+    -------
+    list[float]
+        Bounding box as [west, south, east, north]
+
+    Raises
+    ------
+    ValueError
+        If geocoding fails
+    """
+    location = _get_geocoder()(place_name, exactly_one=True)
+
+    # geopy Locations always carry the raw Nominatim JSON
+    bb = location.raw.get("boundingbox") if location is not None else None
+    if bb:
+        # boundingbox is [south, north, west, east] as strings
+        south, north, west, east = map(float, bb)
+        return [west, south, east, north]
 
     # Provide helpful error message for ambiguous place names
     raise ValueError(
@@ -177,6 +273,23 @@ def place_to_bbox(place_name: str, use_cache: bool = True) -> list[float]:
     )
 
 
+def _place_lock(key: str) -> threading.Lock:
+    """
+    Get the striped lock serializing cache lookups for one place.
+
+    Parameters
+    ----------
+    key : str
+        Cache key from ``_cache_key``
+
+    Returns
+    -------
+    threading.Lock
+        Lock shared by all callers geocoding the same place
+    """
+    return _PLACE_LOCKS[hash(key) % PLACE_LOCK_STRIPES]
+
+
 def clear_geocoding_cache() -> int:
     """
     Clear the geocoding cache.
@@ -186,13 +299,18 @@ def clear_geocoding_cache() -> int:
     int
         Number of entries cleared
     """
+    _MEMORY_CACHE.clear()
     cache_path = _get_cache_path()
-    if cache_path.exists():
-        cache = _load_cache()
-        count = len(cache)
+    if not cache_path.exists():
+        return 0
+
+    try:
+        with closing(_connect()) as conn, conn:
+            return conn.execute("DELETE FROM cache").rowcount
+    except sqlite3.Error:
+        # Corrupted database, remove it entirely
         cache_path.unlink()
-        return count
-    return 0
+        return 0
 
 
 def get_cache_stats() -> dict:
@@ -208,13 +326,19 @@ def get_cache_stats() -> dict:
     if not cache_path.exists():
         return {"entries": 0, "size_bytes": 0, "valid_entries": 0}
 
-    cache = _load_cache()
-    valid_count = sum(1 for entry in cache.values() if _is_cache_valid(entry))
+    cutoff = time.time() - CACHE_TTL_SECONDS
+    try:
+        with closing(_connect()) as conn:
+            entries, valid_count = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(timestamp > ?), 0) FROM cache", (cutoff,)
+            ).fetchone()
+    except sqlite3.Error:
+        return {"entries": 0, "size_bytes": 0, "valid_entries": 0}
 
     return {
-        "entries": len(cache),
+        "entries": entries,
         "valid_entries": valid_count,
-        "expired_entries": len(cache) - valid_count,
+        "expired_entries": entries - valid_count,
         "size_bytes": cache_path.stat().st_size,
         "cache_path": str(cache_path),
     }
@@ -258,6 +382,49 @@ def validate_bbox(bbox: list[float]) -> list[float]:
     return [west, south, east, north]
 
 
+def validate_bbox_batch(bboxes: np.ndarray) -> np.ndarray:
+    """
+    Validate many bounding boxes at once.
+
+    Applies the same checks as ``validate_bbox`` column-wise.
+
+    Parameters
+    ----------
+    bboxes : np.ndarray
+        Array of shape (N, 4) with rows [west, south, east, north]
+
+    Returns
+    -------
+    np.ndarray
+        The bboxes as a float64 array of shape (N, 4)
+
+    Raises
+    ------
+    ValueError
+        If the array shape is wrong or any bbox is invalid
+    """
+    bboxes = np.asarray(bboxes, dtype=np.float64)
+    if bboxes.ndim != 2 or bboxes.shape[1] != 4:
+        raise ValueError("Bboxes must have shape (N, 4) [west, south, east, north]")
+
+    west, south, east, north = bboxes.T
+    checks = [
+        (west >= east, "West must be less than east"),
+        (south >= north, "South must be less than north"),
+        # Negated in-range tests, so NaN coordinates fail like in validate_bbox
+        (
+            ~(np.abs(bboxes[:, [0, 2]]) <= 180).all(axis=1),
+            "Longitude must be between -180 and 180",
+        ),
+        (~(np.abs(bboxes[:, [1, 3]]) <= 90).all(axis=1), "Latitude must be between -90 and 90"),
+    ]
+    for invalid, message in checks:
+        if invalid.any():
+            raise ValueError(f"{message} (bbox {int(np.argmax(invalid))})")
+
+    return bboxes
+
+
 def calculate_bbox_area_km2(bbox: list[float]) -> float:
     """
     Calculate approximate area of bounding box in square kilometers.
@@ -276,8 +443,7 @@ def calculate_bbox_area_km2(bbox: list[float]) -> float:
     """
     west, south, east, north = bbox
 
-    # Earth's radius in km
-    R = 6371.0
+    R = EARTH_RADIUS_KM
 
     # Convert to radians
     lat1 = math.radians(south)
@@ -295,6 +461,33 @@ def calculate_bbox_area_km2(bbox: list[float]) -> float:
     return width_km * height_km
 
 
+def calculate_bbox_area_km2_batch(bboxes: np.ndarray) -> np.ndarray:
+    """
+    Calculate approximate areas of many bounding boxes in square kilometers.
+
+    Vectorized form of ``calculate_bbox_area_km2`` for arrays of bboxes.
+
+    Parameters
+    ----------
+    bboxes : np.ndarray
+        Array of shape (N, 4) with rows [west, south, east, north] in degrees
+
+    Returns
+    -------
+    np.ndarray
+        Approximate areas in km², shape (N,)
+    """
+    west, south, east, north = np.radians(np.asarray(bboxes, dtype=np.float64)).T
+
+    # Width at the center latitude (accounts for longitude compression)
+    width_km = EARTH_RADIUS_KM * np.abs(east - west) * np.cos((south + north) / 2)
+
+    # Height (constant regardless of longitude)
+    height_km = EARTH_RADIUS_KM * np.abs(north - south)
+
+    return width_km * height_km
+
+
 def get_default_time_range(days: int = 30) -> str:
     """
     Get ISO8601 time range for the last N days.
@@ -309,6 +502,26 @@ def get_default_time_range(days: int = 30) -> str:
     str
         ISO8601 time range like "2024-01-01/2024-01-31"
     """
-    end_date = datetime.now()
+    # Keyed on today's date, so the cached string rolls over exactly at midnight
+    return _time_range_ending(date.today(), days)
+
+
+@lru_cache(maxsize=64)
+def _time_range_ending(end_date: date, days: int) -> str:
+    """
+    Format the ISO8601 range of ``days`` days ending on ``end_date``.
+
+    Parameters
+    ----------
+    end_date : date
+        Last day of the range
+    days : int
+        Number of days to look back
+
+    Returns
+    -------
+    str
+        ISO8601 time range like "2024-01-01/2024-01-31"
+    """
     start_date = end_date - timedelta(days=days)
-    return f"{start_date.strftime('%Y-%m-%d')}/{end_date.strftime('%Y-%m-%d')}"
+    return f"{start_date.isoformat()}/{end_date.isoformat()}"
@@ -1,14 +1,86 @@
 """
 Raster utilities using odc-stac for COG loading and processing.
+
+GDAL-backed dependencies (rasterio, rioxarray, odc-stac, pyproj) are
+imported inside the functions that use them, keeping module import cheap.
 """
 
-from typing import Any
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-import rioxarray  # noqa: F401
+import numpy as np
 import xarray as xr
-from odc.stac import load
 from pystac import Item
 
+if TYPE_CHECKING:
+    from pyproj import Transformer
+
+# Concurrent COG reads per odc-stac load (I/O bound, so more than CPU count)
+LOAD_MAX_WORKERS = 16
+
+# Concurrent chunk reads per windowed COG download (each worker owns a handle)
+READ_MAX_WORKERS = 8
+
+# Target bytes per windowed read: whole runs of COG blocks are fetched per
+# request to amortize HTTP round-trips, bounding memory to workers x chunk
+READ_CHUNK_BYTES = 32 * 1024 * 1024
+
+# GDAL config for remote COG reads: skip sidecar directory listings on open,
+# merge adjacent tile range requests, and cache fetched bytes per handle.
+# Applied via rasterio.Env, which is thread-local, so read workers enter it too.
+COG_READ_ENV: dict[str, Any] = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
+    "GDAL_HTTP_MULTIPLEX": "YES",
+    "GDAL_INGESTED_BYTES_AT_OPEN": "32768",
+    "GDAL_BAND_BLOCK_CACHE": "HASHSET",
+    "GDAL_CACHEMAX": 512,  # MB
+    "VSI_CACHE": "TRUE",
+    "VSI_CACHE_SIZE": "536870912",
+}
+
+# GeoTIFF creation options for xarray-backed writes: 512px tiles compressed
+# on all cores, written window-by-window instead of as one striped block
+GEOTIFF_WRITE_OPTIONS: dict[str, Any] = {
+    "tiled": True,
+    "blockxsize": 512,
+    "blockysize": 512,
+    "compress": "deflate",
+    "num_threads": "all_cpus",
+    "BIGTIFF": "IF_SAFER",
+}
+
+# Cloud-Optimized GeoTIFF options for downloaded cutouts: 512px tiles with
+# averaged internal overviews so downstream decimated reads skip full-res bytes.
+# ZSTD (GDAL default level 9) with a dtype-appropriate predictor compresses
+# like LZW/DEFLATE at several times the throughput, across all cores.
+COG_WRITE_OPTIONS: dict[str, Any] = {
+    "compress": "zstd",
+    "predictor": "yes",
+    "blocksize": 512,
+    "overviews": "auto",
+    "overview_resampling": "average",
+    "bigtiff": "if_safer",
+    "num_threads": "all_cpus",
+}
+
+
+@lru_cache(maxsize=1)
+def _configure_load_env() -> None:
+    """
+    Apply the COG read config to odc-stac's reader threads (once per process).
+
+    odc-stac re-enters its own rasterio environment in every pool thread, so
+    a caller-side rasterio.Env would not reach them.
+    """
+    from odc.stac import configure_rio
+
+    configure_rio(cloud_defaults=True, **COG_READ_ENV)
+
 
 def load_raster_from_stac(
     items: list[Item],
@@ -16,10 +88,15 @@ def load_raster_from_stac(
     bands: list[str] | None = None,
     resolution: float | None = None,
     crs: str = "EPSG:4326",
+    chunks: dict[str, int] | None = None,
 ) -> xr.Dataset:
     """
     Load raster data from STAC items using odc-stac.
 
+    Scenes from the same solar day are mosaicked into one time slice and
+    COG reads are fetched concurrently by a thread pool using the same
+    multiplexed, range-merging GDAL HTTP settings as windowed downloads.
+
     Parameters
     ----------
     items : list[Item]
@@ -32,14 +109,21 @@ def load_raster_from_stac(
         Output resolution in CRS units
     crs : str, optional
         Output CRS (default EPSG:4326)
+    chunks : dict[str, int] or None, optional
+        Dask chunk sizes; when given the Dataset is returned lazily and
+        nothing is read until it is computed ({} uses odc-stac's defaults)
 
     Returns
     -------
     xr.Dataset
         Xarray Dataset with raster data
     """
+    from odc.stac import load
+
     load_kwargs: dict[str, Any] = {
         "crs": crs,
+        "groupby": "solar_day",
+        "pool": LOAD_MAX_WORKERS,
     }
 
     if bands:
@@ -55,10 +139,217 @@ def load_raster_from_stac(
     if bbox:
         load_kwargs["bbox"] = bbox
 
+    if chunks is not None:
+        load_kwargs["chunks"] = chunks
+
     # Load with odc-stac
+    _configure_load_env()
     return load(items, **load_kwargs)
 
 
+def clip_to_bbox(data: xr.Dataset, bbox: list[float]) -> xr.Dataset:
+    """
+    Clip georeferenced data to a lon/lat bounding box.
+
+    On lazy (dask or Zarr-backed) data the clip only restricts the graph, so
+    chunks outside the bbox are never read.
+
+    Parameters
+    ----------
+    data : xr.Dataset
+        Xarray Dataset, clipped only if it carries a CRS
+    bbox : list[float]
+        Bounding box [west, south, east, north] in EPSG:4326
+
+    Returns
+    -------
+    xr.Dataset
+        Dataset restricted to the pixels within bbox, or the input unchanged
+        if it has no CRS or no pixel centers fall within bbox
+    """
+    import rioxarray  # noqa: F401
+    from rioxarray.exceptions import NoDataInBounds
+
+    if data.rio.crs is None:
+        return data
+
+    try:
+        return data.rio.clip_box(*bbox, crs="EPSG:4326")
+    except NoDataInBounds:
+        # Slivers at a tile edge can hold no pixel centers; keep the full array
+        return data
+
+
+def _snap_window(window: Any, width: int, height: int) -> Any:
+    """
+    Snap a fractional window outward to whole pixels inside the dataset.
+
+    Parameters
+    ----------
+    window : rasterio.windows.Window
+        Window with possibly fractional offsets/lengths
+    width : int
+        Dataset width in pixels
+    height : int
+        Dataset height in pixels
+
+    Returns
+    -------
+    rasterio.windows.Window
+        Integer window clipped to the dataset extent
+    """
+    from rasterio.windows import Window  # type: ignore[import-not-found]
+
+    # Tolerance absorbs float error from bounds -> pixel conversion (199.9999 -> 200)
+    eps = 1e-6
+    col_start = max(0, math.floor(window.col_off + eps))
+    row_start = max(0, math.floor(window.row_off + eps))
+    col_stop = min(width, math.ceil(window.col_off + window.width - eps))
+    row_stop = min(height, math.ceil(window.row_off + window.height - eps))
+    return Window(col_start, row_start, max(0, col_stop - col_start), max(0, row_stop - row_start))
+
+
+def _copy_window_chunks(
+    src: Any,
+    href: str,
+    window: Any,
+    dst: Any,
+    open_kwargs: dict[str, Any] | None = None,
+    max_workers: int = READ_MAX_WORKERS,
+) -> None:
+    """
+    Stream a window chunk-by-chunk from a COG into an open destination.
+
+    The window is split into block-aligned chunks of about
+    ``READ_CHUNK_BYTES`` (whole block rows where possible, so each read pulls
+    many blocks in one multi-range request) and fetched concurrently. Each
+    worker thread opens its own dataset handle (rasterio handles are not
+    thread-safe) and writes its chunk straight into ``dst``, so peak memory
+    stays at one chunk per worker.
+
+    Parameters
+    ----------
+    src : rasterio.DatasetReader
+        Open dataset, used directly when the window fits in one chunk
+    href : str
+        Signed COG URL
+    window : rasterio.windows.Window
+        Integer window inside the dataset
+    dst : rasterio.io.DatasetWriter
+        Destination sized to the window
+    open_kwargs : dict[str, Any] or None, optional
+        Open options matching ``src`` (e.g. ``OVERVIEW_LEVEL``)
+    max_workers : int, optional
+        Maximum concurrent chunk reads
+    """
+    import rasterio  # type: ignore[import-not-found]
+    from rasterio.windows import Window  # type: ignore[import-not-found]
+
+    row0, col0 = int(window.row_off), int(window.col_off)
+    row1, col1 = row0 + int(window.height), col0 + int(window.width)
+    block_rows, block_cols = src.block_shapes[0]
+
+    # Chunk size in whole blocks: full block rows of the window when they fit
+    # the byte budget, otherwise a run of blocks along one block row
+    block_bytes = block_rows * block_cols * src.count * np.dtype(src.dtypes[0]).itemsize
+    blocks_per_chunk = max(1, READ_CHUNK_BYTES // block_bytes)
+    window_block_cols = (col1 - 1) // block_cols - col0 // block_cols + 1
+    if blocks_per_chunk >= window_block_cols:
+        chunk_rows = blocks_per_chunk // window_block_cols * block_rows
+        chunk_cols = window_block_cols * block_cols
+    else:
+        chunk_rows = block_rows
+        chunk_cols = blocks_per_chunk * block_cols
+
+    # Block-aligned sub-windows covering the read window
+    tiles = [
+        (
+            r,
+            min(r - r % block_rows + chunk_rows, row1),
+            c,
+            min(c - c % block_cols + chunk_cols, col1),
+        )
+        for r in [row0, *range(row0 - row0 % block_rows + chunk_rows, row1, chunk_rows)]
+        for c in [col0, *range(col0 - col0 % block_cols + chunk_cols, col1, chunk_cols)]
+    ]
+
+    if len(tiles) == 1:
+        dst.write(src.read(window=window))
+        return
+
+    local = threading.local()
+    handles: list[Any] = []
+    write_lock = threading.Lock()
+    chunk_size = src.count * chunk_rows * chunk_cols
+
+    def copy_tile(tile: tuple[int, int, int, int]) -> None:
+        r_start, r_stop, c_start, c_stop = tile
+        with rasterio.Env(**COG_READ_ENV):
+            ds = getattr(local, "ds", None)
+            if ds is None:
+                ds = local.ds = rasterio.open(href, **(open_kwargs or {}))
+                local.buffer = np.empty(chunk_size, dtype=src.dtypes[0])
+                handles.append(ds)
+            # Read into a contiguous view of the worker's reused buffer; the
+            # write below copies it out before the next read overwrites it
+            shape = (src.count, r_stop - r_start, c_stop - c_start)
+            chunk = local.buffer[: math.prod(shape)].reshape(shape)
+            ds.read(window=Window(c_start, r_start, c_stop - c_start, r_stop - r_start), out=chunk)
+        with write_lock:
+            dst.write(
+                chunk,
+                window=Window(c_start - col0, r_start - row0, c_stop - c_start, r_stop - r_start),
+            )
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tiles))) as pool:
+            list(pool.map(copy_tile, tiles))
+    finally:
+        for ds in handles:
+            ds.close()
+
+
+@lru_cache(maxsize=64)
+def _get_wgs84_transformer(dst_crs: str) -> "Transformer":
+    """
+    Get a cached EPSG:4326 -> ``dst_crs`` transformer.
+
+    Parameters
+    ----------
+    dst_crs : str
+        Target CRS as WKT
+
+    Returns
+    -------
+    Transformer
+        Transformer with (x, y) = (lon, lat) axis order
+    """
+    from pyproj import Transformer
+
+    return Transformer.from_crs("EPSG:4326", dst_crs, always_xy=True)
+
+
+def _find_overview_index(src: Any, overview_level: int) -> int | None:
+    """
+    Find the internal overview matching a decimation factor.
+
+    Parameters
+    ----------
+    src : rasterio.DatasetReader
+        Open full-resolution dataset
+    overview_level : int
+        Decimation factor (2, 4, 8, etc.)
+
+    Returns
+    -------
+    int or None
+        Index for the ``OVERVIEW_LEVEL`` open option, or None if the COG has
+        no overview at that factor
+    """
+    factors = src.overviews(1)
+    return factors.index(overview_level) if overview_level in factors else None
+
+
 def download_multiband_to_geotiff(
     items: list[Item],
     asset_name: str,
@@ -66,12 +357,15 @@ def download_multiband_to_geotiff(
     bbox: list[float] | None = None,
     band_names: list[str] | None = None,
     overview_level: int | None = None,
+    interleave: str | None = None,
+    compress: str = "zstd",
 ) -> dict[str, Any]:
     """
-    Download a multi-band asset directly to GeoTIFF using rasterio windowed reads.
+    Download a multi-band asset directly to a Cloud-Optimized GeoTIFF.
 
     Bypasses xarray entirely for maximum performance. Uses rasterio's windowed
-    reading to only download pixels within the bbox, then writes directly to disk.
+    reading to only download pixels within the bbox, streaming each chunk
+    straight into the output file instead of buffering the whole cutout.
 
     Parameters
     ----------
@@ -88,6 +382,16 @@ def download_multiband_to_geotiff(
     overview_level : int or None, optional
         COG overview level to use (2, 4, 8, etc.). None = native resolution.
         Use overview_level=4 for ~4x faster downloads at reduced resolution.
+        When the COG stores an overview at that factor its IFD is read directly,
+        so only 1/N^2 of the full-resolution bytes are fetched.
+    interleave : str or None, optional
+        Output interleaving, 'pixel' or 'band'. None = 'band' for more than
+        three bands, so single-band readers (e.g. NDVI) only fetch that band's
+        tiles, else 'pixel' for RGB viewers. Band interleaving in COGs needs
+        GDAL >= 3.11; older versions write pixel-interleaved.
+    compress : str, optional
+        Output compression (default 'zstd'). Use 'lzw' or 'deflate' for
+        readers built without ZSTD support.
 
     Returns
     -------
@@ -95,10 +399,10 @@ def download_multiband_to_geotiff(
         Metadata dict with crs, bounds, shape, dtype, bands
     """
     import rasterio  # type: ignore[import-not-found]
+    import rasterio.shutil  # type: ignore[import-not-found]
     from affine import Affine  # type: ignore[import-not-found]
-    from rasterio.crs import CRS  # type: ignore[import-not-found]
-    from rasterio.warp import transform_bounds  # type: ignore[import-not-found]
-    from rasterio.windows import from_bounds  # type: ignore[import-not-found]
+    from rasterio.transform import array_bounds  # type: ignore[import-not-found]
+    from rasterio.windows import Window, from_bounds  # type: ignore[import-not-found]
 
     if not items:
         raise ValueError("No items provided")
@@ -109,106 +413,116 @@ def download_multiband_to_geotiff(
 
     href = item.assets[asset_name].href
 
-    with rasterio.open(href) as src:
-        native_crs = src.crs
-        num_bands = src.count
-        dtype = src.dtypes[0]
-
-        if bbox:
-            # Transform bbox from WGS84 to native CRS
-            west, south, east, north = bbox
-            if native_crs and str(native_crs) != "EPSG:4326":
-                native_bounds = transform_bounds(
-                    CRS.from_epsg(4326),
-                    native_crs,
-                    west,
-                    south,
-                    east,
-                    north,
+    with rasterio.Env(**COG_READ_ENV):
+        # Open the matching overview IFD directly so only its tiles are fetched
+        open_kwargs: dict[str, Any] = {}
+        if overview_level and overview_level > 1:
+            with rasterio.open(href) as src:
+                index = _find_overview_index(src, overview_level)
+            if index is not None:
+                open_kwargs["OVERVIEW_LEVEL"] = index
+
+        # No stored overview at this factor: let GDAL decimate on read
+        decimation = overview_level if overview_level and not open_kwargs else 1
+
+        with rasterio.open(href, **open_kwargs) as src:
+            native_crs = src.crs
+            num_bands = src.count
+            dtype = src.dtypes[0]
+
+            if bbox:
+                # Transform bbox from WGS84 to native CRS
+                west, south, east, north = bbox
+                if native_crs and str(native_crs) != "EPSG:4326":
+                    native_bounds = _get_wgs84_transformer(native_crs.to_wkt()).transform_bounds(
+                        west, south, east, north
+                    )
+                else:
+                    native_bounds = (west, south, east, north)
+
+                # Create window from bounds
+                window = from_bounds(
+                    native_bounds[0],
+                    native_bounds[1],
+                    native_bounds[2],
+                    native_bounds[3],
+                    transform=src.transform,
                 )
             else:
-                native_bounds = (west, south, east, north)
-
-            # Create window from bounds
-            window = from_bounds(
-                native_bounds[0],
-                native_bounds[1],
-                native_bounds[2],
-                native_bounds[3],
-                transform=src.transform,
-            )
-
-            full_width = int(window.width)
-            full_height = int(window.height)
-
-            # If using overview level, read at reduced resolution
-            if overview_level and overview_level > 1:
-                out_width = max(1, full_width // overview_level)
-                out_height = max(1, full_height // overview_level)
-                out_shape = (num_bands, out_height, out_width)
-                data = src.read(window=window, out_shape=out_shape)
-
-                # Adjust transform for reduced resolution
+                window = Window(0, 0, src.width, src.height)
+
+            # Clip to whole pixels inside the dataset so no read is boundless
+            # (zero-filled) and blocks tile the window exactly
+            window = _snap_window(window, src.width, src.height)
+            if window.width == 0 or window.height == 0:
+                raise ValueError(f"Bbox {bbox} does not intersect asset '{asset_name}'")
+
+            data = None
+            if decimation > 1:
+                # Output is already 1/N^2 of the window, so read it in one call
+                width = max(1, int(window.width) // decimation)
+                height = max(1, int(window.height) // decimation)
+                data = src.read(window=window, out_shape=(num_bands, height, width))
+                # Scale the pixel size only; the window origin stays put
                 window_transform = src.window_transform(window)
-                scaled_transform = Affine(
-                    window_transform.a * overview_level,
+                window_transform = Affine(
+                    window_transform.a * decimation,
                     window_transform.b,
                     window_transform.c,
                     window_transform.d,
-                    window_transform.e * overview_level,
+                    window_transform.e * decimation,
                     window_transform.f,
                 )
-                window_transform = scaled_transform
             else:
-                data = src.read(window=window)
+                width, height = int(window.width), int(window.height)
                 window_transform = src.window_transform(window)
 
-            bounds = native_bounds
-        else:
-            if overview_level and overview_level > 1:
-                out_width = max(1, src.width // overview_level)
-                out_height = max(1, src.height // overview_level)
-                out_shape = (num_bands, out_height, out_width)
-                data = src.read(out_shape=out_shape)
-
-                window_transform = Affine(
-                    src.transform.a * overview_level,
-                    src.transform.b,
-                    src.transform.c,
-                    src.transform.d,
-                    src.transform.e * overview_level,
-                    src.transform.f,
+            # Extent actually written: the snapped window, not the requested bbox
+            bounds = array_bounds(height, width, window_transform)
+
+            profile = {
+                "driver": "GTiff",
+                "dtype": dtype,
+                "width": width,
+                "height": height,
+                "count": num_bands,
+                "crs": native_crs,
+                "transform": window_transform,
+                "nodata": src.nodata,
+                "tiled": True,
+                "blockxsize": 512,
+                "blockysize": 512,
+                "BIGTIFF": "IF_SAFER",
+            }
+
+            # The COG driver is copy-only, so stream chunks into an
+            # uncompressed staging GTiff first, then copy it out as a COG
+            staging_path = f"{output_path}.staging.tif"
+            try:
+                with rasterio.open(staging_path, "w", **profile) as dst:
+                    if data is None:
+                        _copy_window_chunks(src, href, window, dst, open_kwargs)
+                    else:
+                        dst.write(data)
+
+                    # Write band descriptions if provided (one per band required)
+                    if band_names:
+                        names = band_names[:num_bands]
+                        dst.descriptions = (*names, *[None] * (num_bands - len(names)))
+
+                rasterio.shutil.copy(
+                    staging_path,
+                    output_path,
+                    driver="COG",
+                    **{
+                        **COG_WRITE_OPTIONS,
+                        "compress": compress,
+                        "interleave": interleave or ("band" if num_bands > 3 else "pixel"),
+                    },
                 )
-            else:
-                data = src.read()
-                window_transform = src.transform
-
-            bounds = src.bounds
-
-        height, width = data.shape[1], data.shape[2]
-
-        # Write directly to GeoTIFF
-        profile = {
-            "driver": "GTiff",
-            "dtype": dtype,
-            "width": width,
-            "height": height,
-            "count": num_bands,
-            "crs": native_crs,
-            "transform": window_transform,
-            "compress": "lzw",
-            "tiled": True,
-            "blockxsize": 256,
-            "blockysize": 256,
-        }
-
-        with rasterio.open(output_path, "w", **profile) as dst:
-            dst.write(data)
-
-            # Write band descriptions if provided
-            if band_names:
-                for i, name in enumerate(band_names[:num_bands], start=1):
-                    dst.set_band_description(i, name)
+            finally:
+                if os.path.exists(staging_path):
+                    os.remove(staging_path)
 
     # Return metadata
     names = (
@@ -250,6 +564,8 @@ def save_raster_as_geotiff(
     str
         Path to saved file
     """
+    import rioxarray  # noqa: F401  # registers the .rio accessor
+
     # Handle temporal data - take the most recent if multiple time slices
     if "time" in data.sizes and data.sizes["time"] > 1:
         # Take the last (most recent) time slice
@@ -277,16 +593,72 @@ def save_raster_as_geotiff(
     if nodata is not None:
         data_array = data_array.rio.write_nodata(nodata)
 
-    # Save as GeoTIFF
-    data_array.rio.to_raster(output_path)
+    if data_array.chunks is not None:
+        # Dask-backed (e.g. lazy odc-stac loads): compute chunks in parallel
+        # and serialize only the writes through the lock
+        data_array.rio.to_raster(output_path, lock=threading.Lock(), **GEOTIFF_WRITE_OPTIONS)
+    else:
+        # Save as tiled GeoTIFF, streaming one block window at a time
+        data_array.rio.to_raster(output_path, windowed=True, **GEOTIFF_WRITE_OPTIONS)
 
     return output_path
 
 
+@lru_cache(maxsize=64)
+def _crs_name(wkt: str) -> str:
+    """
+    Format a CRS WKT the way rioxarray's ``rio.crs`` would print it.
+
+    Cached because parsing WKT through PROJ dominates small metadata calls.
+
+    Parameters
+    ----------
+    wkt : str
+        CRS as WKT
+
+    Returns
+    -------
+    str
+        'EPSG:<code>' when identifiable, else the WKT
+    """
+    from rasterio.crs import CRS  # type: ignore[import-not-found]
+
+    return str(CRS.from_wkt(wkt))
+
+
+def _grid_from_coords(data_array: xr.DataArray) -> tuple[float, float, float, float] | None:
+    """
+    Get (left, top, x_res, y_res) from regularly spaced 1D x/y coordinates.
+
+    Parameters
+    ----------
+    data_array : xr.DataArray
+        Raster DataArray
+
+    Returns
+    -------
+    tuple[float, float, float, float] or None
+        Grid origin and resolution, or None if x/y are missing or too short
+    """
+    x = data_array.coords.get("x")
+    y = data_array.coords.get("y")
+    if x is None or y is None or x.ndim != 1 or y.ndim != 1 or x.size < 2 or y.size < 2:
+        return None
+
+    x_values, y_values = x.values, y.values
+    x_res = float(x_values[1] - x_values[0])
+    y_res = float(y_values[1] - y_values[0])
+    return float(x_values[0]) - x_res / 2, float(y_values[0]) - y_res / 2, x_res, y_res
+
+
 def get_raster_metadata(data: xr.Dataset) -> dict[str, Any]:
     """
     Extract metadata from raster Dataset.
 
+    Only reads coordinate metadata, so it never loads dask-backed pixel data.
+    Grid and CRS are read straight from the x/y coordinates and grid mapping
+    attributes, falling back to the rioxarray accessor when those are absent.
+
     Parameters
     ----------
     data : xr.Dataset
@@ -297,6 +669,8 @@ def get_raster_metadata(data: xr.Dataset) -> dict[str, Any]:
     dict[str, Any]
         Dictionary with metadata
     """
+    import rioxarray  # noqa: F401  # registers the .rio accessor
+
     # Use the first variable for metadata
     if isinstance(data, xr.Dataset) and len(data.data_vars) > 0:
         sample_var = next(iter(data.data_vars.keys()))
@@ -304,12 +678,35 @@ def get_raster_metadata(data: xr.Dataset) -> dict[str, Any]:
     else:
         data_array = data
 
+    # CRS WKT lives on the grid mapping coordinate (odc-stac/rioxarray layout)
+    grid_mapping = data_array.encoding.get("grid_mapping") or data_array.attrs.get(
+        "grid_mapping", "spatial_ref"
+    )
+    crs_attrs = data_array.coords[grid_mapping].attrs if grid_mapping in data_array.coords else {}
+    wkt = crs_attrs.get("crs_wkt") or crs_attrs.get("spatial_ref")
+    if wkt:
+        crs = _crs_name(wkt)
+    else:
+        rio_crs = data_array.rio.crs
+        crs = str(rio_crs) if rio_crs else None
+
+    grid = _grid_from_coords(data_array)
+    if grid is None:
+        # Irregular or unnamed dims: let rioxarray work out the transform
+        rio = data_array.rio
+        transform = rio.transform()
+        left, top, x_res, y_res = transform.c, transform.f, transform.a, transform.e
+        width, height = rio.width, rio.height
+    else:
+        left, top, x_res, y_res = grid
+        width, height = data_array.sizes["x"], data_array.sizes["y"]
+    right = left + x_res * width
+    bottom = top + y_res * height
+
     return {
-        "crs": str(data_array.rio.crs)
-        if hasattr(data_array, "rio") and data_array.rio.crs
-        else None,
-        "bounds": data_array.rio.bounds() if hasattr(data_array, "rio") else None,
-        "resolution": data_array.rio.resolution() if hasattr(data_array, "rio") else None,
+        "crs": crs,
+        "bounds": (min(left, right), min(bottom, top), max(left, right), max(bottom, top)),
+        "resolution": (x_res, y_res),
         "shape": data_array.shape,
         "dtype": str(data_array.dtype),
         "bands": list(data.data_vars)
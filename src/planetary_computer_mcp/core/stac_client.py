@@ -2,9 +2,108 @@
 STAC client wrapper for Planetary Computer.
 """
 
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from pathlib import Path
+
 import planetary_computer as pc
 from pystac import Item
 from pystac_client import Client
+from pystac_client.stac_api_io import StacApiIO
+from requests.adapters import HTTPAdapter
+
+from planetary_computer_mcp.core.cache import CACHE_DIR
+
+# Search results are cached unsigned and re-signed on each hit, so the TTL
+# only bounds how stale the item list can get (new scenes being ingested)
+SEARCH_CACHE_TTL_SECONDS = 10 * 60  # 10 minutes
+SEARCH_CACHE_DIR = CACHE_DIR / "stac_search"
+
+# Keep-alive connections to the STAC API; tools run in worker threads, so
+# concurrent searches share one session instead of dropping pooled sockets
+STAC_POOL_MAXSIZE = 32
+STAC_MAX_RETRIES = 5
+
+# Concurrent collection metadata requests (bounded by the connection pool)
+COLLECTION_INFO_MAX_WORKERS = 8
+
+
+def _search_cache_path(params: dict) -> Path:
+    """
+    Get the cache file path for a set of search parameters.
+
+    Parameters
+    ----------
+    params : dict
+        JSON-serializable search parameters
+
+    Returns
+    -------
+    Path
+        Path to the cache JSON file for these parameters
+    """
+    key = hashlib.blake2b(
+        json.dumps(params, sort_keys=True).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return SEARCH_CACHE_DIR / f"{key}.json"
+
+
+def _load_cached_search(cache_path: Path) -> list[dict] | None:
+    """
+    Load cached search results if present and not expired.
+
+    Parameters
+    ----------
+    cache_path : Path
+        Path to the cache JSON file
+
+    Returns
+    -------
+    list[dict] or None
+        Unsigned item dictionaries, or None on a cache miss
+    """
+    try:
+        if time.time() - cache_path.stat().st_mtime >= SEARCH_CACHE_TTL_SECONDS:
+            return None
+        with open(cache_path) as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        # Missing, corrupted or unreadable cache entry
+        return None
+
+
+def _save_cached_search(cache_path: Path, item_dicts: list[dict]) -> None:
+    """
+    Save search results to the cache.
+
+    Written to a temporary file and renamed into place, so concurrent
+    readers never see a partially written cache file.
+
+    Parameters
+    ----------
+    cache_path : Path
+        Path to the cache JSON file
+    item_dicts : list[dict]
+        Unsigned item dictionaries to save
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(item_dicts, f)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # Silently fail on cache write errors
+        pass
 
 
 class PlanetaryComputerSTAC:
@@ -12,7 +111,23 @@ class PlanetaryComputerSTAC:
 
     def __init__(self) -> None:
         self.catalog_url = "https://planetarycomputer.microsoft.com/api/stac/v1"
-        self.client = Client.open(self.catalog_url)
+
+    @cached_property
+    def client(self) -> Client:
+        """
+        Open the STAC API client on first use.
+
+        Deferred so importing the module does not fetch the root catalog.
+
+        Returns
+        -------
+        Client
+            pystac-client Client backed by a pooled HTTP session
+        """
+        stac_io = StacApiIO(max_retries=STAC_MAX_RETRIES)
+        adapter = HTTPAdapter(pool_maxsize=STAC_POOL_MAXSIZE, max_retries=STAC_MAX_RETRIES)
+        stac_io.session.mount("https://", adapter)
+        return Client.open(self.catalog_url, stac_io=stac_io)
 
     def search_items(
         self,
@@ -22,10 +137,14 @@ class PlanetaryComputerSTAC:
         max_cloud_cover: int | None = None,
         limit: int | None = None,
         sortby: str | None = "-datetime",
+        use_cache: bool = True,
     ) -> list[Item]:
         """
         Search for STAC items.
 
+        Results are cached on disk for 10 minutes so repeated requests for the
+        same area and time skip the STAC API round-trip.
+
         Parameters
         ----------
         collections : list[str]
@@ -41,6 +160,8 @@ class PlanetaryComputerSTAC:
         sortby : str or None, optional
             Sort order. Default "-datetime" for most recent first.
             Use "+datetime" for oldest first, or None for no sorting.
+        use_cache : bool, optional
+            Whether to use the search cache. Default True.
 
         Returns
         -------
@@ -51,17 +172,41 @@ class PlanetaryComputerSTAC:
         if max_cloud_cover is not None:
             query_params["eo:cloud_cover"] = {"lt": max_cloud_cover}
 
-        search = self.client.search(
-            collections=collections,
-            bbox=bbox,
-            datetime=datetime,
-            query=query_params if query_params else None,
-            limit=limit,
-            sortby=sortby,
-        )
+        search_params = {
+            "collections": collections,
+            "bbox": bbox,
+            "datetime": datetime,
+            "query": query_params or None,
+            # limit is only the page size; max_items caps the total returned
+            "limit": limit,
+            "max_items": limit,
+            "sortby": sortby,
+        }
+
+        # Try cache first
+        cache_path = _search_cache_path(search_params)
+        if use_cache:
+            cached = _load_cached_search(cache_path)
+            if cached is not None:
+                return [pc.sign_inplace(Item.from_dict(d, preserve_dict=False)) for d in cached]
+
+        search = self.client.search(**search_params)
+
+        # Sign each item as its page arrives, serializing it first so the cache
+        # stays unsigned. SAS tokens are cached per storage container, so after
+        # the first item signing is local; sign in place to skip cloning.
+        item_dicts: list[dict] = []
+        items: list[Item] = []
+        for item in search.items():
+            if use_cache:
+                item_dicts.append(item.to_dict())
+            items.append(pc.sign_inplace(item))
 
-        items = list(search.items())
-        return [pc.sign(item) for item in items]
+        # Only cache non-empty results so newly ingested scenes show up on retry
+        if item_dicts:
+            _save_cached_search(cache_path, item_dicts)
+
+        return items
 
     def get_collection_info(self, collection_id: str) -> dict:
         """
@@ -91,6 +236,30 @@ class PlanetaryComputerSTAC:
             },
         }
 
+    def get_collections_info(self, collection_ids: list[str]) -> list[dict]:
+        """
+        Get basic info about several collections concurrently.
+
+        Each collection is a separate STAC API request; they are issued in
+        parallel over the shared session so N round-trips overlap.
+
+        Parameters
+        ----------
+        collection_ids : list[str]
+            Collection IDs
+
+        Returns
+        -------
+        list[dict]
+            Collection metadata dictionaries, in the order of ``collection_ids``
+        """
+        if len(collection_ids) <= 1:
+            return [self.get_collection_info(cid) for cid in collection_ids]
+
+        workers = min(COLLECTION_INFO_MAX_WORKERS, len(collection_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get_collection_info, collection_ids))
+
 
 # Global instance
 stac_client = PlanetaryComputerSTAC()
@@ -2,21 +2,94 @@
 Vector utilities for GeoParquet processing.
 """
 
+import hashlib
+import json
+import math
+import os
+import tempfile
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import adlfs
 import geopandas as gpd
 import mercantile
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
+import shapely
 from pystac import Item
 from shapely import Polygon
 from shapely.geometry import box
 
-# Max parallel downloads for Azure blob storage
-MAX_PARALLEL_DOWNLOADS = 8
+from planetary_computer_mcp.core.cache import CACHE_DIR, _LRUCache
+
+# Max parallel parquet reads from Azure blob storage. adlfs dispatches every
+# sync call onto fsspec's single async IO loop, so worker threads only bound
+# how many range requests are in flight; keep enough to hide blob latency.
+MAX_PARALLEL_DOWNLOADS = 32
+
+# GeoParquet write settings (ZSTD shrinks WKB payloads well beyond the snappy default)
+PARQUET_COMPRESSION = "zstd"
+PARQUET_ROW_GROUP_SIZE = 100_000
+
+# Above this many quadkeys, one recursive listing of the region partition is
+# cheaper than a LIST call per quadkey
+QUADKEY_FIND_THRESHOLD = 64
+
+# Rows per thread when parsing the combined WKB column; GEOS releases the GIL,
+# so large results parse in parallel while small ones stay on one thread
+WKB_PARSE_CHUNK_ROWS = 50_000
+
+# Parquet files per quadkey partition, persisted per region so repeat queries
+# skip the LIST calls; partitions are static between dataset releases
+QUADKEY_INDEX_TTL_SECONDS = 7 * 24 * 60 * 60  # 7 days
+QUADKEY_INDEX_DIR = CACHE_DIR / "quadkey_index"
+
+# Native GeoArrow geometry encoding (columnar coordinates, no per-row WKB);
+# only single-type geometry columns are supported, mixed types fall back to WKB
+PARQUET_GEOMETRY_ENCODING = "geoarrow"
+
+# GeoParquet 1.1 bbox covering column (struct of xmin/ymin/xmax/ymax)
+BBOX_COLUMN = "bbox"
+BBOX_FIELDS = ("xmin", "ymin", "xmax", "ymax")
+
+# shapely.get_type_id codes -> GeoPandas geometry type names
+GEOMETRY_TYPE_NAMES = {
+    0: "Point",
+    1: "LineString",
+    2: "LinearRing",
+    3: "Polygon",
+    4: "MultiPoint",
+    5: "MultiLineString",
+    6: "MultiPolygon",
+    7: "GeometryCollection",
+}
+
+# GeoParquet geometry encodings with native GeoArrow layouts -> shapely types
+GEOARROW_GEOMETRY_TYPES = {
+    "point": shapely.GeometryType.POINT,
+    "linestring": shapely.GeometryType.LINESTRING,
+    "polygon": shapely.GeometryType.POLYGON,
+    "multipoint": shapely.GeometryType.MULTIPOINT,
+    "multilinestring": shapely.GeometryType.MULTILINESTRING,
+    "multipolygon": shapely.GeometryType.MULTIPOLYGON,
+}
+
+# Entries kept in each in-process metadata cache below; a long-running server
+# touches ever more hrefs, so the least recently used ones are evicted
+METADATA_CACHE_MAX_ENTRIES = 1024
+
+
+# Item data asset href -> files under it; assets are immutable once published
+_ITEM_PARTS_CACHE = _LRUCache(METADATA_CACHE_MAX_ENTRIES)
+
+# Parquet path -> (has bbox covering column, file-level geometry bounds,
+# geometry encoding, column names), probed once per file from the footer
+_PARQUET_INFO_CACHE = _LRUCache(METADATA_CACHE_MAX_ENTRIES)
 
 
 def get_quadkeys_for_bbox(bbox: list[float], level: int = 9) -> list[str]:
@@ -24,6 +97,7 @@ def get_quadkeys_for_bbox(bbox: list[float], level: int = 9) -> list[str]:
     Get all quadkeys at given level that intersect bbox.
 
     Uses mercantile for efficient tile enumeration instead of grid sampling.
+    Results are cached, since callers repeat the same geocoded bboxes.
 
     Parameters
     ----------
@@ -38,9 +112,485 @@ def get_quadkeys_for_bbox(bbox: list[float], level: int = 9) -> list[str]:
         List of quadkey strings (preserves leading zeros)
     """
     west, south, east, north = bbox
-    return [
+    return list(_quadkeys_for_bounds(west, south, east, north, level))
+
+
+@lru_cache(maxsize=1024)
+def _quadkeys_for_bounds(
+    west: float, south: float, east: float, north: float, level: int
+) -> tuple[str, ...]:
+    """
+    Enumerate the quadkeys at a level that intersect bounds.
+
+    Parameters
+    ----------
+    west, south, east, north : float
+        Bounds in degrees
+    level : int
+        Quadkey level
+
+    Returns
+    -------
+    tuple[str, ...]
+        Quadkey strings
+    """
+    return tuple(
         mercantile.quadkey(tile) for tile in mercantile.tiles(west, south, east, north, zooms=level)
-    ]
+    )
+
+
+@lru_cache(maxsize=4096)
+def _tile_box(quadkey: str) -> Polygon:
+    """
+    Get the bounds of a quadkey tile as a polygon.
+
+    Parameters
+    ----------
+    quadkey : str
+        Quadkey string
+
+    Returns
+    -------
+    Polygon
+        Tile bounds in degrees
+    """
+    bounds = mercantile.bounds(mercantile.quadkey_to_tile(quadkey))
+    return box(bounds.west, bounds.south, bounds.east, bounds.north)
+
+
+@lru_cache(maxsize=8)
+def _get_filesystem(account_name: str, sas_token: str) -> adlfs.AzureBlobFileSystem:
+    """
+    Get a shared Azure filesystem for a storage account and SAS token.
+
+    Reusing the instance keeps its keep-alive connections across queries.
+    fsspec's own instance cache is bypassed because it is unbounded and SAS
+    tokens rotate, which would keep a filesystem alive per expired token.
+
+    Parameters
+    ----------
+    account_name : str
+        Storage account name
+    sas_token : str
+        SAS token for the container
+
+    Returns
+    -------
+    adlfs.AzureBlobFileSystem
+        Filesystem instance
+    """
+    return adlfs.AzureBlobFileSystem(
+        account_name=account_name,
+        sas_token=sas_token,
+        skip_instance_cache=True,
+    )
+
+
+def _quadkey_index_path(base_path: str) -> Path:
+    """
+    Get the cache file path for a region's quadkey partition index.
+
+    Parameters
+    ----------
+    base_path : str
+        Region partition path without protocol prefix
+
+    Returns
+    -------
+    Path
+        Path to the index JSON file
+    """
+    key = hashlib.blake2b(base_path.rstrip("/").encode("utf-8"), digest_size=16).hexdigest()
+    return QUADKEY_INDEX_DIR / f"{key}.json"
+
+
+def _load_quadkey_index(base_path: str) -> dict[str, Any]:
+    """
+    Load a region's cached quadkey partition index, dropping expired entries.
+
+    Every listing in the index carries the time it was made, so entries
+    expire ``QUADKEY_INDEX_TTL_SECONDS`` after they were listed even while
+    the file keeps being rewritten with newer ones.
+
+    Parameters
+    ----------
+    base_path : str
+        Region partition path without protocol prefix
+
+    Returns
+    -------
+    dict[str, Any]
+        ``{"populated": {"listed_at": ..., "quadkeys": [quadkeys with a
+        partition]} or None, "partitions": {quadkey: {"listed_at": ...,
+        "paths": [parquet file paths]}}}``; empty on a cache miss
+    """
+    try:
+        with open(_quadkey_index_path(base_path)) as f:
+            index = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        # Missing, corrupted or unreadable index
+        return {}
+    if not isinstance(index, dict) or set(index) != {"populated", "partitions"}:
+        # Written in an older layout
+        return {}
+
+    expired_before = time.time() - QUADKEY_INDEX_TTL_SECONDS
+    populated = index["populated"]
+    if populated is not None and populated["listed_at"] < expired_before:
+        populated = None
+    partitions = {
+        qk: entry
+        for qk, entry in index["partitions"].items()
+        if entry["listed_at"] >= expired_before
+    }
+    return {"populated": populated, "partitions": partitions}
+
+
+def _save_quadkey_index(base_path: str, index: dict[str, Any]) -> None:
+    """
+    Save a region's quadkey partition index.
+
+    Written to a temporary file and renamed into place, so concurrent tool
+    threads never read a partially written index.
+
+    Parameters
+    ----------
+    base_path : str
+        Region partition path without protocol prefix
+    index : dict[str, Any]
+        Index in the layout returned by ``_load_quadkey_index``
+    """
+    index_path = _quadkey_index_path(base_path)
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=index_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, index_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # Silently fail on cache write errors
+        pass
+
+
+def _list_populated_quadkeys(fs: adlfs.AzureBlobFileSystem, base_path: str) -> list[str] | None:
+    """
+    List the quadkeys that have a partition under a region path.
+
+    One non-recursive listing of the region returns every ``quadkey=``
+    directory, so empty tiles (e.g. open water) need no LIST call of their own.
+
+    Parameters
+    ----------
+    fs : adlfs.AzureBlobFileSystem
+        Filesystem to list with
+    base_path : str
+        Region partition path without protocol prefix
+
+    Returns
+    -------
+    list[str] or None
+        Populated quadkeys, or None if the region could not be listed or
+        has no partitions (too suspicious to record every quadkey as empty)
+    """
+    try:
+        entries = fs.ls(base_path, detail=False)
+    except FileNotFoundError:
+        return None
+    names = (entry.rstrip("/").rsplit("/", 1)[-1] for entry in entries)
+    populated = [name.removeprefix("quadkey=") for name in names if name.startswith("quadkey=")]
+    return populated or None
+
+
+def _list_quadkey_partitions(
+    fs: adlfs.AzureBlobFileSystem, base_path: str, quadkeys: list[str]
+) -> dict[str, list[str]]:
+    """
+    List parquet files in the quadkey partitions under a region path.
+
+    A few partitions are listed concurrently; for many, one recursive listing
+    of the region is filtered to the wanted partitions instead.
+
+    Parameters
+    ----------
+    fs : adlfs.AzureBlobFileSystem
+        Filesystem to list with
+    base_path : str
+        Region partition path without protocol prefix
+    quadkeys : list[str]
+        Quadkeys whose partitions to list
+
+    Returns
+    -------
+    dict[str, list[str]]
+        Quadkey -> parquet file paths (without protocol prefix); missing
+        partitions map to an empty list
+    """
+    if len(quadkeys) > QUADKEY_FIND_THRESHOLD:
+        partitions: dict[str, list[str]] = {qk: [] for qk in quadkeys}
+        prefix_len = len(base_path.rstrip("/")) + 1
+        for path in fs.find(base_path):
+            partition = path[prefix_len:].split("/", 1)[0]
+            qk = partition.removeprefix("quadkey=")
+            if path.endswith(".parquet") and partition != qk and qk in partitions:
+                partitions[qk].append(path)
+        return partitions
+
+    def list_partition(qk: str) -> list[str]:
+        try:
+            parts = fs.ls(f"{base_path}/quadkey={qk}", detail=False)
+        except FileNotFoundError:
+            # Quadkey partition may not exist (sparse data)
+            return []
+        return [path for path in parts if path.endswith(".parquet")]
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_DOWNLOADS, len(quadkeys))) as executor:
+        return dict(zip(quadkeys, executor.map(list_partition, quadkeys), strict=True))
+
+
+def _list_quadkey_parquet_files(
+    fs: adlfs.AzureBlobFileSystem, base_path: str, quadkeys: list[str]
+) -> dict[str, list[str]]:
+    """
+    List parquet files in the quadkey partitions under a region path.
+
+    Partition listings are kept in an on-disk index per region, so only
+    quadkeys not listed within ``QUADKEY_INDEX_TTL_SECONDS`` are listed, and
+    of those only the ones the region actually has a partition for.
+
+    Parameters
+    ----------
+    fs : adlfs.AzureBlobFileSystem
+        Filesystem to list with
+    base_path : str
+        Region partition path without protocol prefix
+    quadkeys : list[str]
+        Quadkeys whose partitions to list
+
+    Returns
+    -------
+    dict[str, list[str]]
+        Quadkey -> parquet file paths (without protocol prefix)
+    """
+    index = _load_quadkey_index(base_path) or {"populated": None, "partitions": {}}
+    partitions: dict[str, dict[str, Any]] = index["partitions"]
+    missing = [qk for qk in quadkeys if qk not in partitions]
+    if not missing:
+        return {qk: partitions[qk]["paths"] for qk in quadkeys}
+
+    listed_at = time.time()
+    if index["populated"] is None:
+        populated_quadkeys = _list_populated_quadkeys(fs, base_path)
+        if populated_quadkeys is None:
+            # Region listing failed or came back empty: list the quadkeys
+            # directly and persist nothing
+            listed = _list_quadkey_partitions(fs, base_path, missing)
+            return {qk: listed[qk] if qk in listed else partitions[qk]["paths"] for qk in quadkeys}
+        index["populated"] = {"listed_at": listed_at, "quadkeys": populated_quadkeys}
+
+    populated = set(index["populated"]["quadkeys"])
+    listed = {qk: [] for qk in missing if qk not in populated}
+    to_list = [qk for qk in missing if qk in populated]
+    if to_list:
+        listed.update(_list_quadkey_partitions(fs, base_path, to_list))
+    partitions.update(
+        {qk: {"listed_at": listed_at, "paths": paths} for qk, paths in listed.items()}
+    )
+    _save_quadkey_index(base_path, index)
+    return {qk: partitions[qk]["paths"] for qk in quadkeys}
+
+
+def _list_item_parts(fs: adlfs.AzureBlobFileSystem, data_hrefs: list[str]) -> list[list[str]]:
+    """
+    List the files under STAC item data assets, concurrently and cached per href.
+
+    Parameters
+    ----------
+    fs : adlfs.AzureBlobFileSystem
+        Filesystem to list with
+    data_hrefs : list[str]
+        Data asset hrefs
+
+    Returns
+    -------
+    list[list[str]]
+        File paths (without protocol prefix) per href, in input order; empty
+        for hrefs that cannot be listed
+    """
+
+    def list_parts(href: str) -> list[str]:
+        parts = _ITEM_PARTS_CACHE.get(href)
+        if parts is None:
+            try:
+                parts = fs.ls(href, detail=False)
+            except Exception:
+                # Unlisted assets are skipped (and retried on the next query)
+                return []
+            _ITEM_PARTS_CACHE.put(href, parts)
+        return parts
+
+    if len(data_hrefs) <= 1:
+        return [list_parts(href) for href in data_hrefs]
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_DOWNLOADS, len(data_hrefs))) as executor:
+        return list(executor.map(list_parts, data_hrefs))
+
+
+def _has_bbox_column(schema: pa.Schema) -> bool:
+    """
+    Check whether a parquet schema has a GeoParquet bbox covering column.
+
+    Parameters
+    ----------
+    schema : pa.Schema
+        Arrow schema of the parquet file
+
+    Returns
+    -------
+    bool
+        True if a ``bbox`` struct with xmin/ymin/xmax/ymax fields is present
+    """
+    idx = schema.get_field_index(BBOX_COLUMN)
+    if idx == -1:
+        return False
+    bbox_type = schema.field(idx).type
+    if not pa.types.is_struct(bbox_type):
+        return False
+    return all(bbox_type.get_field_index(name) != -1 for name in BBOX_FIELDS)
+
+
+def _geo_bounds(schema: pa.Schema) -> tuple[float, ...] | None:
+    """
+    Get the file-level bounds of the primary geometry column from GeoParquet metadata.
+
+    Parameters
+    ----------
+    schema : pa.Schema
+        Arrow schema of the parquet file
+
+    Returns
+    -------
+    tuple[float, ...] or None
+        (xmin, ymin, xmax, ymax), or None if the file does not record them
+    """
+    geo = (schema.metadata or {}).get(b"geo")
+    if geo is None:
+        return None
+    try:
+        meta = json.loads(geo)
+        bounds = meta["columns"][meta["primary_column"]].get("bbox")
+    except (ValueError, KeyError, TypeError):
+        return None
+    # 3D bboxes are [xmin, ymin, zmin, xmax, ymax, zmax]
+    if bounds is not None and len(bounds) == 6:
+        bounds = [bounds[0], bounds[1], bounds[3], bounds[4]]
+    return tuple(bounds) if bounds is not None and len(bounds) == 4 else None
+
+
+def _geometry_encoding(schema: pa.Schema) -> str:
+    """
+    Get the encoding of the primary geometry column from GeoParquet metadata.
+
+    Parameters
+    ----------
+    schema : pa.Schema
+        Arrow schema of the parquet file
+
+    Returns
+    -------
+    str
+        Lowercase encoding name (e.g. "wkb", "polygon"); "wkb" if unrecorded
+    """
+    geo = (schema.metadata or {}).get(b"geo")
+    if geo is None:
+        return "wkb"
+    try:
+        meta = json.loads(geo)
+        return str(meta["columns"][meta["primary_column"]].get("encoding", "wkb")).lower()
+    except (ValueError, KeyError, TypeError):
+        return "wkb"
+
+
+def _geometries_from_arrow(geometry_column: pa.ChunkedArray, encoding: str) -> np.ndarray:
+    """
+    Build shapely geometries from a WKB or native GeoArrow geometry column.
+
+    GeoArrow columns are nested lists over a coordinate array, so their
+    offsets and coordinates go straight to ``shapely.from_ragged_array``
+    without per-row WKB parsing.
+
+    Parameters
+    ----------
+    geometry_column : pa.ChunkedArray
+        Geometry column as read from parquet
+    encoding : str
+        GeoParquet encoding of the column (see ``_geometry_encoding``)
+
+    Returns
+    -------
+    np.ndarray
+        Array of shapely geometries
+    """
+    if encoding == "wkb":
+        return shapely.from_wkb(geometry_column.to_numpy(zero_copy_only=False))
+    if encoding not in GEOARROW_GEOMETRY_TYPES:
+        raise ValueError(f"Unsupported geometry encoding: {encoding}")
+
+    arr = geometry_column.combine_chunks()
+    offsets = []
+    # Collected outermost first; shapely expects innermost (coordinate) offsets first
+    while pa.types.is_list(arr.type) or pa.types.is_large_list(arr.type):
+        # Rebase each level to zero so sliced arrays map onto their own children
+        level_offsets = np.asarray(arr.offsets)
+        start = int(level_offsets[0])
+        offsets.append(level_offsets - start)
+        arr = arr.values.slice(start, int(level_offsets[-1]) - start)
+
+    if pa.types.is_struct(arr.type):
+        # Separated coordinates: struct<x, y[, z]>
+        coords = np.column_stack(
+            [arr.field(i).to_numpy(zero_copy_only=False) for i in range(arr.type.num_fields)]
+        )
+    else:
+        # Interleaved coordinates: fixed_size_list<double>[2 or 3]
+        coords = arr.values.to_numpy(zero_copy_only=False).reshape(-1, arr.type.list_size)
+
+    geometries = shapely.from_ragged_array(
+        GEOARROW_GEOMETRY_TYPES[encoding], coords, tuple(reversed(offsets)) or None
+    )
+    if geometry_column.null_count > 0:
+        # Null slots decode to placeholder geometries; restore them as missing
+        geometries[geometry_column.is_null().to_numpy(zero_copy_only=False)] = None
+    return geometries
+
+
+def _bbox_filter(bounds: tuple[float, ...]) -> pc.Expression:
+    """
+    Build a row-group pushdown filter on the GeoParquet bbox covering column.
+
+    Files written with a ``bbox`` struct column carry per-row-group min/max
+    statistics for each corner, so PyArrow can skip row groups that cannot
+    intersect the query before any geometry bytes are downloaded.
+
+    Parameters
+    ----------
+    bounds : tuple[float, ...]
+        Query bounds (west, south, east, north)
+
+    Returns
+    -------
+    pc.Expression
+        Filter expression for ``pq.read_table``
+    """
+    west, south, east, north = bounds
+    return (
+        (pc.field(BBOX_COLUMN, "xmin") <= east)
+        & (pc.field(BBOX_COLUMN, "xmax") >= west)
+        & (pc.field(BBOX_COLUMN, "ymin") <= north)
+        & (pc.field(BBOX_COLUMN, "ymax") >= south)
+    )
 
 
 def _read_and_filter_parquet(
@@ -48,12 +598,21 @@ def _read_and_filter_parquet(
     storage_options: dict[str, Any],
     bbox_geom: Polygon,
     fs: adlfs.AzureBlobFileSystem | None = None,
-) -> gpd.GeoDataFrame | None:
+    tile_box: Polygon | None = None,
+) -> pa.Table | None:
     """
     Read parquet file and filter spatially using PyArrow for speed.
 
-    Uses PyArrow for faster raw reads, then converts to GeoDataFrame
-    and applies spatial filter.
+    Only the geometry column is read first (WKB or native GeoArrow); the
+    attribute columns are fetched afterwards and only when some rows
+    intersect, so wide schemas are not downloaded for files that are
+    filtered out. Files from a partition tile the query fully covers are
+    read in one pass with no spatial predicate. The matching rows are
+    returned as an Arrow table so callers can combine all files before a
+    single conversion to GeoDataFrame. Files whose
+    GeoParquet metadata bbox misses the query are skipped after reading only
+    the footer, and when the file has a bbox covering column the predicate
+    prunes row groups by statistics.
 
     Parameters
     ----------
@@ -65,11 +624,14 @@ def _read_and_filter_parquet(
         Shapely geometry for spatial filtering
     fs : adlfs.AzureBlobFileSystem, optional
         Pre-initialized filesystem for reuse
+    tile_box : Polygon, optional
+        Bounds of the quadkey tile the file is partitioned under; every
+        geometry in the file has a point inside it
 
     Returns
     -------
-    gpd.GeoDataFrame or None
-        Filtered GeoDataFrame or None if no matches
+    pa.Table or None
+        Matching rows with WKB geometries, or None if no matches
     """
     try:
         # Use PyArrow for faster reads
@@ -77,47 +639,200 @@ def _read_and_filter_parquet(
 
         if fs is not None:
             # Use provided filesystem (faster - reuses connection)
-            table = pq.read_table(fs.open(clean_path))
+            with fs.open(clean_path) as f:
+                info = _PARQUET_INFO_CACHE.get(clean_path)
+                if info is None:
+                    schema = pq.read_schema(f)
+                    info = (
+                        _has_bbox_column(schema),
+                        _geo_bounds(schema),
+                        _geometry_encoding(schema),
+                        schema.names,
+                    )
+                    _PARQUET_INFO_CACHE.put(clean_path, info)
+                    f.seek(0)
+                has_bbox, file_bounds, encoding, column_names = info
+
+                # Skip the whole file when its recorded extent misses the query
+                if file_bounds is not None and not box(*file_bounds).intersects(bbox_geom):
+                    return None
+                # Every geometry intersects a query that covers its partition tile
+                if tile_box is not None and bbox_geom.covers(tile_box):
+                    table = pq.read_table(f)
+                    if table.num_rows == 0:
+                        return None
+                    geometry_index = table.schema.get_field_index("geometry")
+                    return table.set_column(
+                        geometry_index,
+                        "geometry",
+                        _geometry_as_wkb(table.column("geometry"), encoding),
+                    )
+
+                # Without a covering column, filtering falls back to the geometry below
+                bbox_filter = _bbox_filter(bbox_geom.bounds) if has_bbox else None
+
+                # First pass reads only the geometry (and bbox covering) columns
+                first_pass = ["geometry", BBOX_COLUMN] if has_bbox else ["geometry"]
+                table = pq.read_table(f, columns=first_pass, filters=bbox_filter)
+                if table.num_rows == 0:
+                    return None
+                keep_idx = _intersecting_rows(table, encoding, bbox_geom)
+                if len(keep_idx) == 0:
+                    return None
+                # Survivors are returned as WKB so tables from every file combine
+                geometries = _geometry_as_wkb(table.column("geometry").take(keep_idx), encoding)
+
+                # Second pass fetches the attribute columns, same filter so row
+                # positions line up, and keeps only the surviving rows
+                attribute_names = [name for name in column_names if name != "geometry"]
+                if not attribute_names:
+                    return pa.table({"geometry": geometries})
+                f.seek(0)
+                table = pq.read_table(f, columns=attribute_names, filters=bbox_filter)
+                return table.take(keep_idx).add_column(
+                    column_names.index("geometry"), "geometry", geometries
+                )
         else:
-            # Fallback to geopandas (slower but handles auth automatically)
-            gdf = gpd.read_parquet(file_path, storage_options=storage_options)
+            # Fallback to geopandas (slower but handles auth automatically);
+            # bbox pushes the filter down to row groups via the covering column
+            try:
+                gdf = gpd.read_parquet(
+                    file_path, storage_options=storage_options, bbox=bbox_geom.bounds
+                )
+            except ValueError:
+                # No bbox covering column to filter on
+                gdf = gpd.read_parquet(file_path, storage_options=storage_options)
             if len(gdf) == 0:
                 return None
             # Apply spatial filter
-            mask = gdf.geometry.intersects(bbox_geom)
-            filtered = gdf[mask]
-            return gpd.GeoDataFrame(filtered, crs="EPSG:4326") if len(filtered) > 0 else None
-
-        # Convert PyArrow table to GeoDataFrame
-        df = table.to_pandas()
-        if len(df) == 0:
-            return None
-
-        # Parse WKB geometry
-        import shapely
-
-        df["geometry"] = shapely.from_wkb(df["geometry"])
-        gdf = gpd.GeoDataFrame(df, geometry="geometry", crs="EPSG:4326")
-
-        # Spatial filter using spatial index for large datasets
-        if len(gdf) > 1000:
-            sindex = gdf.sindex
-            candidates_idx = list(sindex.intersection(bbox_geom.bounds))
-            if not candidates_idx:
+            filtered = gdf[gdf.geometry.intersects(bbox_geom)]
+            if len(filtered) == 0:
                 return None
-            candidates = gdf.iloc[candidates_idx]
-            mask = candidates.geometry.intersects(bbox_geom)
-            filtered = candidates[mask]
-        else:
-            mask = gdf.geometry.intersects(bbox_geom)
-            filtered = gdf[mask]
-
-        return gpd.GeoDataFrame(filtered, crs="EPSG:4326") if len(filtered) > 0 else None
+            return pa.table(filtered.to_arrow(index=False, geometry_encoding="WKB"))
 
     except Exception:
         return None
 
 
+def _geometry_as_wkb(geometry_column: pa.ChunkedArray, encoding: str) -> pa.ChunkedArray | pa.Array:
+    """
+    Get a geometry column as WKB, converting native GeoArrow geometries.
+
+    Parameters
+    ----------
+    geometry_column : pa.ChunkedArray
+        Geometry column as read from parquet
+    encoding : str
+        GeoParquet encoding of the column (see ``_geometry_encoding``)
+
+    Returns
+    -------
+    pa.ChunkedArray or pa.Array
+        WKB geometry column
+    """
+    if encoding == "wkb":
+        return geometry_column
+    geometries = _geometries_from_arrow(geometry_column, encoding)
+    return pa.array(shapely.to_wkb(geometries), pa.binary())
+
+
+def _intersecting_rows(table: pa.Table, encoding: str, bbox_geom: Polygon) -> np.ndarray:
+    """
+    Find the rows of a geometry table that intersect a query geometry.
+
+    When the table has a bbox covering column and the query is a rectangle,
+    rows whose bbox lies inside the query are kept from four array
+    comparisons; only rows crossing the query edge have their geometry
+    decoded and tested, in one vectorized call (``bbox_geom`` is prepared by
+    the caller).
+
+    Parameters
+    ----------
+    table : pa.Table
+        Table with a ``geometry`` column and optionally a bbox covering column
+    encoding : str
+        GeoParquet encoding of the geometry column
+    bbox_geom : Polygon
+        Shapely geometry for spatial filtering
+
+    Returns
+    -------
+    np.ndarray
+        Positions of intersecting rows
+    """
+    geometry_column = table.column("geometry")
+    west, south, east, north = bbox_geom.bounds
+    if BBOX_COLUMN not in table.column_names or not bbox_geom.equals(box(west, south, east, north)):
+        geometries = _geometries_from_arrow(geometry_column, encoding)
+        return np.flatnonzero(shapely.intersects(bbox_geom, geometries))
+
+    bbox_column = table.column(BBOX_COLUMN)
+    xmin, ymin, xmax, ymax = (
+        pc.struct_field(bbox_column, name).to_numpy(zero_copy_only=False) for name in BBOX_FIELDS
+    )
+    # Covering bboxes contain their geometry, so inside the query means a hit
+    mask = (xmin >= west) & (xmax <= east) & (ymin >= south) & (ymax <= north)
+    edge_idx = np.flatnonzero(~mask)
+    if len(edge_idx) > 0:
+        geometries = _geometries_from_arrow(geometry_column.take(edge_idx), encoding)
+        mask[edge_idx] = shapely.intersects(bbox_geom, geometries)
+    return np.flatnonzero(mask)
+
+
+def _from_wkb_parallel(wkb: np.ndarray) -> np.ndarray:
+    """
+    Parse a WKB array into shapely geometries across threads.
+
+    Parameters
+    ----------
+    wkb : np.ndarray
+        Array of WKB bytes
+
+    Returns
+    -------
+    np.ndarray
+        Array of shapely geometries, in input order
+    """
+    workers = min(os.cpu_count() or 1, math.ceil(len(wkb) / WKB_PARSE_CHUNK_ROWS))
+    if workers <= 1:
+        return shapely.from_wkb(wkb)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return np.concatenate(list(executor.map(shapely.from_wkb, np.array_split(wkb, workers))))
+
+
+def _tables_to_geodataframe(tables: list[pa.Table]) -> gpd.GeoDataFrame:
+    """
+    Combine filtered parquet tables into one GeoDataFrame.
+
+    The tables are concatenated in Arrow (which only references the existing
+    buffers), so pandas conversion and WKB parsing run once over the result
+    instead of once per file followed by a ``pd.concat`` copy.
+
+    Parameters
+    ----------
+    tables : list[pa.Table]
+        Tables with a WKB ``geometry`` column; schemas may differ by columns
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        Combined GeoDataFrame in EPSG:4326 (empty if there are no tables),
+        without the source files' bbox covering column
+    """
+    if not tables:
+        return gpd.GeoDataFrame()
+
+    combined = pa.concat_tables(tables, promote_options="permissive")
+    if _has_bbox_column(combined.schema):
+        # Derived from the geometry; saving writes a fresh covering column
+        combined = combined.drop_columns(BBOX_COLUMN)
+    geometries = _from_wkb_parallel(combined.column("geometry").to_numpy(zero_copy_only=False))
+    geometry_index = combined.schema.get_field_index("geometry")
+    df = combined.drop_columns("geometry").to_pandas()
+    df.insert(geometry_index, "geometry", geometries)
+    return gpd.GeoDataFrame(df, geometry="geometry", crs="EPSG:4326")
+
+
 def query_geoparquet_by_quadkey(
     base_href: str,
     bbox: list[float],
@@ -155,30 +870,25 @@ def query_geoparquet_by_quadkey(
     # Setup filesystem
     account_name: str = storage_options.get("account_name") or ""
     sas_token: str = storage_options.get("credential") or storage_options.get("sas_token") or ""
-    fs = adlfs.AzureBlobFileSystem(
-        account_name=account_name,
-        sas_token=sas_token,
-    )
+    fs = _get_filesystem(account_name, sas_token)
 
     # Clean base path (remove protocol prefix)
     base_path = base_href.replace("abfs://", "").replace("az://", "")
 
-    # Collect parquet files from each quadkey partition
-    all_parquet_files: list[str] = []
-    for qk in quadkeys:
-        quadkey_path = f"{base_path}/quadkey={qk}"
-        try:
-            parts = fs.ls(quadkey_path)
-            all_parquet_files.extend(f"az://{part}" for part in parts if part.endswith(".parquet"))
-        except Exception:
-            # Quadkey partition may not exist (sparse data)
-            continue
+    # Collect parquet files (with their tile) from the intersecting quadkey partitions
+    partitions = _list_quadkey_parquet_files(fs, base_path, quadkeys)
+    file_tiles = {
+        f"az://{path}": _tile_box(qk) for qk, paths in partitions.items() for path in paths
+    }
+    all_parquet_files = list(file_tiles)
 
     if not all_parquet_files:
         return gpd.GeoDataFrame()
 
     # Create bbox geometry for spatial filtering
     bbox_geom = box(bbox[0], bbox[1], bbox[2], bbox[3])
+    # Prepare once, before the worker threads share it
+    shapely.prepare(bbox_geom)
 
     # Prepare storage options for fallback
     gp_storage_options = {
@@ -187,28 +897,28 @@ def query_geoparquet_by_quadkey(
     }
 
     # Process files in parallel with shared filesystem connection
-    all_gdfs: list[gpd.GeoDataFrame] = []
+    tables: list[pa.Table] = []
 
-    def read_file(file_path: str) -> gpd.GeoDataFrame | None:
-        return _read_and_filter_parquet(file_path, gp_storage_options, bbox_geom, fs=fs)
+    def read_file(file_path: str) -> pa.Table | None:
+        return _read_and_filter_parquet(
+            file_path, gp_storage_options, bbox_geom, fs=fs, tile_box=file_tiles[file_path]
+        )
 
-    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as executor:
+    workers = min(MAX_PARALLEL_DOWNLOADS, len(all_parquet_files))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
         future_to_file = {
             executor.submit(read_file, file_path): file_path for file_path in all_parquet_files
         }
 
         for future in as_completed(future_to_file):
             try:
-                gdf = future.result()
-                if gdf is not None and len(gdf) > 0:
-                    all_gdfs.append(gdf)
+                table = future.result()
+                if table is not None and table.num_rows > 0:
+                    tables.append(table)
             except Exception:
                 continue
 
-    if not all_gdfs:
-        return gpd.GeoDataFrame()
-
-    return gpd.GeoDataFrame(pd.concat(all_gdfs, ignore_index=True), crs="EPSG:4326")
+    return _tables_to_geodataframe(tables)
 
 
 def query_geoparquet_from_items(
@@ -242,60 +952,50 @@ def query_geoparquet_from_items(
     # Setup filesystem for listing parquet parts
     account_name: str = storage_options.get("account_name") or ""
     sas_token: str = storage_options.get("credential") or storage_options.get("sas_token") or ""
-    fs = adlfs.AzureBlobFileSystem(
-        account_name=account_name,
-        sas_token=sas_token,
-    )
+    fs = _get_filesystem(account_name, sas_token)
 
     # Collect all parquet file paths from items
     # Each item's "data" asset may contain multiple parquet files
-    all_parquet_files: list[str] = []
-    for item in items:
-        if "data" not in item.assets:
-            continue
-        data_href = item.assets["data"].href
-        try:
-            # List parquet files under this item's data asset
-            parts = fs.ls(data_href)
-            all_parquet_files.extend(f"az://{part}" for part in parts)
-        except Exception:
-            continue
+    data_hrefs = [item.assets["data"].href for item in items if "data" in item.assets]
+    all_parquet_files = [
+        f"az://{part}" for parts in _list_item_parts(fs, data_hrefs) for part in parts
+    ]
 
     if not all_parquet_files:
         return gpd.GeoDataFrame()
 
     # Create bbox geometry for spatial filtering
     bbox_geom = box(bbox[0], bbox[1], bbox[2], bbox[3])
+    # Prepare once, before the worker threads share it
+    shapely.prepare(bbox_geom)
 
-    # Prepare storage options for geopandas
+    # Prepare storage options for fallback
     gp_storage_options = {
-        "account_name": storage_options.get("account_name"),
-        "sas_token": storage_options.get("credential") or storage_options.get("sas_token"),
+        "account_name": account_name,
+        "sas_token": sas_token,
     }
 
-    # Process files in parallel
-    all_gdfs: list[gpd.GeoDataFrame] = []
+    # Process files in parallel with shared filesystem connection
+    tables: list[pa.Table] = []
+
+    def read_file(file_path: str) -> pa.Table | None:
+        return _read_and_filter_parquet(file_path, gp_storage_options, bbox_geom, fs=fs)
 
-    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS) as executor:
+    workers = min(MAX_PARALLEL_DOWNLOADS, len(all_parquet_files))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
         future_to_file = {
-            executor.submit(
-                _read_and_filter_parquet, file_path, gp_storage_options, bbox_geom
-            ): file_path
-            for file_path in all_parquet_files
+            executor.submit(read_file, file_path): file_path for file_path in all_parquet_files
         }
 
         for future in as_completed(future_to_file):
             try:
-                gdf = future.result()
-                if gdf is not None and len(gdf) > 0:
-                    all_gdfs.append(gdf)
+                table = future.result()
+                if table is not None and table.num_rows > 0:
+                    tables.append(table)
             except Exception:
                 continue
 
-    if not all_gdfs:
-        return gpd.GeoDataFrame()
-
-    return gpd.GeoDataFrame(pd.concat(all_gdfs, ignore_index=True), crs="EPSG:4326")
+    return _tables_to_geodataframe(tables)
 
 
 def save_geodataframe_as_parquet(
@@ -305,6 +1005,12 @@ def save_geodataframe_as_parquet(
     """
     Save GeoDataFrame as GeoParquet.
 
+    Writes ZSTD-compressed row groups of ``PARQUET_ROW_GROUP_SIZE`` rows so
+    large footprint extracts stay compact and can be read back in parallel.
+    Geometries are stored with GeoArrow encoding when the column has a single
+    geometry type (WKB otherwise), alongside a ``bbox`` covering column so
+    readers can push bbox filters down to row groups.
+
     Parameters
     ----------
     gdf : gpd.GeoDataFrame
@@ -317,7 +1023,21 @@ def save_geodataframe_as_parquet(
     str
         Path to saved file
     """
-    gdf.to_parquet(Path(output_path))
+    write_kwargs = {
+        "engine": "pyarrow",
+        "compression": PARQUET_COMPRESSION,
+        "row_group_size": PARQUET_ROW_GROUP_SIZE,
+        "write_covering_bbox": True,
+    }
+    try:
+        gdf.to_parquet(
+            Path(output_path), geometry_encoding=PARQUET_GEOMETRY_ENCODING, **write_kwargs
+        )
+    except ValueError as e:
+        # Mixed geometry types (e.g. Polygon + Point) have no GeoArrow encoding
+        if "Geometry type combination is not supported" not in str(e):
+            raise
+        gdf.to_parquet(Path(output_path), geometry_encoding="WKB", **write_kwargs)
     return output_path
 
 
@@ -342,5 +1062,29 @@ def get_vector_metadata(gdf: gpd.GeoDataFrame) -> dict[str, Any]:
         "columns": list(gdf.columns),
         "crs": str(gdf.crs) if gdf.crs else None,
         "bounds": bounds,
-        "geometry_types": gdf.geometry.type.value_counts().to_dict() if len(gdf) > 0 else {},
+        "geometry_types": _count_geometry_types(gdf.geometry.to_numpy()),
     }
+
+
+def _count_geometry_types(geometries: np.ndarray) -> dict[str, int]:
+    """
+    Count geometries per type using vectorized GEOS type ids.
+
+    Avoids building a Python string per geometry as ``GeoSeries.type`` does.
+    Missing geometries are skipped, matching ``value_counts``.
+
+    Parameters
+    ----------
+    geometries : np.ndarray
+        Array of shapely geometries
+
+    Returns
+    -------
+    dict[str, int]
+        Geometry type name -> count, most frequent first
+    """
+    type_ids = shapely.get_type_id(geometries)
+    # Histogram over the 8 type ids in one pass (np.unique would sort all ids)
+    counts = np.bincount(type_ids[type_ids >= 0], minlength=len(GEOMETRY_TYPE_NAMES))
+    order = np.argsort(-counts, kind="stable")
+    return {GEOMETRY_TYPE_NAMES[int(i)]: int(counts[i]) for i in order if counts[i] > 0}
@@ -2,12 +2,26 @@
 Visualization utilities for generating RGB/JPEG previews from raster data.
 """
 
-import matplotlib.colors as mcolors
+from functools import lru_cache
+
 import matplotlib.pyplot as plt
 import numpy as np
 import xarray as xr
 from PIL import Image
 
+from planetary_computer_mcp.core.raster_utils import clip_to_bbox
+
+# RGB band names per collection (tuples so the shared constant can't be mutated)
+RGB_BANDS = {
+    "sentinel-2-l2a": ("B04", "B03", "B02"),  # R, G, B
+    "landsat-c2-l2": ("red", "green", "blue"),
+    "naip": ("red", "green", "blue"),
+    "sentinel-1-rtc": ("vv", "vh", "vv"),  # SAR false color
+}
+
+# Default to Sentinel bands
+DEFAULT_RGB_BANDS = ("B04", "B03", "B02")
+
 # ESA WorldCover colormap
 ESA_WORLDCOVER_CMAP = {
     10: (0, 100, 0, 255),  # Tree cover - dark green
@@ -23,6 +37,44 @@ ESA_WORLDCOVER_CMAP = {
     100: (250, 230, 160, 255),  # Moss/lichen - beige
 }
 
+
+def _build_class_lut(cmap: dict[int, tuple[int, int, int, int]]) -> np.ndarray:
+    """
+    Build a 256-entry RGB lookup table from a class value colormap.
+
+    Values between class keys take the color of the nearest lower class,
+    and values outside the key range take the first/last class color.
+
+    Parameters
+    ----------
+    cmap : dict[int, tuple[int, int, int, int]]
+        Mapping of class values to RGBA colors
+
+    Returns
+    -------
+    np.ndarray
+        uint8 array of shape (256, 3)
+    """
+    class_values = np.array(sorted(cmap))
+    colors = np.array([cmap[v][:3] for v in class_values], dtype=np.uint8)
+    idx = np.searchsorted(class_values, np.arange(256), side="right") - 1
+    return colors[np.clip(idx, 0, len(class_values) - 1)]
+
+
+# ESA WorldCover colormap as a precomputed lookup table
+ESA_WORLDCOVER_LUT = _build_class_lut(ESA_WORLDCOVER_CMAP)
+
+# Pixel stride for percentile estimation (stride 8 sorts 64x fewer pixels)
+PERCENTILE_SAMPLE_STRIDE = 8
+
+# Longest side of GeoTIFF previews; larger rasters are read decimated, which
+# lets rasterio serve the read from COG overviews
+PREVIEW_MAX_SIZE = 2048
+
+# float32 working-set size per block when stretching to uint8; small enough
+# that the shift/scale/clip passes over a block run out of L2 cache
+STRETCH_BLOCK_BYTES = 1 << 20  # 1 MiB
+
 # Terrain/elevation colormap (blue to green to brown)
 TERRAIN_CMAP = [
     (0, 0, 255, 255),  # Deep blue (low elevation)
@@ -48,6 +100,7 @@ def create_rgb_visualization(
     output_path: str,
     collection: str,
     stretch: bool = True,
+    bbox: list[float] | None = None,
 ) -> str:
     """
     Create RGB visualization from raster data.
@@ -62,39 +115,36 @@ def create_rgb_visualization(
         Collection ID for band selection
     stretch : bool, optional
         Whether to stretch values for better visualization
+    bbox : list[float] or None, optional
+        Area of interest [west, south, east, north] in EPSG:4326. When the
+        data is georeferenced, only pixels within it are read.
 
     Returns
     -------
     str
         Path to saved visualization
     """
+    # Clip to the AOI before anything is computed; lazy data only fetches those chunks
+    if bbox is not None:
+        data = clip_to_bbox(data, bbox)
+
     # Select appropriate bands based on collection
     rgb_bands = get_rgb_bands_for_collection(collection)
 
-    # Extract RGB bands
-    rgb_data = []
-    for band in rgb_bands:
-        if band in data.data_vars:
-            band_data = data[band].values
-            # Take first time slice if temporal
-            if "time" in data.dims:
-                band_data = band_data[0]
-            rgb_data.append(band_data)
-        else:
-            # Fallback: use first available band
-            first_band = next(iter(data.data_vars.keys()))
-            band_data = data[first_band].values
-            if "time" in data.dims:
-                band_data = band_data[0]
-            rgb_data.append(band_data)
+    # Take first time slice if temporal
+    data = data.isel(time=0, missing_dims="ignore")
 
-    if len(rgb_data) < 3:
-        # Pad with copies if not enough bands
-        while len(rgb_data) < 3:
-            rgb_data.append(rgb_data[0])
+    # Fallback: use first available band for any missing RGB band
+    first_band = next(iter(data.data_vars.keys()))
+    bands = [band if band in data.data_vars else first_band for band in rgb_bands]
 
-    # Stack into RGB array
-    rgb_array = np.stack(rgb_data[:3], axis=-1)
+    # Stack bands into a single (y, x, band) array with one materialization
+    if len(set(bands)) == len(bands):
+        rgb = data[bands].to_array(dim="band")
+    else:
+        # Repeated bands (e.g. SAR false color) can't be selected as a Dataset
+        rgb = xr.concat([data[band] for band in bands], dim="band")
+    rgb_array = rgb.transpose(..., "band").values
 
     # Normalize to 0-255
     rgb_normalized = normalize_rgb(rgb_array, stretch=stretch)
@@ -150,34 +200,25 @@ def create_colormap_visualization(
     # Create colormap
     cmap_info = get_colormap_for_collection(collection)
     if isinstance(cmap_info, dict):
-        # Discrete colormap for classified data
-        bounds = sorted(cmap_info.keys())
-        colors = []
-        for val in bounds:
-            r, g, b, a = cmap_info[val]
-            colors.append((r / 255, g / 255, b / 255, a / 255))
-
-        cmap = mcolors.ListedColormap(colors)
-        norm = mcolors.BoundaryNorm(bounds + [max(bounds) + 1], cmap.N)
-
-        # Apply colormap to values
-        rgba = cmap(norm(values))
-        rgb_array = (rgba[:, :, :3] * 255).astype(np.uint8)  # Drop alpha, keep RGB
+        # Discrete colormap for classified data, applied via a lookup table
+        if cmap_info is ESA_WORLDCOVER_CMAP:
+            lut = ESA_WORLDCOVER_LUT
+        else:
+            lut = _build_class_lut(cmap_info)
+        # uint8 class rasters (e.g. WorldCover) index the table directly
+        if values.dtype != np.uint8:
+            values = np.clip(values, 0, 255).astype(np.uint8)
+        rgb_array = lut[values]
     elif isinstance(cmap_info, str):
-        # Matplotlib colormap for continuous data
-        try:
-            cmap = plt.get_cmap(cmap_info)
-        except (AttributeError, ValueError):
-            # Fallback to grayscale if colormap not found
-            cmap = plt.get_cmap("gray")
-
-        # Normalize values to 0-1 range for colormap
+        # Matplotlib colormap for continuous data, applied via a uint8 lookup table
+        lut = _continuous_colormap_lut(cmap_info)
+
+        # Quantize values to 0-255 LUT indices
         values_min = np.min(values)
         values_max = np.max(values)
         if values_max > values_min:
-            norm = mcolors.Normalize(vmin=values_min, vmax=values_max)
-            rgba = cmap(norm(values))
-            rgb_array = (rgba[:, :, :3] * 255).astype(np.uint8)
+            scaled = (values - values_min) * (255 / (values_max - values_min))
+            rgb_array = lut[scaled.astype(np.uint8)]
         else:
             # Constant value
             rgb_array = np.full(values.shape + (3,), 128, dtype=np.uint8)
@@ -199,11 +240,91 @@ def create_colormap_visualization(
     return output_path
 
 
+@lru_cache(maxsize=16)
+def _continuous_colormap_lut(name: str) -> np.ndarray:
+    """
+    Build a 256-entry RGB lookup table for a matplotlib colormap.
+
+    Parameters
+    ----------
+    name : str
+        Matplotlib colormap name
+
+    Returns
+    -------
+    np.ndarray
+        uint8 array of shape (256, 3)
+    """
+    try:
+        cmap = plt.get_cmap(name)
+    except (AttributeError, ValueError):
+        # Fallback to grayscale if colormap not found
+        cmap = plt.get_cmap("gray")
+    return cmap(np.linspace(0, 1, 256), bytes=True)[:, :3]
+
+
+def _to_float_block(block: np.ndarray) -> np.ndarray:
+    """
+    Copy an image block to float32 with NaN/inf replaced by zero.
+
+    Parameters
+    ----------
+    block : np.ndarray
+        Image block of any numeric dtype
+
+    Returns
+    -------
+    np.ndarray
+        float32 copy of the block
+    """
+    is_float = np.issubdtype(block.dtype, np.floating)
+    block = block.astype(np.float32, copy=True)
+    if is_float:
+        # Integers can't hold NaN/inf, even once cast to float32
+        np.nan_to_num(block, copy=False, nan=0, posinf=0, neginf=0)
+    return block
+
+
+def _stretch_lut(dtype: np.dtype, low: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """
+    Build per-channel uint8 lookup tables for a linear stretch of an integer dtype.
+
+    Entries are computed with the same float32 shift/scale/clip as the block
+    path, so both give identical output.
+
+    Parameters
+    ----------
+    dtype : np.dtype
+        Integer dtype of at most 16 bits
+    low : np.ndarray
+        Per-channel value mapped to 0
+    scale : np.ndarray
+        Per-channel multiplier to the 0-255 range
+
+    Returns
+    -------
+    np.ndarray
+        uint8 array of shape (channels, 2**bits), indexed by the value's
+        unsigned bit pattern
+    """
+    unsigned = np.dtype(f"u{dtype.itemsize}")
+    values = np.arange(2 ** (8 * dtype.itemsize), dtype=unsigned).view(dtype)
+    lut = np.tile(values.astype(np.float32), (len(low), 1))
+    lut -= np.asarray(low)[:, None]
+    lut *= np.asarray(scale)[:, None]
+    np.clip(lut, 0, 255, out=lut)
+    return lut.astype(np.uint8)
+
+
 def normalize_rgb(rgb_array: np.ndarray, stretch: bool = True) -> np.ndarray:
     """
     Normalize RGB array to 0-255 range.
 
-    Uses in-place operations where possible to minimize memory copies.
+    Integer rasters of up to 16 bits (the usual uint8/uint16 reflectance)
+    are mapped through a per-channel lookup table in a single pass with no
+    float copy. Other dtypes are worked through in cache-sized row blocks,
+    so the float32 conversion, shift, scale and clip over a block stay in
+    cache and the clip writes straight into a preallocated uint8 output.
 
     Parameters
     ----------
@@ -217,36 +338,57 @@ def normalize_rgb(rgb_array: np.ndarray, stretch: bool = True) -> np.ndarray:
     np.ndarray
         Normalized RGB array (0-255)
     """
-    # Work on float32 copy for normalization (single copy instead of multiple)
-    rgb = rgb_array.astype(np.float32, copy=True)
-
-    # Handle NaN/inf in-place
-    np.nan_to_num(rgb, copy=False, nan=0, posinf=0, neginf=0)
+    row_bytes = 4 * int(np.prod(rgb_array.shape[1:]))
+    rows = max(1, STRETCH_BLOCK_BYTES // max(1, row_bytes))
+    block_starts = range(0, rgb_array.shape[0], rows)
 
+    low = denom = None
     if stretch:
-        # Percentile stretch
-        p2, p98 = np.percentile(rgb, (2, 98), axis=(0, 1))
-        denom = p98 - p2
+        # Percentile stretch, estimated on a strided subsample of the image
+        step = PERCENTILE_SAMPLE_STRIDE
+        sample = _to_float_block(rgb_array[::step, ::step]).reshape(-1, rgb_array.shape[-1])
+        low, high = np.percentile(sample, (2, 98), axis=0)
+        denom = high - low
         if np.any(denom == 0) or np.any(np.isnan(denom)):
             # If no variation, use min-max
-            rgb_min = np.min(rgb, axis=(0, 1))
-            rgb_max = np.max(rgb, axis=(0, 1))
-            rgb -= rgb_min
-            rgb /= rgb_max - rgb_min + 1e-8
-        else:
-            rgb -= p2
-            rgb /= denom
-            np.clip(rgb, 0, 1, out=rgb)
-    else:
-        # Min-max normalization in-place
-        rgb_min = np.min(rgb, axis=(0, 1))
-        rgb_max = np.max(rgb, axis=(0, 1))
-        rgb -= rgb_min
-        rgb /= rgb_max - rgb_min + 1e-8
-
-    # Scale to 0-255 and convert to uint8
-    rgb *= 255
-    return rgb.astype(np.uint8)
+            low = denom = None
+
+    use_lut = np.issubdtype(rgb_array.dtype, np.integer) and rgb_array.dtype.itemsize <= 2
+
+    if (low is None or denom is None) and use_lut:
+        # Min-max normalization straight on the integers (exact in float32)
+        low = rgb_array.min(axis=(0, 1)).astype(np.float32)
+        denom = rgb_array.max(axis=(0, 1)).astype(np.float32) - low + 1e-8
+    elif low is None or denom is None:
+        # Min-max normalization, reduced block by block
+        block_mins, block_maxs = [], []
+        for start in block_starts:
+            block = _to_float_block(rgb_array[start : start + rows])
+            block_mins.append(np.min(block, axis=(0, 1)))
+            block_maxs.append(np.max(block, axis=(0, 1)))
+        low = np.min(block_mins, axis=0)
+        denom = np.max(block_maxs, axis=0) - low + 1e-8
+
+    scale = 255 / denom
+
+    if use_lut:
+        lut = _stretch_lut(rgb_array.dtype, low, scale)
+        unsigned = np.dtype(f"u{rgb_array.dtype.itemsize}")
+        result = np.empty(rgb_array.shape, dtype=np.uint8)
+        for c in range(rgb_array.shape[-1]):
+            # The unsigned view indexes the table by bit pattern (signed too)
+            result[..., c] = lut[c][rgb_array[..., c].view(unsigned)]
+        return result
+
+    # Shift and scale to 0-255 in-place, then clip straight into the uint8
+    # output (truncating like astype), one block at a time
+    result = np.empty(rgb_array.shape, dtype=np.uint8)
+    for start in block_starts:
+        block = _to_float_block(rgb_array[start : start + rows])
+        block -= low
+        block *= scale
+        np.clip(block, 0, 255, out=result[start : start + rows], casting="unsafe")
+    return result
 
 
 def get_rgb_bands_for_collection(collection: str) -> list[str]:
@@ -263,17 +405,7 @@ def get_rgb_bands_for_collection(collection: str) -> list[str]:
     list[str]
         List of band names [red, green, blue]
     """
-    band_mappings = {
-        "sentinel-2-l2a": ["B04", "B03", "B02"],  # R, G, B
-        "landsat-c2-l2": ["red", "green", "blue"],
-        "naip": ["red", "green", "blue"],
-        "sentinel-1-rtc": ["vv", "vh", "vv"],  # SAR false color
-    }
-
-    return band_mappings.get(
-        collection,
-        ["B04", "B03", "B02"],
-    )  # Default to Sentinel bands
+    return list(RGB_BANDS.get(collection, DEFAULT_RGB_BANDS))
 
 
 def get_colormap_for_collection(
@@ -310,7 +442,9 @@ def create_rgb_visualization_from_geotiff(
     Create RGB visualization directly from a GeoTIFF file.
 
     Reads RGB bands from a GeoTIFF and creates a JPEG visualization,
-    bypassing xarray for maximum performance.
+    bypassing xarray for maximum performance. Rasters larger than
+    ``PREVIEW_MAX_SIZE`` are read averaged down to it, so only
+    preview-sized data is decoded.
 
     Parameters
     ----------
@@ -329,15 +463,21 @@ def create_rgb_visualization_from_geotiff(
         Path to saved visualization
     """
     import rasterio  # type: ignore[import-not-found]
+    from rasterio.enums import Resampling  # type: ignore[import-not-found]
 
     with rasterio.open(input_path) as src:
+        scale = min(1.0, PREVIEW_MAX_SIZE / max(src.height, src.width))
+        out_size = (max(1, round(src.height * scale)), max(1, round(src.width * scale)))
+
         # NAIP: bands are R, G, B, NIR (1, 2, 3, 4)
         # Read first 3 bands for RGB
         if src.count >= 3:
-            rgb_data = src.read([1, 2, 3])  # Read R, G, B
+            rgb_data = src.read(  # Read R, G, B
+                [1, 2, 3], out_shape=(3, *out_size), resampling=Resampling.average
+            )
         else:
             # Single band - replicate to RGB
-            band = src.read(1)
+            band = src.read(1, out_shape=out_size, resampling=Resampling.average)
             rgb_data = np.stack([band, band, band])
 
     # Transpose from (bands, height, width) to (height, width, bands)
@@ -5,14 +5,20 @@ Supports loading Zarr data from Planetary Computer's climate collections
 like GridMET, TerraClimate, Daymet, and ERA5.
 """
 
-from typing import Any
+import json
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit, urlunsplit
 
+import fsspec
 import planetary_computer as pc
-import pystac_client
 import xarray as xr
+from pystac import Asset
 
-# Catalog URL for Planetary Computer
-PC_STAC_URL = "https://planetarycomputer.microsoft.com/api/stac/v1"
+from planetary_computer_mcp.core.stac_client import stac_client
+
+if TYPE_CHECKING:
+    from pyproj import CRS
 
 # Zarr asset name preference order
 ZARR_ASSET_NAMES = ["zarr-abfs", "zarr-https"]
@@ -38,13 +44,18 @@ DEFAULT_VARIABLES: dict[str, list[str]] = {
     "era5-pds": ["air_temperature_at_2_metres", "precipitation_amount_1hour_Accumulation"],
 }
 
+# Time steps per chunk when streaming a lazy subset to disk; bounds peak
+# memory to a day of hourly data (or ~a month of daily data) per worker
+ZARR_TIME_CHUNK = 24
 
-def get_zarr_store_url(collection_id: str) -> tuple[str, dict[str, Any], dict[str, Any]]:
+
+@lru_cache(maxsize=32)
+def _get_zarr_asset(collection_id: str) -> Asset:
     """
-    Get the Zarr store URL and access credentials for a collection.
+    Find the (unsigned) Zarr asset of a collection.
 
-    Uses Planetary Computer's STAC catalog to find the Zarr asset
-    and signs it to get storage credentials.
+    Collection metadata is static, so the lookup is cached per process and
+    repeated loads skip the STAC API round-trip.
 
     Parameters
     ----------
@@ -53,35 +64,55 @@ def get_zarr_store_url(collection_id: str) -> tuple[str, dict[str, Any], dict[st
 
     Returns
     -------
-    tuple[str, dict[str, Any], dict[str, Any]]
-        Tuple of (zarr_url, storage_options, open_kwargs)
+    Asset
+        Unsigned Zarr collection asset
 
     Raises
     ------
     ValueError
         If collection doesn't have a Zarr asset
     """
-    catalog = pystac_client.Client.open(PC_STAC_URL)
-    collection = catalog.get_collection(collection_id)
+    collection = stac_client.client.get_collection(collection_id)
 
     if not collection.assets:
         raise ValueError(f"Collection {collection_id} has no assets")
 
     # Find Zarr asset
-    zarr_asset = None
     for asset_name in ZARR_ASSET_NAMES:
         if asset_name in collection.assets:
-            zarr_asset = collection.assets[asset_name]
-            break
+            return collection.assets[asset_name]
+
+    raise ValueError(
+        f"Collection {collection_id} has no Zarr asset. Available: {list(collection.assets.keys())}"
+    )
+
+
+def get_zarr_store_url(collection_id: str) -> tuple[str, dict[str, Any], dict[str, Any]]:
+    """
+    Get the Zarr store URL and access credentials for a collection.
 
-    if zarr_asset is None:
-        raise ValueError(
-            f"Collection {collection_id} has no Zarr asset. "
-            f"Available: {list(collection.assets.keys())}"
-        )
+    Uses Planetary Computer's STAC catalog to find the Zarr asset
+    and signs it to get storage credentials. The asset lookup is cached;
+    signing is not, since planetary_computer already caches SAS tokens
+    and refreshes them before they expire.
 
-    # Sign asset to get credentials
-    signed_asset = pc.sign(zarr_asset)
+    Parameters
+    ----------
+    collection_id : str
+        Planetary Computer collection ID
+
+    Returns
+    -------
+    tuple[str, dict[str, Any], dict[str, Any]]
+        Tuple of (zarr_url, storage_options, open_kwargs)
+
+    Raises
+    ------
+    ValueError
+        If collection doesn't have a Zarr asset
+    """
+    # Sign a copy of the cached asset to get credentials
+    signed_asset = pc.sign(_get_zarr_asset(collection_id))
 
     storage_options = signed_asset.extra_fields.get("xarray:storage_options", {})
     open_kwargs = signed_asset.extra_fields.get("xarray:open_kwargs", {}).copy()
@@ -97,6 +128,79 @@ def get_zarr_store_url(collection_id: str) -> tuple[str, dict[str, Any], dict[st
     return signed_asset.href, storage_options, open_kwargs
 
 
+def _get_grid_mapping_crs(ds: xr.Dataset) -> "CRS | None":
+    """
+    Get the CRS of a projected grid from its CF grid mapping variable.
+
+    Stores like Daymet keep the grid mapping (e.g. ``lambert_conformal_conic``)
+    as a data variable, which rioxarray does not pick up on its own.
+
+    Parameters
+    ----------
+    ds : xr.Dataset
+        Dataset whose data variables may reference a ``grid_mapping``
+
+    Returns
+    -------
+    CRS or None
+        Parsed CRS, or None if no usable grid mapping is found
+    """
+    # Deferred so lat/lon-only loads never import pyproj
+    from pyproj import CRS
+    from pyproj.exceptions import CRSError
+
+    for var in ds.data_vars.values():
+        grid_mapping = var.attrs.get("grid_mapping") or var.encoding.get("grid_mapping")
+        if grid_mapping and grid_mapping in ds.variables:
+            try:
+                return CRS.from_cf(ds[grid_mapping].attrs)
+            except CRSError:
+                return None
+    return None
+
+
+def _clip_projected_grid(ds: xr.Dataset, bbox: list[float], crs: "CRS | None") -> xr.Dataset:
+    """
+    Clip a Dataset on a projected x/y grid to a lon/lat bounding box.
+
+    The whole Dataset is clipped in one lazy index selection, so every
+    variable shares the same window and nothing is read until compute.
+
+    Parameters
+    ----------
+    ds : xr.Dataset
+        Dataset with ``x``/``y`` dimensions
+    bbox : list[float]
+        Bounding box [west, south, east, north] in EPSG:4326
+    crs : CRS or None
+        CRS of the x/y grid
+
+    Returns
+    -------
+    xr.Dataset
+        Clipped Dataset, or the input unchanged if the grid can't be georeferenced
+
+    Raises
+    ------
+    ValueError
+        If the bounding box does not intersect the grid
+    """
+    if crs is None or "x" not in ds.dims or "y" not in ds.dims:
+        return ds
+
+    # Deferred so lat/lon-only loads never import rioxarray
+    import rioxarray  # noqa: F401
+    from rioxarray.exceptions import NoDataInBounds, RioXarrayError
+
+    west, south, east, north = bbox
+    try:
+        return ds.rio.write_crs(crs).rio.clip_box(west, south, east, north, crs="EPSG:4326")
+    except NoDataInBounds as e:
+        raise ValueError(f"No data found in bbox {bbox}") from e
+    except RioXarrayError:
+        return ds
+
+
 def load_zarr_data(
     collection_id: str,
     variables: list[str] | None = None,
@@ -139,6 +243,9 @@ def load_zarr_data(
     # Get coordinate names for this collection
     time_coord, lat_coord, lon_coord = COORD_MAPPINGS.get(collection_id, ("time", "lat", "lon"))
 
+    # Resolve projected grid CRS before variable selection drops the grid mapping
+    grid_crs = _get_grid_mapping_crs(ds)
+
     # Select variables
     if variables:
         available = {str(v) for v in ds.data_vars}
@@ -170,9 +277,8 @@ def load_zarr_data(
                 # Ascending lat
                 ds = ds.sel({lon_coord: slice(west, east), lat_coord: slice(south, north)})
         else:
-            # 2D lat/lon (projected data like Daymet) - skip spatial subset for now
-            # TODO: Implement proper spatial indexing for projected grids
-            pass
+            # 2D lat/lon (projected data like Daymet) - clip on the x/y grid
+            ds = _clip_projected_grid(ds, bbox, grid_crs)
 
     # Apply time subset if provided
     if time_range and time_coord in ds.coords:
@@ -195,7 +301,8 @@ def load_and_compute_zarr(
     Load Zarr data and compute (download) to memory.
 
     Same as load_zarr_data but triggers actual data download.
-    Use for smaller subsets that fit in memory.
+    Use for smaller subsets that fit in memory; larger subsets should stay
+    lazy and be streamed with save_zarr_subset_as_netcdf.
 
     Parameters
     ----------
@@ -224,10 +331,13 @@ def save_zarr_subset_as_netcdf(
     """
     Save Zarr data subset as NetCDF file.
 
+    Dask-backed data is written chunk by chunk in slices of ZARR_TIME_CHUNK
+    time steps, so the subset never has to fit in memory at once.
+
     Parameters
     ----------
     data : xr.Dataset
-        xarray Dataset (should be computed/in-memory)
+        xarray Dataset, lazy (dask-backed) or in-memory
     output_path : str
         Output file path (.nc)
 
@@ -236,9 +346,9 @@ def save_zarr_subset_as_netcdf(
     str
         Path to saved NetCDF file
     """
-    # Ensure data is computed
-    if data.chunks:
-        data = data.compute()
+    # Stream lazy data in bounded time slices instead of computing it whole
+    if data.chunks and "time" in data.dims:
+        data = data.chunk({"time": ZARR_TIME_CHUNK})
 
     # Clean attributes that may have encoding issues
     data = _sanitize_attrs_for_netcdf(data)
@@ -265,6 +375,7 @@ def _sanitize_attrs_for_netcdf(data: xr.Dataset) -> xr.Dataset:
         Dataset with cleaned attributes
     """
 
+    # Shallow copy: new attribute dicts, shared (lazy) arrays
     data = data.copy()
 
     def clean_attrs(attrs: dict) -> dict:
@@ -279,37 +390,46 @@ def _sanitize_attrs_for_netcdf(data: xr.Dataset) -> xr.Dataset:
         Returns
         -------
         dict
-            Cleaned attributes dictionary
+            Cleaned attributes dictionary, without nested dicts or strings
+            that can't be encoded
         """
-        cleaned = {}
-        for key, value in attrs.items():
-            if isinstance(value, str):
-                # Replace surrogates and other problematic characters
-                try:
-                    value.encode("utf-8")
-                    cleaned[key] = value
-                except UnicodeEncodeError:
-                    # Skip attributes that can't be encoded
-                    continue
-            elif isinstance(value, dict):
-                # Skip complex nested attributes
-                continue
-            else:
-                cleaned[key] = value
-        return cleaned
+        return {
+            key: value
+            for key, value in attrs.items()
+            if not isinstance(value, dict)
+            and (not isinstance(value, str) or _is_utf8_encodable(value))
+        }
+
+    # Clean dataset, data variable and coordinate attributes
+    data.attrs = clean_attrs(data.attrs)
+    for variable in data.variables.values():
+        variable.attrs = clean_attrs(variable.attrs)
 
-    # Clean dataset attributes
-    data.attrs = clean_attrs(dict(data.attrs))
+    return data
 
-    # Clean variable attributes
-    for var in data.data_vars:
-        data[var].attrs = clean_attrs(dict(data[var].attrs))
 
-    # Clean coordinate attributes
-    for coord in data.coords:
-        data[coord].attrs = clean_attrs(dict(data[coord].attrs))
+def _is_utf8_encodable(value: str) -> bool:
+    """
+    Check whether a string can be encoded to UTF-8.
 
-    return data
+    Parameters
+    ----------
+    value : str
+        String attribute value
+
+    Returns
+    -------
+    bool
+        False if the string contains lone surrogates
+    """
+    # Nearly all attributes are ASCII; only encode the rest
+    if value.isascii():
+        return True
+    try:
+        value.encode("utf-8")
+    except UnicodeEncodeError:
+        return False
+    return True
 
 
 def get_zarr_metadata(data: xr.Dataset) -> dict[str, Any]:
@@ -368,10 +488,62 @@ def get_zarr_metadata(data: xr.Dataset) -> dict[str, Any]:
     return metadata
 
 
+def _zmetadata_url(zarr_url: str) -> str:
+    """
+    Get the URL of a Zarr store's consolidated metadata document.
+
+    Parameters
+    ----------
+    zarr_url : str
+        Zarr store URL, possibly carrying a SAS token query string
+
+    Returns
+    -------
+    str
+        URL of the store's ``.zmetadata`` file, keeping any query string
+    """
+    parts = urlsplit(zarr_url)
+    return urlunsplit(parts._replace(path=parts.path.rstrip("/") + "/.zmetadata"))
+
+
+def _data_variables_from_zmetadata(zmetadata: dict[str, Any]) -> list[str]:
+    """
+    List the data variables described by consolidated Zarr v2 metadata.
+
+    Mirrors how xarray splits root arrays into coordinates and data
+    variables: dimension coordinates and arrays named in a ``coordinates``
+    attribute are coordinates, everything else is a data variable.
+
+    Parameters
+    ----------
+    zmetadata : dict[str, Any]
+        Parsed ``.zmetadata`` document
+
+    Returns
+    -------
+    list[str]
+        Data variable names, in store order
+    """
+    metadata = zmetadata["metadata"]
+    arrays = [key[: -len("/.zarray")] for key in metadata if key.endswith("/.zarray")]
+    root_arrays = [name for name in arrays if "/" not in name]
+
+    coords: set[str] = set(metadata.get(".zattrs", {}).get("coordinates", "").split())
+    for name in root_arrays:
+        attrs = metadata.get(f"{name}/.zattrs", {})
+        coords.update(attrs.get("_ARRAY_DIMENSIONS", []))
+        coords.update(attrs.get("coordinates", "").split())
+
+    return [name for name in root_arrays if name not in coords]
+
+
 def get_available_variables(collection_id: str) -> list[str]:
     """
     Get list of available variables for a Zarr collection.
 
+    Reads only the store's consolidated ``.zmetadata`` document, falling
+    back to opening the store with xarray when it has none.
+
     Parameters
     ----------
     collection_id : str
@@ -383,5 +555,13 @@ def get_available_variables(collection_id: str) -> list[str]:
         List of variable names
     """
     zarr_url, storage_options, open_kwargs = get_zarr_store_url(collection_id)
+
+    try:
+        with fsspec.open(_zmetadata_url(zarr_url), "r", **storage_options) as f:
+            return _data_variables_from_zmetadata(json.load(f))
+    except (FileNotFoundError, KeyError, json.JSONDecodeError):
+        # Unconsolidated or Zarr v3 store
+        pass
+
     ds = xr.open_zarr(zarr_url, storage_options=storage_options, **open_kwargs)
     return [str(v) for v in ds.data_vars]
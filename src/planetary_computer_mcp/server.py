@@ -2,6 +2,8 @@
 MCP server entry point for Planetary Computer tools.
 """
 
+import asyncio
+
 from mcp.server.fastmcp import FastMCP
 from mcp.types import TextContent
 
@@ -67,7 +69,9 @@ async def download_data_tool(
         query="naip aerial photos", aoi="Central Park, NY"
     """
     try:
-        result = download_data(
+        # Run the blocking download off the event loop so requests can overlap
+        result = await asyncio.to_thread(
+            download_data,
             query=query,
             aoi=aoi,
             time_range=time_range,
@@ -155,7 +159,8 @@ async def download_geometries_tool(
         File paths and metadata
     """
     try:
-        result = download_geometries(
+        result = await asyncio.to_thread(
+            download_geometries,
             collection=collection,
             aoi=aoi,
             output_dir=output_dir,
@@ -2,9 +2,12 @@
 Unified download_data tool for raster, DEM, land cover, and Zarr data.
 """
 
+from datetime import UTC, date, timedelta
 from pathlib import Path
 from typing import Any
 
+from pystac import Item
+
 from ..core import (
     calculate_bbox_area_km2,
     detect_collection_from_query,
@@ -12,14 +15,15 @@ from ..core import (
     get_collection_type,
     get_default_time_range,
     place_to_bbox,
-    stac_client,
     validate_bbox,
 )
 from ..core.raster_utils import (
+    clip_to_bbox,
     get_raster_metadata,
     load_raster_from_stac,
     save_raster_as_geotiff,
 )
+from ..core.stac_client import stac_client
 from ..core.visualization import (
     create_colormap_visualization,
     create_rgb_visualization,
@@ -38,11 +42,13 @@ SIZE_WARN_THRESHOLD_MB = 100  # Warn user about large downloads
 SIZE_LARGE_THRESHOLD_MB = 500  # Strongly warn about very large downloads
 
 # Adaptive search limits based on AOI size
-# Larger AOIs need more items to find good coverage
+# Larger AOIs need more items to find good coverage. Only items from the latest
+# acquisition day are downloaded, so extra candidates cost STAC metadata only
+# and let small AOIs on a tile boundary pick up the neighbouring tiles.
 SEARCH_LIMIT_THRESHOLDS = [
-    (10, 1),  # < 10 km²: 1 item (small area, single scene covers it)
-    (50, 2),  # 10-50 km²: 2 items
-    (100, 5),  # 50-100 km²: 5 items
+    (10, 4),  # < 10 km²: 4 items (covers a tile corner)
+    (50, 4),  # 10-50 km²: 4 items
+    (100, 6),  # 50-100 km²: 6 items
     (500, 10),  # 100-500 km²: 10 items
     (1000, 20),  # 500-1000 km²: 20 items (large area, may need multiple scenes)
 ]
@@ -204,7 +210,7 @@ def get_adaptive_search_limit(aoi_area_km2: float) -> int:
     Get adaptive search limit based on AOI size.
 
     Larger AOIs may need more items to find good scene coverage.
-    Small AOIs typically need only 1 item.
+    Small AOIs still search a few items in case they straddle a tile edge.
 
     Parameters
     ----------
@@ -214,7 +220,7 @@ def get_adaptive_search_limit(aoi_area_km2: float) -> int:
     Returns
     -------
     int
-        Recommended search limit (1-20)
+        Recommended search limit (4-20)
     """
     for threshold, limit in SEARCH_LIMIT_THRESHOLDS:
         if aoi_area_km2 < threshold:
@@ -223,6 +229,60 @@ def get_adaptive_search_limit(aoi_area_km2: float) -> int:
     return SEARCH_LIMIT_THRESHOLDS[-1][1]
 
 
+def _solar_day(item: Item) -> date:
+    """
+    Get the local solar date an item was acquired on.
+
+    Matches odc-stac's ``groupby="solar_day"``: the UTC time is shifted by
+    the longitude of the item's bbox centroid at 15 degrees per hour.
+
+    Parameters
+    ----------
+    item : Item
+        Dated STAC item
+
+    Returns
+    -------
+    date
+        Solar date of the acquisition
+    """
+    dt = item.datetime
+    # Naive datetimes are UTC, as in pystac
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(UTC)
+    lon = (item.bbox[0] + item.bbox[2]) / 2 if item.bbox else 0.0
+    return (dt + timedelta(hours=lon / 15)).date()
+
+
+def select_latest_acquisition(items: list[Item]) -> list[Item]:
+    """
+    Keep only the items acquired on the same solar day as the most recent item.
+
+    Adjacent tiles from one overpass are mosaicked by odc-stac into a single
+    time slice, while older scenes (which would only be discarded after
+    download) are dropped before any pixels are read. Grouping by solar day
+    keeps an overpass that crosses UTC midnight together.
+
+    Parameters
+    ----------
+    items : list[Item]
+        STAC items from search
+
+    Returns
+    -------
+    list[Item]
+        Items from the latest acquisition day, or all items if undated
+    """
+    dated = [item for item in items if item.datetime is not None]
+    if not dated:
+        # Static collections (e.g. land cover) use start/end datetimes only
+        return items
+
+    days = [_solar_day(item) for item in dated]
+    latest_day = max(days)
+    return [item for item, day in zip(dated, days, strict=True) if day == latest_day]
+
+
 def download_data(
     query: str,
     aoi: list[float] | str,
@@ -437,6 +497,9 @@ def _download_raster_data(
                 suggestion=None,
             )
 
+    # Mosaic tiles from the most recent overpass instead of stacking every date
+    items = select_latest_acquisition(items)
+
     # Get native resolution for collection (default to 10m if unknown)
     resolution = NATIVE_RESOLUTIONS.get(collection, 0.0001)
 
@@ -513,9 +576,13 @@ def _download_raster_data(
             from ..core.visualization import get_rgb_bands_for_collection
 
             bands = get_rgb_bands_for_collection(collection)
-            data = load_raster_from_stac(items, bbox, bands=bands, resolution=resolution)
+            data = load_raster_from_stac(items, bbox, bands=bands, resolution=resolution, chunks={})
         else:
-            data = load_raster_from_stac(items, bbox, resolution=resolution)
+            data = load_raster_from_stac(items, bbox, resolution=resolution, chunks={})
+
+        # Trim to the AOI while lazy so only those chunks are read, then load once
+        # for both the GeoTIFF and the preview
+        data = clip_to_bbox(data, bbox).load()
 
         save_raster_as_geotiff(data, str(raw_path))
 
@@ -582,14 +649,16 @@ def _download_zarr_data(
     dict[str, Any]
         Dictionary with file paths and metadata
     """
+    import xarray as xr
+
     from ..core.zarr_utils import (
         get_zarr_metadata,
-        load_and_compute_zarr,
+        load_zarr_data,
         save_zarr_subset_as_netcdf,
     )
 
-    # Load and compute Zarr data
-    data = load_and_compute_zarr(
+    # Load Zarr data lazily; the subset may be far larger than memory
+    data = load_zarr_data(
         collection_id=collection,
         bbox=bbox,
         time_range=time_range,
@@ -598,15 +667,16 @@ def _download_zarr_data(
     if len(data.data_vars) == 0:
         raise ValueError(f"No data found for {collection} in the specified area/time")
 
-    # Save as NetCDF
+    # Save as NetCDF, streaming chunk by chunk from the Zarr store
     raw_path = Path(output_dir) / f"{collection}-data.nc"
     save_zarr_subset_as_netcdf(data, str(raw_path))
 
-    # Create visualizations based on data structure
-    visualizations = _create_zarr_visualizations(data, collection, output_dir)
+    # Visualizations only touch a few time slices; read them back from disk
+    with xr.open_dataset(raw_path, engine="h5netcdf") as data:
+        visualizations = _create_zarr_visualizations(data, collection, output_dir)
 
-    # Extract metadata
-    metadata = get_zarr_metadata(data)
+        # Extract metadata
+        metadata = get_zarr_metadata(data)
     metadata["collection"] = collection
     metadata["bbox"] = bbox
     if time_range:
@@ -706,8 +776,8 @@ def _create_zarr_animation(
     None
         Animation is saved to the specified output path
     """
-    import matplotlib.animation as animation
-    import matplotlib.pyplot as plt
+    from matplotlib import animation, colormaps
+    from matplotlib.figure import Figure
 
     # Get the first data variable
     var_name = next(iter(data.data_vars))
@@ -727,27 +797,32 @@ def _create_zarr_animation(
     time_vals = data[time_dim].values
     n_frames = min(len(time_vals), 10)  # Limit to 10 frames for faster generation
 
-    # Set up the figure - smaller size for tighter zoom
-    fig, ax = plt.subplots(figsize=(8, 6))
+    # Set up the figure - smaller size for tighter zoom. Figures are built with
+    # the object-oriented API so concurrent tool threads never share pyplot's
+    # global current figure
+    fig = Figure(figsize=(8, 6))
+    ax = fig.add_subplot()
 
     # Handle units (e.g., Kelvin to Celsius for temperature)
     units = var_data.attrs.get("units", "")
     display_units = units
-    if units == "K" and "temperature" in var_name.lower():
+    # Decided once, not per frame
+    to_celsius = units == "K" and "temperature" in var_name.lower()
+    if to_celsius:
         display_units = "°C"
 
     # Create colormap
-    cmap = plt.get_cmap("RdYlBu_r")  # Red-Yellow-Blue reversed (warm=cold)
+    cmap = colormaps["RdYlBu_r"]  # Red-Yellow-Blue reversed (warm=cold)
 
     # Get data for first frame to set up colorbar
     first_frame_data = var_data.isel({time_dim: 0})
     plot_data = first_frame_data.values
-    if units == "K" and "temperature" in var_name.lower():
+    if to_celsius:
         plot_data = plot_data - 273.15
 
     # Create initial plot with colorbar - reduce shrink for tighter layout
     im = ax.imshow(plot_data, cmap=cmap, aspect="auto", origin="upper")
-    cbar = plt.colorbar(im, ax=ax, shrink=0.85)
+    cbar = fig.colorbar(im, ax=ax, shrink=0.85)
     cbar.set_label(f"{var_name} ({display_units})")
 
     def animate(frame_idx: int) -> list:
@@ -758,7 +833,7 @@ def _create_zarr_animation(
 
         # Handle units conversion
         plot_data = frame_data.values
-        if units == "K" and "temperature" in var_name.lower():
+        if to_celsius:
             plot_data = plot_data - 273.15
 
         # Create heatmap - use origin="upper" for north-up orientation
@@ -779,9 +854,8 @@ def _create_zarr_animation(
     anim = animation.FuncAnimation(fig, animate, frames=frame_indices, interval=500, blit=False)
 
     # Save as GIF - use tight layout like static plots
-    plt.tight_layout()
+    fig.tight_layout()
     anim.save(output_path, writer="pillow", fps=2, dpi=100)
-    plt.close(fig)
 
 
 def _create_spatial_snapshot(
@@ -812,25 +886,28 @@ def _create_spatial_snapshot(
     None
         Visualization is saved to the specified output path
     """
-    import matplotlib.pyplot as plt
+    from matplotlib import colormaps
+    from matplotlib.figure import Figure
 
-    fig, ax = plt.subplots(figsize=(10, 8))
+    fig = Figure(figsize=(10, 8))
+    ax = fig.add_subplot()
 
     # Handle units (e.g., Kelvin to Celsius for temperature)
     units = var_data.attrs.get("units", "")
     display_units = units
     plot_data = var_data.values
-    if units == "K" and "temperature" in var_name.lower():
+    var_name_lower = var_name.lower()
+    if units == "K" and "temperature" in var_name_lower:
         plot_data = plot_data - 273.15
         display_units = "°C"
 
     # Create colormap - use appropriate colors for different variables
-    if "temperature" in var_name.lower():
-        cmap = plt.get_cmap("RdYlBu_r")  # Warm colors for temperature
-    elif "precipitation" in var_name.lower() or "pr" in var_name.lower():
-        cmap = plt.get_cmap("Blues")  # Blue for precipitation
+    if "temperature" in var_name_lower:
+        cmap = colormaps["RdYlBu_r"]  # Warm colors for temperature
+    elif "precipitation" in var_name_lower or "pr" in var_name_lower:
+        cmap = colormaps["Blues"]  # Blue for precipitation
     else:
-        cmap = plt.get_cmap("viridis")  # Default
+        cmap = colormaps["viridis"]  # Default
 
     # Get 2D slice if needed
     if plot_data.ndim > 2:
@@ -839,7 +916,7 @@ def _create_spatial_snapshot(
                 plot_data = plot_data[0]  # Take first slice of extra dims
 
     im = ax.imshow(plot_data, cmap=cmap, aspect="auto", origin="upper")
-    cbar = plt.colorbar(im, ax=ax, shrink=0.85)
+    cbar = fig.colorbar(im, ax=ax, shrink=0.85)
     cbar.set_label(f"{var_name} ({display_units})")
 
     # Create title
@@ -851,9 +928,8 @@ def _create_spatial_snapshot(
     ax.set_title(title, fontsize=14, fontweight="bold")
     ax.axis("off")
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches="tight")
-    plt.close(fig)
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=150, bbox_inches="tight")
 
 
 def _create_spatial_plot(
@@ -881,9 +957,10 @@ def _create_spatial_plot(
     None
         Visualization is saved to the specified output path
     """
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
 
-    _fig, ax = plt.subplots(figsize=(10, 8))
+    fig = Figure(figsize=(10, 8))
+    ax = fig.add_subplot()
 
     # Get 2D slice if needed
     plot_data = var_data
@@ -894,11 +971,10 @@ def _create_spatial_plot(
                 plot_data = plot_data.isel({dim: 0})
 
     im = ax.imshow(plot_data.values, aspect="auto", cmap="viridis", origin="upper")
-    plt.colorbar(im, ax=ax, label=var_data.attrs.get("units", ""))
+    fig.colorbar(im, ax=ax, label=var_data.attrs.get("units", ""))
 
     ax.set_title(f"{collection.upper()}: {var_name}", fontsize=14, fontweight="bold")
     ax.axis("off")
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=150, bbox_inches="tight")
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=150, bbox_inches="tight")
@@ -2,19 +2,25 @@
 Download geometries tool for vector/GeoParquet data.
 """
 
+import threading
 from pathlib import Path
 from typing import Any
 
 import geopandas as gpd
-import matplotlib.pyplot as plt
+import pandas as pd
 import planetary_computer as pc
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from pystac import Item
 from pystac_client import Client
+from shapely import STRtree
 from shapely.geometry import box
 
 from ..core import (
     place_to_bbox,
     validate_bbox,
 )
+from ..core.stac_client import stac_client
 from ..core.vector_utils import (
     get_vector_metadata,
     query_geoparquet_by_quadkey,
@@ -32,6 +38,24 @@ QUADKEY_COLLECTIONS = {
     }
 }
 
+# Approximate extents of the MS Buildings regions queried directly by quadkey;
+# bboxes outside them discover their regions through STAC instead
+REGION_BOUNDS = {
+    "United States": (-125.0, 24.5, -66.9, 49.4),
+    "Canada": (-141.0, 41.7, -52.6, 83.1),
+    "Mexico": (-118.4, 14.5, -86.7, 32.7),
+}
+_REGION_NAMES = list(REGION_BOUNDS)
+_REGION_TREE = STRtree([box(*bounds) for bounds in REGION_BOUNDS.values()])
+
+# Per-thread reusable figure for vector previews (figure creation dominates
+# the cost of small previews; one figure per thread keeps callers isolated)
+_VECTOR_FIGURE = threading.local()
+
+# Unsigned item per quadkey collection, only used for its collection-wide
+# storage credentials (bounded by the keys of QUADKEY_COLLECTIONS)
+_CREDENTIAL_ITEMS: dict[str, Item] = {}
+
 
 def download_geometries(
     collection: str,
@@ -126,26 +150,18 @@ def _download_quadkey_collection(collection: str, bbox: list[float]) -> gpd.GeoD
     if not config:
         return _download_quadkey_via_stac(collection, bbox)
 
-    # Determine regions for bbox
+    # Determine regions for bbox; unknown areas find their regions via STAC
     regions = _get_regions_for_bbox(bbox)
+    if not regions:
+        return _download_quadkey_via_stac(collection, bbox)
 
-    # Get SAS token via targeted STAC item search (one item)
-    catalog_url = "https://planetarycomputer.microsoft.com/api/stac/v1"
-    client = Client.open(catalog_url)
-
-    # Search for one item to get credentials (faster than intersects query)
-    search = client.search(
-        collections=[collection],
-        bbox=bbox,
-        limit=1,
-    )
-
-    items = list(search.items())
-    if not items:
+    # Get SAS token via a one-item STAC search (cached per collection)
+    item = _search_credential_item(collection)
+    if item is None:
         return gpd.GeoDataFrame()
 
-    # Sign to get SAS token
-    signed_item = pc.sign(items[0])
+    # Sign to get SAS token (planetary_computer handles token expiry)
+    signed_item = pc.sign(item)
     if "data" not in signed_item.assets:
         return _download_quadkey_via_stac(collection, bbox)
 
@@ -170,17 +186,42 @@ def _download_quadkey_collection(collection: str, bbox: list[float]) -> gpd.GeoD
     if not all_gdfs:
         return gpd.GeoDataFrame()
 
-    import pandas as pd
-
     return gpd.GeoDataFrame(pd.concat(all_gdfs, ignore_index=True), crs="EPSG:4326")
 
 
+def _search_credential_item(collection: str) -> Item | None:
+    """
+    Find one STAC item for a collection, used only to obtain storage credentials.
+
+    The credentials are collection-wide (``table:storage_options``), so any
+    item will do and it is cached per collection; repeated downloads skip the
+    STAC round-trip whatever their AOI. Empty searches are not cached. The
+    returned item is unsigned; callers sign a copy on each use.
+
+    Parameters
+    ----------
+    collection : str
+        Collection ID
+
+    Returns
+    -------
+    Item or None
+        A STAC item of the collection, or None if the search is empty
+    """
+    item = _CREDENTIAL_ITEMS.get(collection)
+    if item is None:
+        search = stac_client.client.search(collections=[collection], limit=1, max_items=1)
+        item = next(search.items(), None)
+        if item is not None:
+            _CREDENTIAL_ITEMS[collection] = item
+    return item
+
+
 def _get_regions_for_bbox(bbox: list[float]) -> list[str]:
     """
     Get MS Buildings region names that may contain the bbox.
 
-    For now, uses simple heuristics. Could be enhanced with proper
-    reverse geocoding.
+    Looks the bbox up in an STRtree of ``REGION_BOUNDS``.
 
     Parameters
     ----------
@@ -190,26 +231,11 @@ def _get_regions_for_bbox(bbox: list[float]) -> list[str]:
     Returns
     -------
     list[str]
-        List of region names to query
+        List of region names to query, empty if the bbox is outside all
+        known regions
     """
-    west, south, east, north = bbox
-
-    regions = []
-
-    # North America
-    if -170 < west < -50 and 24 < north < 72:
-        if south > 24 and north < 50 and west > -130:
-            regions.append("United States")
-        if north > 41 and west < -52:
-            regions.append("Canada")
-        if south < 33 and west > -118 and east < -86:
-            regions.append("Mexico")
-
-    # If no match, default to US (most common case)
-    if not regions:
-        regions = ["United States"]
-
-    return regions
+    idx = _REGION_TREE.query(box(*bbox), predicate="intersects")
+    return [_REGION_NAMES[i] for i in sorted(idx)]
 
 
 def _download_quadkey_via_stac(collection: str, bbox: list[float]) -> gpd.GeoDataFrame:
@@ -270,8 +296,6 @@ def _download_quadkey_via_stac(collection: str, bbox: list[float]) -> gpd.GeoDat
     if not all_gdfs:
         return gpd.GeoDataFrame()
 
-    import pandas as pd
-
     return gpd.GeoDataFrame(pd.concat(all_gdfs, ignore_index=True), crs="EPSG:4326")
 
 
@@ -318,6 +342,31 @@ def _download_stac_collection(collection: str, bbox: list[float]) -> gpd.GeoData
     return query_geoparquet_from_items(signed_items, bbox, storage_options)
 
 
+def _get_vector_figure() -> tuple[Figure, Axes]:
+    """
+    Get this thread's reusable preview figure with cleared axes.
+
+    Uses the object-oriented ``Figure`` API so the figure is never registered
+    with pyplot's global figure manager and is not shared across threads.
+
+    Returns
+    -------
+    tuple[Figure, Axes]
+        Figure and its single (cleared) axes
+    """
+    fig = getattr(_VECTOR_FIGURE, "fig", None)
+    if fig is None:
+        fig = Figure(figsize=(10, 10))
+        fig.add_subplot()
+        # Remove all padding/margins
+        fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
+        _VECTOR_FIGURE.fig = fig
+
+    ax = fig.axes[0]
+    ax.clear()
+    return fig, ax
+
+
 def _create_vector_visualization(gdf: gpd.GeoDataFrame, output_path: str, bbox: list[float]) -> str:
     """
     Create visualization for vector data with basemap.
@@ -338,7 +387,7 @@ def _create_vector_visualization(gdf: gpd.GeoDataFrame, output_path: str, bbox:
     """
     import contextily as cx
 
-    fig, ax = plt.subplots(figsize=(10, 10))
+    fig, ax = _get_vector_figure()
 
     if len(gdf) > 0:
         # Reproject to Web Mercator for basemap compatibility
@@ -368,9 +417,6 @@ def _create_vector_visualization(gdf: gpd.GeoDataFrame, output_path: str, bbox:
     ax.set_aspect("equal")
     ax.axis("off")
 
-    # Remove all padding/margins
-    plt.subplots_adjust(left=0, right=1, top=1, bottom=0)
     fig.savefig(output_path, bbox_inches="tight", pad_inches=0, dpi=150, format="jpeg")
-    plt.close(fig)
 
     return output_path
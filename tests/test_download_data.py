@@ -654,6 +654,49 @@ def test_create_zarr_animation(mock_zarr_dataset):
     assert output_path.suffix == ".gif"
 
 
+@pytest.mark.fast
+def test_zarr_previews_concurrent(mock_zarr_dataset, tmp_path):
+    """Test Zarr previews render concurrently without pyplot's global figures.
+
+    Parameters
+    ----------
+    mock_zarr_dataset : xr.Dataset
+        Mock dataset fixture
+    tmp_path : Path
+        Pytest temporary directory
+
+    Returns
+    -------
+    None
+        Test passes if every preview is written from worker threads and no
+        figure is registered with pyplot
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    import matplotlib.pyplot as plt
+
+    from planetary_computer_mcp.tools.download_data import (
+        _create_spatial_plot,
+        _create_spatial_snapshot,
+    )
+
+    var_data = mock_zarr_dataset["tmmx"].isel(time=0)
+    paths = [tmp_path / f"preview-{i}.jpg" for i in range(8)]
+
+    def render(i: int) -> None:
+        if i % 2:
+            _create_spatial_plot(var_data, str(paths[i]), "tmmx", "test-collection")
+        else:
+            _create_spatial_snapshot(var_data, str(paths[i]), "tmmx", "test-collection")
+
+    figures_before = plt.get_fignums()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(render, range(len(paths))))
+
+    assert all(path.stat().st_size > 0 for path in paths)
+    assert plt.get_fignums() == figures_before
+
+
 @pytest.mark.fast
 def test_get_adaptive_search_limit():
     """Test adaptive search limit based on AOI size.
@@ -665,12 +708,12 @@ def test_get_adaptive_search_limit():
     """
     from planetary_computer_mcp.tools.download_data import get_adaptive_search_limit
 
-    # Small AOI: 1 item
-    assert get_adaptive_search_limit(5) == 1
+    # Small AOI: enough items to cover a tile corner
+    assert get_adaptive_search_limit(5) == 4
 
     # Medium AOI: more items
-    assert get_adaptive_search_limit(30) == 2
-    assert get_adaptive_search_limit(75) == 5
+    assert get_adaptive_search_limit(30) == 4
+    assert get_adaptive_search_limit(75) == 6
 
     # Large AOI: max items
     assert get_adaptive_search_limit(300) == 10
@@ -678,3 +721,112 @@ def test_get_adaptive_search_limit():
 
     # Very large AOI: cap at max
     assert get_adaptive_search_limit(2000) == 20
+
+
+@pytest.mark.fast
+def test_select_latest_acquisition():
+    """Test only items from the most recent solar day are kept.
+
+    Returns
+    -------
+    None
+        Test passes if older scenes are dropped, an overpass crossing UTC
+        midnight stays together, and undated items pass through
+    """
+    from datetime import UTC, datetime
+
+    from pystac import Item
+
+    from planetary_computer_mcp.tools.download_data import select_latest_acquisition
+
+    def make_item(item_id: str, dt: datetime | None, lon: float | None = None) -> Item:
+        props = (
+            {}
+            if dt
+            else {"start_datetime": "2021-01-01T00:00:00Z", "end_datetime": "2021-12-31T00:00:00Z"}
+        )
+        bbox = [lon - 0.5, 34.0, lon + 0.5, 35.0] if lon is not None else None
+        return Item(id=item_id, geometry=None, bbox=bbox, datetime=dt, properties=props)
+
+    items = [
+        make_item("tile-a", datetime(2024, 7, 20, 18, 40)),
+        make_item("tile-b", datetime(2024, 7, 20, 18, 41)),
+        make_item("older", datetime(2024, 7, 15, 18, 40)),
+    ]
+    assert [i.id for i in select_latest_acquisition(items)] == ["tile-a", "tile-b"]
+
+    # Afternoon pass at 120°W: both tiles are 2024-07-20 local, split in UTC
+    items = [
+        make_item("tile-a", datetime(2024, 7, 20, 23, 59, tzinfo=UTC), lon=-120),
+        make_item("tile-b", datetime(2024, 7, 21, 0, 1, tzinfo=UTC), lon=-120),
+        make_item("older", datetime(2024, 7, 15, 23, 59, tzinfo=UTC), lon=-120),
+    ]
+    assert [i.id for i in select_latest_acquisition(items)] == ["tile-a", "tile-b"]
+
+    undated = [make_item("static", None)]
+    assert select_latest_acquisition(undated) == undated
+
+
+@pytest.mark.fast
+def test_get_regions_for_bbox():
+    """Test MS Buildings region lookup for bboxes inside, across and outside regions.
+
+    Returns
+    -------
+    None
+        Test passes if intersecting regions are returned in table order
+    """
+    from planetary_computer_mcp.tools.download_geometries import _get_regions_for_bbox
+
+    assert _get_regions_for_bbox([-122.5, 37.7, -122.3, 37.9]) == ["United States"]
+    assert _get_regions_for_bbox([-123.5, 48.5, -122.5, 49.5]) == ["United States", "Canada"]
+    assert _get_regions_for_bbox([-99.3, 19.3, -99.0, 19.5]) == ["Mexico"]
+    assert _get_regions_for_bbox([2.2, 48.8, 2.4, 48.9]) == []
+
+
+@pytest.mark.fast
+def test_search_credential_item_cached_per_collection(monkeypatch):
+    """Test the credential item is cached per collection but empty searches are not.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+
+    Returns
+    -------
+    None
+        Test passes if an empty search is retried and a found item is reused
+    """
+    from types import SimpleNamespace
+    from typing import Any
+
+    from pystac import Item
+
+    from planetary_computer_mcp.tools import download_geometries
+
+    item = Item(
+        id="united-states",
+        geometry=None,
+        bbox=None,
+        datetime=pd.Timestamp("2022-07-06"),
+        properties={},
+    )
+    results = [[], [item]]
+    searches = []
+
+    def search(**kwargs: Any) -> SimpleNamespace:
+        searches.append(kwargs)
+        found = results[min(len(searches), len(results)) - 1]
+        return SimpleNamespace(items=lambda: iter(found))
+
+    monkeypatch.setitem(
+        download_geometries.stac_client.__dict__, "client", SimpleNamespace(search=search)
+    )
+    monkeypatch.setattr(download_geometries, "_CREDENTIAL_ITEMS", {})
+
+    assert download_geometries._search_credential_item("ms-buildings") is None
+    assert download_geometries._search_credential_item("ms-buildings") is item
+    assert download_geometries._search_credential_item("ms-buildings") is item
+    assert len(searches) == 2
+    assert searches[0]["collections"] == ["ms-buildings"]
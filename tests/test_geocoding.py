@@ -0,0 +1,157 @@
+"""
+Fast unit tests for geocoding utilities.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.mark.fast
+def test_place_to_bbox_cache(tmp_path):
+    """Test geocoding results are cached and the cache can be cleared.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory
+
+    Returns
+    -------
+    None
+        Test passes if Nominatim is only called once per place name
+    """
+    from planetary_computer_mcp.core import geocoding
+    from planetary_computer_mcp.core.cache import _LRUCache
+
+    location = MagicMock()
+    location.raw = {"boundingbox": ["29.22", "29.76", "-98.79", "-98.28"]}
+    geocode = MagicMock(return_value=location)
+
+    with (
+        patch.object(geocoding, "CACHE_DIR", tmp_path),
+        patch.object(geocoding, "_MEMORY_CACHE", _LRUCache(8)),
+        patch.object(geocoding, "_get_geocoder", return_value=geocode),
+    ):
+        first = geocoding.place_to_bbox("San Antonio")
+        geocoding._MEMORY_CACHE.clear()  # force a read from disk
+        second = geocoding.place_to_bbox("  san   antonio ")
+
+        assert first == second == [-98.79, 29.22, -98.28, 29.76]
+        assert geocode.call_count == 1
+
+        stats = geocoding.get_cache_stats()
+        assert stats["entries"] == stats["valid_entries"] == 1
+
+        assert geocoding.clear_geocoding_cache() == 1
+        assert geocoding.get_cache_stats()["entries"] == 0
+
+        geocoding.place_to_bbox("San Antonio")
+        assert geocode.call_count == 2
+
+
+@pytest.mark.fast
+def test_bbox_batch_helpers():
+    """Test batch bbox validation and area match the scalar versions.
+
+    Returns
+    -------
+    None
+        Test passes if areas agree and invalid rows are reported
+    """
+    import numpy as np
+
+    from planetary_computer_mcp.core.geocoding import (
+        calculate_bbox_area_km2,
+        calculate_bbox_area_km2_batch,
+        validate_bbox,
+        validate_bbox_batch,
+    )
+
+    bboxes = np.array(
+        [
+            [-98.79, 29.22, -98.28, 29.76],
+            [-74.26, 40.50, -73.70, 40.92],
+            [10.0, -60.0, 12.0, -58.0],
+        ]
+    )
+
+    areas = calculate_bbox_area_km2_batch(validate_bbox_batch(bboxes))
+    np.testing.assert_allclose(areas, [calculate_bbox_area_km2(list(b)) for b in bboxes])
+
+    bad = bboxes.copy()
+    bad[2, 3] = 95.0
+    with pytest.raises(ValueError, match=r"Latitude must be between -90 and 90 \(bbox 2\)"):
+        validate_bbox_batch(bad)
+
+    with pytest.raises(ValueError, match="shape"):
+        validate_bbox_batch(bboxes[:, :3])
+
+    # NaN coordinates fail with the same message as the scalar check
+    for column, message in [(0, "Longitude"), (3, "Latitude")]:
+        nan = bboxes.copy()
+        nan[1, column] = np.nan
+        with pytest.raises(ValueError, match=message):
+            validate_bbox(list(nan[1]))
+        with pytest.raises(ValueError, match=rf"{message} must be between .* \(bbox 1\)"):
+            validate_bbox_batch(nan)
+
+
+@pytest.mark.fast
+def test_place_to_bbox_concurrent_coalescing(tmp_path):
+    """Test concurrent lookups of one place geocode it only once.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory
+
+    Returns
+    -------
+    None
+        Test passes if Nominatim is called once for eight concurrent lookups
+    """
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from planetary_computer_mcp.core import geocoding
+    from planetary_computer_mcp.core.cache import _LRUCache
+
+    location = MagicMock()
+    location.raw = {"boundingbox": ["29.22", "29.76", "-98.79", "-98.28"]}
+
+    def slow_geocode(*args: object, **kwargs: object) -> MagicMock:
+        time.sleep(0.05)
+        return location
+
+    geocode = MagicMock(side_effect=slow_geocode)
+
+    with (
+        patch.object(geocoding, "CACHE_DIR", tmp_path),
+        patch.object(geocoding, "_MEMORY_CACHE", _LRUCache(8)),
+        patch.object(geocoding, "_get_geocoder", return_value=geocode),
+        ThreadPoolExecutor(max_workers=8) as pool,
+    ):
+        results = list(pool.map(geocoding.place_to_bbox, ["San Antonio"] * 8))
+
+    assert all(bbox == [-98.79, 29.22, -98.28, 29.76] for bbox in results)
+    assert geocode.call_count == 1
+
+
+@pytest.mark.fast
+def test_get_default_time_range():
+    """Test the default time range ends today and spans the requested days.
+
+    Returns
+    -------
+    None
+        Test passes if the range matches a freshly formatted one
+    """
+    from datetime import date, timedelta
+
+    from planetary_computer_mcp.core.geocoding import get_default_time_range
+
+    today = date.today()
+    expected = f"{today - timedelta(days=7):%Y-%m-%d}/{today:%Y-%m-%d}"
+    assert get_default_time_range(days=7) == expected
+    assert get_default_time_range(days=7) is get_default_time_range(days=7)
@@ -0,0 +1,301 @@
+"""
+Fast unit tests for raster utilities.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import rioxarray  # noqa: F401
+import xarray as xr
+
+
+@pytest.fixture
+def mock_raster_dataset():
+    """Create a georeferenced mock raster Dataset.
+
+    Returns
+    -------
+    xr.Dataset
+        Mock dataset with two bands on a regular EPSG:4326 grid
+    """
+    res = 0.001
+    x = -118.3 + res / 2 + np.arange(40) * res
+    y = 34.1 - res / 2 - np.arange(30) * res
+    time = pd.date_range("2024-06-01", periods=1, freq="D")
+    rng = np.random.default_rng(0)
+
+    ds = xr.Dataset(
+        {
+            "B04": (["time", "y", "x"], rng.integers(0, 10000, (1, 30, 40), dtype=np.uint16)),
+            "B03": (["time", "y", "x"], rng.integers(0, 10000, (1, 30, 40), dtype=np.uint16)),
+        },
+        coords={"time": time, "y": y, "x": x},
+    )
+    return ds.rio.write_crs("EPSG:4326")
+
+
+@pytest.mark.fast
+def test_get_raster_metadata_matches_rio(mock_raster_dataset):
+    """Test raster metadata bounds/resolution match rioxarray's own values.
+
+    Parameters
+    ----------
+    mock_raster_dataset : xr.Dataset
+        Mock raster dataset fixture
+
+    Returns
+    -------
+    None
+        Test passes if metadata agrees with rio.bounds()/rio.resolution()
+    """
+    from planetary_computer_mcp.core.raster_utils import get_raster_metadata
+
+    metadata = get_raster_metadata(mock_raster_dataset)
+    band = mock_raster_dataset["B04"]
+
+    np.testing.assert_allclose(metadata["bounds"], band.rio.bounds())
+    np.testing.assert_allclose(metadata["resolution"], band.rio.resolution())
+    assert metadata["crs"] == "EPSG:4326"
+    assert metadata["shape"] == (1, 30, 40)
+    assert metadata["bands"] == ["B04", "B03"]
+
+
+@pytest.fixture
+def tiled_geotiff(tmp_path):
+    """Create a tiled multi-band GeoTIFF standing in for a COG asset.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory
+
+    Returns
+    -------
+    tuple[str, np.ndarray]
+        Path to the GeoTIFF and the array written to it
+    """
+    import rasterio
+    from rasterio.transform import from_origin
+
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 255, (4, 1000, 800), dtype=np.uint8)
+    path = tmp_path / "naip.tif"
+    profile = {
+        "driver": "GTiff",
+        "width": 800,
+        "height": 1000,
+        "count": 4,
+        "dtype": "uint8",
+        "crs": "EPSG:4326",
+        "transform": from_origin(-118.3, 34.1, 0.0001, 0.0001),
+        "tiled": True,
+        "blockxsize": 256,
+        "blockysize": 256,
+        "nodata": 0,
+    }
+    with rasterio.open(path, "w", **profile) as dst:
+        dst.write(data)
+    return str(path), data
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("chunk_bytes", [32 * 1024 * 1024, 256 * 256 * 4, 2 * 256 * 256 * 4])
+def test_download_multiband_to_geotiff_bbox(tiled_geotiff, tmp_path, monkeypatch, chunk_bytes):
+    """Test a bbox cutout spanning several blocks is read exactly into a COG.
+
+    Parameters
+    ----------
+    tiled_geotiff : tuple[str, np.ndarray]
+        Tiled GeoTIFF fixture
+    tmp_path : Path
+        Pytest temporary directory
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+    chunk_bytes : int
+        Read chunk budget (one read, one block, or two blocks per chunk)
+
+    Returns
+    -------
+    None
+        Test passes if the output and reported bounds match the source pixels under the bbox
+    """
+    import rasterio
+    from pystac import Asset, Item
+
+    from planetary_computer_mcp.core import raster_utils
+    from planetary_computer_mcp.core.raster_utils import download_multiband_to_geotiff
+
+    monkeypatch.setattr(raster_utils, "READ_CHUNK_BYTES", chunk_bytes)
+    href, data = tiled_geotiff
+    item = Item(
+        id="naip", geometry=None, bbox=None, datetime=pd.Timestamp("2024-06-01"), properties={}
+    )
+    item.add_asset("image", Asset(href=href))
+
+    output_path = str(tmp_path / "out.tif")
+    bbox = [-118.28, 34.03, -118.25, 34.08]
+    metadata = download_multiband_to_geotiff(
+        [item], "image", output_path, bbox=bbox, band_names=["red", "green", "blue", "nir"]
+    )
+
+    # Pixel rows/cols covered by the bbox on the 0.0001° grid
+    rows = slice(round((34.1 - 34.08) / 0.0001), round((34.1 - 34.03) / 0.0001))
+    cols = slice(round((-118.28 + 118.3) / 0.0001), round((-118.25 + 118.3) / 0.0001))
+
+    with rasterio.open(output_path) as src:
+        np.testing.assert_array_equal(src.read(), data[:, rows, cols])
+        assert src.descriptions == ("red", "green", "blue", "nir")
+        assert src.tags(ns="IMAGE_STRUCTURE")["LAYOUT"] == "COG"
+        assert src.nodata == 0
+        assert src.compression.name == "zstd"
+        written_bounds = tuple(src.bounds)
+
+    np.testing.assert_allclose(metadata["bounds"], written_bounds)
+    assert metadata["shape"] == (rows.stop - rows.start, cols.stop - cols.start)
+    assert metadata["bands"] == ["red", "green", "blue", "nir"]
+
+
+@pytest.mark.fast
+def test_download_multiband_to_geotiff_overview(tiled_geotiff, tmp_path):
+    """Test overview reads use the stored overview IFD and its transform.
+
+    Parameters
+    ----------
+    tiled_geotiff : tuple[str, np.ndarray]
+        Tiled GeoTIFF fixture
+    tmp_path : Path
+        Pytest temporary directory
+
+    Returns
+    -------
+    None
+        Test passes if the output matches the overview pixels under the bbox
+    """
+    import rasterio
+    from pystac import Asset, Item
+    from rasterio.enums import Resampling
+
+    from planetary_computer_mcp.core.raster_utils import download_multiband_to_geotiff
+
+    href, _ = tiled_geotiff
+    with rasterio.open(href, "r+") as dst:
+        dst.build_overviews([2, 4], Resampling.average)
+    with rasterio.open(href, OVERVIEW_LEVEL=1) as src:
+        overview = src.read()
+
+    item = Item(
+        id="naip", geometry=None, bbox=None, datetime=pd.Timestamp("2024-06-01"), properties={}
+    )
+    item.add_asset("image", Asset(href=href))
+
+    output_path = str(tmp_path / "out.tif")
+    bbox = [-118.28, 34.02, -118.24, 34.08]
+    metadata = download_multiband_to_geotiff(
+        [item], "image", output_path, bbox=bbox, overview_level=4
+    )
+
+    # Pixel rows/cols covered by the bbox on the 0.0004° overview grid
+    rows = slice(round((34.1 - 34.08) / 0.0004), round((34.1 - 34.02) / 0.0004))
+    cols = slice(round((-118.28 + 118.3) / 0.0004), round((-118.24 + 118.3) / 0.0004))
+
+    with rasterio.open(output_path) as src:
+        np.testing.assert_array_equal(src.read(), overview[:, rows, cols])
+        np.testing.assert_allclose(src.res, (0.0004, 0.0004))
+        assert src.transform.c == pytest.approx(-118.28)
+        assert src.transform.f == pytest.approx(34.08)
+        written_bounds = tuple(src.bounds)
+
+    np.testing.assert_allclose(metadata["bounds"], written_bounds)
+    assert metadata["overview_level"] == 4
+    np.testing.assert_allclose(metadata["resolution"], (0.0004, 0.0004))
+
+
+@pytest.mark.fast
+def test_get_wgs84_transformer_matches_rasterio():
+    """Test the cached transformer reprojects bounds like rasterio's transform_bounds.
+
+    Returns
+    -------
+    None
+        Test passes if bounds agree and the transformer is reused
+    """
+    from rasterio.crs import CRS
+    from rasterio.warp import transform_bounds
+
+    from planetary_computer_mcp.core.raster_utils import _get_wgs84_transformer
+
+    utm = CRS.from_epsg(32611)
+    bbox = (-118.3, 34.0, -118.2, 34.1)
+
+    transformer = _get_wgs84_transformer(utm.to_wkt())
+    np.testing.assert_allclose(
+        transformer.transform_bounds(*bbox), transform_bounds(CRS.from_epsg(4326), utm, *bbox)
+    )
+    assert _get_wgs84_transformer(utm.to_wkt()) is transformer
+
+
+@pytest.mark.fast
+def test_download_multiband_to_geotiff_outside_bbox(tiled_geotiff, tmp_path):
+    """Test bboxes are clipped to the asset footprint before reading.
+
+    Parameters
+    ----------
+    tiled_geotiff : tuple[str, np.ndarray]
+        Tiled GeoTIFF fixture
+    tmp_path : Path
+        Pytest temporary directory
+
+    Returns
+    -------
+    None
+        Test passes if partial overlaps are clipped and disjoint bboxes raise
+    """
+    from pystac import Asset, Item
+
+    from planetary_computer_mcp.core.raster_utils import download_multiband_to_geotiff
+
+    href, _ = tiled_geotiff
+    item = Item(
+        id="naip", geometry=None, bbox=None, datetime=pd.Timestamp("2024-06-01"), properties={}
+    )
+    item.add_asset("image", Asset(href=href))
+    output_path = str(tmp_path / "out.tif")
+
+    # Extends 0.01° past the west edge; no stored overview, so decimated read
+    metadata = download_multiband_to_geotiff(
+        [item], "image", output_path, bbox=[-118.31, 34.05, -118.28, 34.08], overview_level=2
+    )
+    assert metadata["shape"] == (150, 100)
+
+    with pytest.raises(ValueError, match="does not intersect"):
+        download_multiband_to_geotiff(
+            [item], "image", output_path, bbox=[-117.0, 35.0, -116.9, 35.1], overview_level=2
+        )
+
+
+@pytest.mark.fast
+def test_save_raster_as_geotiff_dask(mock_raster_dataset, tmp_path):
+    """Test dask-backed rasters are written chunk-parallel with identical pixels.
+
+    Parameters
+    ----------
+    mock_raster_dataset : xr.Dataset
+        Mock raster dataset fixture
+    tmp_path : Path
+        Pytest temporary directory
+
+    Returns
+    -------
+    None
+        Test passes if the written bands match the in-memory data
+    """
+    import rasterio
+
+    from planetary_computer_mcp.core.raster_utils import save_raster_as_geotiff
+
+    chunked = mock_raster_dataset.chunk({"x": 16, "y": 16})
+    output_path = save_raster_as_geotiff(chunked, str(tmp_path / "dask.tif"))
+
+    with rasterio.open(output_path) as src:
+        np.testing.assert_array_equal(src.read(1), mock_raster_dataset["B04"].values[0])
+        np.testing.assert_array_equal(src.read(2), mock_raster_dataset["B03"].values[0])
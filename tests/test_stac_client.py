@@ -0,0 +1,141 @@
+"""
+Fast unit tests for the STAC client wrapper.
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pystac import Item
+
+
+@pytest.fixture
+def mock_stac():
+    """Create a PlanetaryComputerSTAC with a mocked pystac-client Client.
+
+    Returns
+    -------
+    PlanetaryComputerSTAC
+        Wrapper whose search returns a single asset-less item
+    """
+    from planetary_computer_mcp.core.stac_client import PlanetaryComputerSTAC
+
+    item = Item(
+        id="test-item",
+        geometry=None,
+        bbox=None,
+        datetime=datetime(2024, 6, 1),
+        properties={},
+    )
+
+    client = MagicMock()
+    client.search.return_value.items.side_effect = lambda: iter([item])
+
+    stac = PlanetaryComputerSTAC()
+    stac.client = client
+    return stac
+
+
+@pytest.mark.fast
+def test_search_items_cache(mock_stac, tmp_path):
+    """Test repeated searches are served from the on-disk cache.
+
+    Parameters
+    ----------
+    mock_stac : PlanetaryComputerSTAC
+        Mocked STAC wrapper fixture
+    tmp_path : Path
+        Pytest temporary directory
+
+    Returns
+    -------
+    None
+        Test passes if the STAC API is only hit once for identical searches
+    """
+    with patch("planetary_computer_mcp.core.stac_client.SEARCH_CACHE_DIR", tmp_path):
+        kwargs = {
+            "collections": ["sentinel-2-l2a"],
+            "bbox": [-118.3, 34.0, -118.2, 34.1],
+            "datetime": "2024-06-01/2024-06-30",
+        }
+        first = mock_stac.search_items(**kwargs)
+        second = mock_stac.search_items(**kwargs)
+
+        assert mock_stac.client.search.call_count == 1
+        assert [i.id for i in first] == [i.id for i in second] == ["test-item"]
+        # Written via a temp file renamed into place, none left behind
+        assert not list(tmp_path.glob("*.tmp"))
+
+        mock_stac.search_items(**kwargs, use_cache=False)
+        assert mock_stac.client.search.call_count == 2
+
+
+@pytest.mark.fast
+def test_client_opened_lazily():
+    """Test the STAC API client is only opened on first access.
+
+    Returns
+    -------
+    None
+        Test passes if construction makes no request and the client is reused
+    """
+    from planetary_computer_mcp.core.stac_client import PlanetaryComputerSTAC
+
+    with patch("planetary_computer_mcp.core.stac_client.Client.open") as client_open:
+        stac = PlanetaryComputerSTAC()
+        client_open.assert_not_called()
+
+        assert stac.client is stac.client
+        client_open.assert_called_once()
+        assert client_open.call_args.kwargs["stac_io"] is not None
+
+
+@pytest.mark.fast
+def test_get_collections_info_order(mock_stac):
+    """Test batched collection info preserves the requested order.
+
+    Parameters
+    ----------
+    mock_stac : PlanetaryComputerSTAC
+        Mocked STAC wrapper fixture
+
+    Returns
+    -------
+    None
+        Test passes if one request is made per collection, returned in order
+    """
+
+    def get_collection(collection_id: str) -> MagicMock:
+        collection = MagicMock(id=collection_id, title=collection_id.upper(), providers=None)
+        collection.extent.temporal = None
+        collection.extent.spatial = None
+        return collection
+
+    mock_stac.client.get_collection.side_effect = get_collection
+
+    ids = ["sentinel-2-l2a", "landsat-c2-l2", "naip", "cop-dem-glo-30"]
+    infos = mock_stac.get_collections_info(ids)
+
+    assert [info["id"] for info in infos] == ids
+    assert [info["title"] for info in infos] == [i.upper() for i in ids]
+    assert mock_stac.client.get_collection.call_count == len(ids)
+
+
+@pytest.mark.fast
+def test_core_exports_stac_client_instance():
+    """Test the package export stays the shared instance once the submodule loads.
+
+    Returns
+    -------
+    None
+        Test passes if ``core.stac_client`` is the PlanetaryComputerSTAC instance
+    """
+    import importlib
+
+    import planetary_computer_mcp.tools.download_data  # noqa: F401
+    from planetary_computer_mcp.core import PlanetaryComputerSTAC, stac_client
+
+    stac_module = importlib.import_module("planetary_computer_mcp.core.stac_client")
+
+    assert isinstance(stac_client, PlanetaryComputerSTAC)
+    assert stac_client is stac_module.stac_client
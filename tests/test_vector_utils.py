@@ -0,0 +1,569 @@
+"""
+Fast unit tests for GeoParquet vector utilities.
+"""
+
+import time
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+
+@pytest.fixture
+def bbox_table():
+    """Create a table with a GeoParquet bbox covering column.
+
+    Returns
+    -------
+    pa.Table
+        Table with an id column and a bbox struct column
+    """
+    bbox = pa.StructArray.from_arrays(
+        [
+            pa.array([0.0, 10.0, 20.0]),
+            pa.array([0.0, 10.0, 20.0]),
+            pa.array([1.0, 11.0, 21.0]),
+            pa.array([1.0, 11.0, 21.0]),
+        ],
+        names=["xmin", "ymin", "xmax", "ymax"],
+    )
+    return pa.table({"id": [0, 1, 2], "bbox": bbox})
+
+
+@pytest.mark.fast
+def test_bbox_filter_pushdown(bbox_table, tmp_path):
+    """Test bbox covering column filter keeps only intersecting rows.
+
+    Parameters
+    ----------
+    bbox_table : pa.Table
+        Table fixture with bbox covering column
+    tmp_path : Path
+        Pytest temporary directory
+
+    Returns
+    -------
+    None
+        Test passes if only the intersecting row is read
+    """
+    from planetary_computer_mcp.core.vector_utils import _bbox_filter, _has_bbox_column
+
+    path = tmp_path / "covered.parquet"
+    pq.write_table(bbox_table, path, row_group_size=1)
+
+    assert _has_bbox_column(pq.read_schema(path))
+    expr = _bbox_filter((10.5, 10.5, 12.0, 12.0))
+    assert pq.read_table(path, filters=expr)["id"].to_pylist() == [1]
+
+
+@pytest.mark.fast
+def test_bbox_filter_missing_column():
+    """Test files without a covering column are not given a bbox filter.
+
+    Returns
+    -------
+    None
+        Test passes if the bbox column is not detected
+    """
+    from planetary_computer_mcp.core.vector_utils import _has_bbox_column
+
+    schema = pa.schema([("id", pa.int64()), ("geometry", pa.binary())])
+    assert not _has_bbox_column(schema)
+
+    flat = pa.schema([("bbox", pa.float64())])
+    assert not _has_bbox_column(flat)
+
+
+@pytest.mark.fast
+def test_save_geodataframe_as_parquet_covering_bbox(tmp_path):
+    """Test saved GeoParquet has a bbox covering column and round-trips.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory
+
+    Returns
+    -------
+    None
+        Test passes for both single-type (GeoArrow) and mixed (WKB) geometries
+    """
+    import geopandas as gpd
+    from shapely.geometry import Point, box
+
+    from planetary_computer_mcp.core.vector_utils import (
+        _has_bbox_column,
+        save_geodataframe_as_parquet,
+    )
+
+    polygons = gpd.GeoDataFrame(
+        {"id": [0, 1]}, geometry=[box(0, 0, 1, 1), box(2, 2, 3, 3)], crs="EPSG:4326"
+    )
+    mixed = gpd.GeoDataFrame(
+        {"id": [0, 1]}, geometry=[box(0, 0, 1, 1), Point(5, 5)], crs="EPSG:4326"
+    )
+
+    for name, gdf in [("polygons", polygons), ("mixed", mixed)]:
+        path = tmp_path / f"{name}.parquet"
+        save_geodataframe_as_parquet(gdf, str(path))
+
+        assert _has_bbox_column(pq.read_schema(path))
+        result = gpd.read_parquet(path)
+        assert result.geometry.geom_equals(gdf.geometry).all()
+
+
+@pytest.mark.fast
+def test_save_query_result_round_trip(tmp_path):
+    """Test query results from files with a covering column can be saved again.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory
+
+    Returns
+    -------
+    None
+        Test passes if the source bbox column is dropped and the saved file
+        gets a fresh covering column
+    """
+    import geopandas as gpd
+    from fsspec.implementations.local import LocalFileSystem
+    from shapely.geometry import box
+
+    from planetary_computer_mcp.core.vector_utils import (
+        _has_bbox_column,
+        _read_and_filter_parquet,
+        _tables_to_geodataframe,
+        save_geodataframe_as_parquet,
+    )
+
+    gdf = gpd.GeoDataFrame(
+        {"id": [0, 1]}, geometry=[box(0, 0, 1, 1), box(2, 2, 3, 3)], crs="EPSG:4326"
+    )
+    source = tmp_path / "source.parquet"
+    gdf.to_parquet(source, write_covering_bbox=True)
+
+    table = _read_and_filter_parquet(str(source), {}, box(-1, -1, 4, 4), fs=LocalFileSystem())
+    result = _tables_to_geodataframe([table])
+    assert list(result.columns) == ["id", "geometry"]
+
+    output = tmp_path / "saved.parquet"
+    save_geodataframe_as_parquet(result, str(output))
+    assert _has_bbox_column(pq.read_schema(output))
+    assert gpd.read_parquet(output).geometry.geom_equals(gdf.geometry).all()
+
+    # Other write errors are not retried as WKB
+    with pytest.raises(ValueError, match="already exists"):
+        save_geodataframe_as_parquet(result.assign(bbox=1), str(output))
+
+
+@pytest.mark.fast
+def test_get_vector_metadata_geometry_types():
+    """Test geometry type counts match GeoPandas value_counts.
+
+    Returns
+    -------
+    None
+        Test passes if counts agree, with missing geometries skipped
+    """
+    import geopandas as gpd
+    from shapely.geometry import Point, box
+
+    from planetary_computer_mcp.core.vector_utils import get_vector_metadata
+
+    gdf = gpd.GeoDataFrame(
+        {"id": [0, 1, 2, 3]},
+        geometry=[box(0, 0, 1, 1), box(2, 2, 3, 3), Point(5, 5), None],
+        crs="EPSG:4326",
+    )
+
+    metadata = get_vector_metadata(gdf)
+    assert metadata["geometry_types"] == gdf.geometry.type.value_counts().to_dict()
+    assert metadata["geometry_types"] == {"Polygon": 2, "Point": 1}
+    assert get_vector_metadata(gdf.iloc[:0])["geometry_types"] == {}
+
+
+@pytest.mark.fast
+def test_read_and_filter_parquet_file_bounds(tmp_path):
+    """Test files whose GeoParquet bbox misses the query are skipped.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory
+
+    Returns
+    -------
+    None
+        Test passes if the file extent is read from metadata and used to skip
+    """
+    import geopandas as gpd
+    from fsspec.implementations.local import LocalFileSystem
+    from shapely.geometry import box
+
+    from planetary_computer_mcp.core.vector_utils import _geo_bounds, _read_and_filter_parquet
+
+    gdf = gpd.GeoDataFrame(
+        {"id": [0, 1]}, geometry=[box(0, 0, 1, 1), box(2, 2, 3, 3)], crs="EPSG:4326"
+    )
+    path = tmp_path / "buildings.parquet"
+    gdf.to_parquet(path, geometry_encoding="WKB")
+
+    assert _geo_bounds(pq.read_schema(path)) == (0.0, 0.0, 3.0, 3.0)
+    assert _geo_bounds(pa.schema([("id", pa.int64())])) is None
+
+    fs = LocalFileSystem()
+    assert _read_and_filter_parquet(str(path), {}, box(10, 10, 11, 11), fs=fs) is None
+    result = _read_and_filter_parquet(str(path), {}, box(2.5, 2.5, 4, 4), fs=fs)
+    assert result.column("id").to_pylist() == [1]
+
+    # The geopandas fallback (no filesystem) filters the same way
+    result = _read_and_filter_parquet(str(path), {}, box(2.5, 2.5, 4, 4))
+    assert result.column("id").to_pylist() == [1]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("geometry_encoding", ["WKB", "geoarrow"])
+def test_read_and_filter_parquet_two_pass(tmp_path, geometry_encoding):
+    """Test attribute columns read after the geometry pass stay row-aligned.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory
+    geometry_encoding : str
+        GeoParquet geometry encoding of the file
+
+    Returns
+    -------
+    None
+        Test passes if surviving rows keep their attributes and column order
+    """
+    import geopandas as gpd
+    import shapely
+    from fsspec.implementations.local import LocalFileSystem
+    from shapely.geometry import box
+
+    from planetary_computer_mcp.core.vector_utils import _read_and_filter_parquet
+
+    gdf = gpd.GeoDataFrame(
+        {"id": range(100), "height": [i / 2 for i in range(100)]},
+        geometry=[box(i, i, i + 0.5, i + 0.5) for i in range(100)],
+        crs="EPSG:4326",
+    )
+    path = tmp_path / "buildings.parquet"
+    gdf.to_parquet(
+        path, geometry_encoding=geometry_encoding, write_covering_bbox=True, row_group_size=10
+    )
+
+    # Only row group 4 (rows 40-49) is read; rows 42-44 intersect
+    result = _read_and_filter_parquet(
+        str(path), {}, box(41.8, 41.8, 44.2, 44.2), fs=LocalFileSystem()
+    )
+    assert result.column_names == ["id", "height", "geometry", "bbox"]
+    assert result.column("id").to_pylist() == [42, 43, 44]
+    assert result.column("height").to_pylist() == [21.0, 21.5, 22.0]
+    # The geopandas fallback pushes the bbox down through the covering column
+    fallback = _read_and_filter_parquet(str(path), {}, box(41.8, 41.8, 44.2, 44.2))
+    assert fallback.column("id").to_pylist() == [42, 43, 44]
+    # GeoArrow geometries come back as WKB so tables from all files combine
+    assert shapely.from_wkb(result.column("geometry").to_numpy(zero_copy_only=False)).tolist() == [
+        box(i, i, i + 0.5, i + 0.5) for i in (42, 43, 44)
+    ]
+
+
+@pytest.mark.fast
+def test_read_and_filter_parquet_covered_tile(tmp_path, monkeypatch):
+    """Test files from a tile the query covers are returned without a predicate.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+
+    Returns
+    -------
+    None
+        Test passes if all rows come back as WKB and no row test runs
+    """
+    import geopandas as gpd
+    import shapely
+    from fsspec.implementations.local import LocalFileSystem
+    from shapely.geometry import box
+
+    from planetary_computer_mcp.core import vector_utils
+
+    geometries = [box(0.1, 0.1, 0.2, 0.2), box(0.8, 0.8, 1.5, 1.5)]
+    gdf = gpd.GeoDataFrame({"id": [0, 1]}, geometry=geometries, crs="EPSG:4326")
+    path = tmp_path / "part-0.parquet"
+    gdf.to_parquet(path, geometry_encoding="geoarrow")
+
+    def fail(*args: object) -> None:
+        raise AssertionError("row predicate should be skipped")
+
+    monkeypatch.setattr(vector_utils, "_intersecting_rows", fail)
+    result = vector_utils._read_and_filter_parquet(
+        str(path), {}, box(-1, -1, 1.2, 1.2), fs=LocalFileSystem(), tile_box=box(0, 0, 1, 1)
+    )
+    assert result.column("id").to_pylist() == [0, 1]
+    wkb = result.column("geometry").to_numpy(zero_copy_only=False)
+    assert shapely.from_wkb(wkb).tolist() == geometries
+
+
+@pytest.mark.fast
+def test_intersecting_rows_bbox_prefilter():
+    """Test rows with a covering bbox inside the query skip geometry decoding.
+
+    Returns
+    -------
+    None
+        Test passes if interior rows are kept unparsed and edge rows are tested
+    """
+    import shapely
+    from shapely.geometry import Polygon, box
+
+    from planetary_computer_mcp.core.vector_utils import _intersecting_rows
+
+    # Row 0 is inside the query (its WKB is never parsed), row 1 is a triangle
+    # whose bbox crosses the query corner but whose shape misses it, row 2 hits
+    triangle = Polygon([(9, 12), (12, 12), (12, 9)])
+    table = pa.table(
+        {
+            "geometry": [b"not wkb", shapely.to_wkb(triangle), shapely.to_wkb(box(9, 9, 11, 11))],
+            "bbox": [
+                {"xmin": 1.0, "ymin": 1.0, "xmax": 2.0, "ymax": 2.0},
+                {"xmin": 9.0, "ymin": 9.0, "xmax": 12.0, "ymax": 12.0},
+                {"xmin": 9.0, "ymin": 9.0, "xmax": 11.0, "ymax": 11.0},
+            ],
+        }
+    )
+    query = box(0, 0, 10, 10)
+    shapely.prepare(query)
+    assert _intersecting_rows(table, "wkb", query).tolist() == [0, 2]
+
+
+@pytest.mark.fast
+def test_from_wkb_parallel(monkeypatch):
+    """Test chunked threaded WKB parsing keeps geometries in order.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+
+    Returns
+    -------
+    None
+        Test passes if the parallel parse matches a single from_wkb call
+    """
+    import numpy as np
+    import shapely
+
+    from planetary_computer_mcp.core import vector_utils
+
+    monkeypatch.setattr(vector_utils, "WKB_PARSE_CHUNK_ROWS", 7)
+    monkeypatch.setattr(vector_utils.os, "cpu_count", lambda: 4)
+    wkb = shapely.to_wkb(shapely.points(np.arange(100.0), np.arange(100.0)))
+
+    result = vector_utils._from_wkb_parallel(wkb)
+    assert shapely.equals(result, shapely.from_wkb(wkb)).all()
+    assert len(vector_utils._from_wkb_parallel(wkb[:0])) == 0
+
+
+@pytest.mark.fast
+def test_tables_to_geodataframe(tmp_path):
+    """Test filtered tables from several files combine into one GeoDataFrame.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory
+
+    Returns
+    -------
+    None
+        Test passes if rows, columns and geometries from every file are kept
+    """
+    import geopandas as gpd
+    from fsspec.implementations.local import LocalFileSystem
+    from shapely.geometry import box
+
+    from planetary_computer_mcp.core.vector_utils import (
+        _read_and_filter_parquet,
+        _tables_to_geodataframe,
+    )
+
+    query = box(0, 0, 10, 10)
+    first = gpd.GeoDataFrame({"id": [0, 1]}, geometry=[box(0, 0, 1, 1), box(2, 2, 3, 3)])
+    # Second file has an extra attribute column
+    second = gpd.GeoDataFrame(
+        {"id": [2], "height": [12.5]}, geometry=[box(5, 5, 6, 6)], crs="EPSG:4326"
+    )
+    fs = LocalFileSystem()
+    tables = []
+    for i, gdf in enumerate([first.set_crs("EPSG:4326"), second]):
+        path = tmp_path / f"part-{i}.parquet"
+        gdf.to_parquet(path, geometry_encoding="WKB")
+        tables.append(_read_and_filter_parquet(str(path), {}, query, fs=fs))
+
+    result = _tables_to_geodataframe(tables)
+    assert result["id"].tolist() == [0, 1, 2]
+    assert result["height"].isna().tolist() == [True, True, False]
+    assert result.crs == "EPSG:4326"
+    assert result.geometry.equals(gpd.GeoSeries([*first.geometry, *second.geometry]))
+    assert len(_tables_to_geodataframe([])) == 0
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("find_threshold", [64, 0])
+def test_list_quadkey_parquet_files(tmp_path, monkeypatch, find_threshold):
+    """Test quadkey partition listing via ls or find, then from the on-disk index.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+    find_threshold : int
+        Quadkey count above which the recursive listing is used
+
+    Returns
+    -------
+    None
+        Test passes if only parquet files in the wanted partitions are listed,
+        empty partitions are never listed, a repeat query does not touch the
+        filesystem, and expired entries are listed again
+    """
+    from fsspec.implementations.local import LocalFileSystem
+
+    from planetary_computer_mcp.core import vector_utils
+
+    monkeypatch.setattr(vector_utils, "QUADKEY_FIND_THRESHOLD", find_threshold)
+    monkeypatch.setattr(vector_utils, "QUADKEY_INDEX_DIR", tmp_path / "index")
+
+    region = tmp_path / "region"
+    for qk in ["0231", "0232", "02310"]:
+        partition = region / f"quadkey={qk}"
+        partition.mkdir(parents=True)
+        (partition / "part-0.parquet").touch()
+        (partition / "_SUCCESS").touch()
+
+    expected = {"0231": [str(region / "quadkey=0231" / "part-0.parquet")], "0233": []}
+    fs = LocalFileSystem()
+    listed: list[str] = []
+    ls = fs.ls
+
+    def recording_ls(path: str, **kwargs: object) -> list:
+        listed.append(path)
+        return ls(path, **kwargs)
+
+    monkeypatch.setattr(fs, "ls", recording_ls)
+    files = vector_utils._list_quadkey_parquet_files(fs, str(region), ["0231", "0233"])
+    assert files == expected
+    # The unpopulated quadkey is resolved from the region listing alone
+    assert not any(path.endswith("quadkey=0233") for path in listed)
+
+    # Repeat queries are answered from the persisted index without listing
+    fs = LocalFileSystem()
+    monkeypatch.setattr(fs, "ls", None)
+    monkeypatch.setattr(fs, "find", None)
+    assert vector_utils._list_quadkey_parquet_files(fs, str(region), ["0231", "0233"]) == expected
+
+    # Entries expire by their own listing time, although the file was rewritten
+    (region / "quadkey=0231" / "part-1.parquet").touch()
+    fs = LocalFileSystem(skip_instance_cache=True)
+    vector_utils._list_quadkey_parquet_files(fs, str(region), ["0232"])
+    now = time.time() + vector_utils.QUADKEY_INDEX_TTL_SECONDS + 1
+    monkeypatch.setattr(vector_utils.time, "time", lambda: now)
+    files = vector_utils._list_quadkey_parquet_files(fs, str(region), ["0231"])
+    assert sorted(files["0231"]) == [
+        str(region / "quadkey=0231" / f"part-{i}.parquet") for i in range(2)
+    ]
+
+
+@pytest.mark.fast
+def test_list_quadkey_parquet_files_unlisted_region(tmp_path, monkeypatch):
+    """Test a failed or empty region listing is not persisted as empty tiles.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+
+    Returns
+    -------
+    None
+        Test passes if no index is written and partitions show up once the
+        region can be listed
+    """
+    from fsspec.implementations.local import LocalFileSystem
+
+    from planetary_computer_mcp.core import vector_utils
+
+    monkeypatch.setattr(vector_utils, "QUADKEY_INDEX_DIR", tmp_path / "index")
+    region = tmp_path / "region"
+    fs = LocalFileSystem(skip_instance_cache=True)
+
+    # Missing region, then a region with no partitions yet
+    assert vector_utils._list_quadkey_parquet_files(fs, str(region), ["0231"]) == {"0231": []}
+    region.mkdir()
+    assert vector_utils._list_quadkey_parquet_files(fs, str(region), ["0231"]) == {"0231": []}
+    assert not (tmp_path / "index").exists()
+
+    partition = region / "quadkey=0231"
+    partition.mkdir()
+    (partition / "part-0.parquet").touch()
+    assert vector_utils._list_quadkey_parquet_files(fs, str(region), ["0231"]) == {
+        "0231": [str(partition / "part-0.parquet")]
+    }
+
+
+@pytest.mark.fast
+def test_list_item_parts(tmp_path, monkeypatch):
+    """Test item data assets are listed in order and cached per href.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+
+    Returns
+    -------
+    None
+        Test passes if listings keep input order, skip missing assets and are
+        reused without touching the filesystem
+    """
+    from fsspec.implementations.local import LocalFileSystem
+
+    from planetary_computer_mcp.core import vector_utils
+    from planetary_computer_mcp.core.cache import _LRUCache
+
+    monkeypatch.setattr(vector_utils, "_ITEM_PARTS_CACHE", _LRUCache(2))
+    hrefs = []
+    for name in ["a", "b"]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "part-0.parquet").touch()
+        hrefs.append(str(tmp_path / name))
+    missing = str(tmp_path / "missing")
+
+    expected = [[f"{href}/part-0.parquet"] for href in hrefs]
+    fs = LocalFileSystem()
+    assert vector_utils._list_item_parts(fs, [*hrefs, missing]) == [*expected, []]
+
+    monkeypatch.setattr(fs, "ls", None)
+    assert vector_utils._list_item_parts(fs, hrefs) == expected
+
+    # The cache is bounded: a third listing evicts the least recently used href
+    monkeypatch.setattr(fs, "ls", LocalFileSystem(skip_instance_cache=True).ls)
+    (tmp_path / "c").mkdir()
+    vector_utils._list_item_parts(fs, [str(tmp_path / "c")])
+    assert len(vector_utils._ITEM_PARTS_CACHE) == 2
+    assert vector_utils._ITEM_PARTS_CACHE.get(hrefs[0]) is None
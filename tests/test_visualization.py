@@ -0,0 +1,268 @@
+"""
+Fast unit tests for raster visualization utilities.
+"""
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+from PIL import Image
+
+
+@pytest.fixture
+def mock_sar_dataset():
+    """Create a mock SAR Dataset with a time dimension.
+
+    Returns
+    -------
+    xr.Dataset
+        Mock dataset with vv/vh bands
+    """
+    y = np.linspace(34.1, 34.0, 30)
+    x = np.linspace(-118.3, -118.2, 40)
+    time = pd.date_range("2024-06-01", periods=2, freq="D")
+    rng = np.random.default_rng(0)
+
+    return xr.Dataset(
+        {
+            "vv": (["time", "y", "x"], rng.random((2, 30, 40), dtype=np.float32)),
+            "vh": (["time", "y", "x"], rng.random((2, 30, 40), dtype=np.float32)),
+        },
+        coords={"time": time, "y": y, "x": x},
+    )
+
+
+@pytest.mark.fast
+def test_create_rgb_visualization_repeated_bands(mock_sar_dataset):
+    """Test RGB visualization with repeated bands (SAR false color).
+
+    Parameters
+    ----------
+    mock_sar_dataset : xr.Dataset
+        Mock SAR dataset fixture
+
+    Returns
+    -------
+    None
+        Test passes if an image of the raster's shape is written
+    """
+    from planetary_computer_mcp.core.visualization import create_rgb_visualization
+
+    output_path = Path(tempfile.mkdtemp()) / "sar.jpg"
+    create_rgb_visualization(mock_sar_dataset, str(output_path), "sentinel-1-rtc")
+
+    with Image.open(output_path) as img:
+        assert img.size == (40, 30)
+        assert img.mode == "RGB"
+
+
+@pytest.mark.fast
+def test_create_rgb_visualization_missing_bands(mock_sar_dataset):
+    """Test RGB visualization falls back to the first band when bands are missing.
+
+    Parameters
+    ----------
+    mock_sar_dataset : xr.Dataset
+        Mock SAR dataset fixture
+
+    Returns
+    -------
+    None
+        Test passes if an image is written despite missing bands
+    """
+    from planetary_computer_mcp.core.visualization import create_rgb_visualization
+
+    output_path = Path(tempfile.mkdtemp()) / "fallback.jpg"
+    create_rgb_visualization(mock_sar_dataset, str(output_path), "sentinel-2-l2a")
+
+    with Image.open(output_path) as img:
+        assert img.size == (40, 30)
+
+
+@pytest.mark.fast
+def test_create_rgb_visualization_clips_to_bbox(mock_sar_dataset, tmp_path):
+    """Test georeferenced data is clipped to the AOI before rendering.
+
+    Parameters
+    ----------
+    mock_sar_dataset : xr.Dataset
+        Mock SAR dataset fixture
+    tmp_path : Path
+        Pytest temporary directory
+
+    Returns
+    -------
+    None
+        Test passes if only pixels within the bbox are rendered (also from lazy
+        data), and data without a CRS or with no pixels in the bbox is left as is
+    """
+    import rioxarray  # noqa: F401
+
+    from planetary_computer_mcp.core.visualization import create_rgb_visualization
+
+    bbox = [-118.3, 34.05, -118.25, 34.1]
+    output_path = str(tmp_path / "clipped.png")
+
+    # No CRS: nothing to clip against
+    create_rgb_visualization(mock_sar_dataset, output_path, "sentinel-1-rtc", bbox=bbox)
+    with Image.open(output_path) as img:
+        assert img.size == (40, 30)
+
+    ds = mock_sar_dataset.rio.write_crs("EPSG:4326")
+    expected = ds.rio.clip_box(*bbox)
+    for data in [ds, ds.chunk({"x": 10, "y": 10})]:
+        create_rgb_visualization(data, output_path, "sentinel-1-rtc", bbox=bbox)
+        with Image.open(output_path) as img:
+            assert img.size == (expected.sizes["x"], expected.sizes["y"])
+            assert img.size[0] < 40
+            assert img.size[1] < 30
+
+    # No pixels within the bbox: falls back to the full array
+    create_rgb_visualization(ds, output_path, "sentinel-1-rtc", bbox=[10, 10, 11, 11])
+    with Image.open(output_path) as img:
+        assert img.size == (40, 30)
+
+
+@pytest.mark.fast
+def test_normalize_rgb_stretch():
+    """Test percentile stretch output range and shape.
+
+    Returns
+    -------
+    None
+        Test passes if output is a full-range uint8 array of the input shape
+    """
+    from planetary_computer_mcp.core.visualization import normalize_rgb
+
+    rng = np.random.default_rng(0)
+    rgb = rng.integers(0, 10000, size=(256, 256, 3)).astype(np.uint16)
+
+    result = normalize_rgb(rgb, stretch=True)
+
+    assert result.shape == rgb.shape
+    assert result.dtype == np.uint8
+    assert result.min() == 0
+    assert result.max() == 255
+
+
+@pytest.mark.fast
+def test_create_rgb_visualization_from_geotiff_decimated(tmp_path, monkeypatch):
+    """Test large GeoTIFFs are read at preview size, keeping the aspect ratio.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+
+    Returns
+    -------
+    None
+        Test passes if the preview is capped at PREVIEW_MAX_SIZE on its long side
+    """
+    import rasterio
+    from rasterio.transform import from_origin
+
+    from planetary_computer_mcp.core import visualization
+
+    monkeypatch.setattr(visualization, "PREVIEW_MAX_SIZE", 100)
+    rng = np.random.default_rng(0)
+    input_path = tmp_path / "naip.tif"
+    profile = {
+        "driver": "GTiff",
+        "width": 300,
+        "height": 200,
+        "count": 4,
+        "dtype": "uint8",
+        "crs": "EPSG:4326",
+        "transform": from_origin(-118.3, 34.1, 0.0001, 0.0001),
+    }
+    with rasterio.open(input_path, "w", **profile) as dst:
+        dst.write(rng.integers(0, 255, (4, 200, 300), dtype=np.uint8))
+
+    output_path = visualization.create_rgb_visualization_from_geotiff(
+        str(input_path), str(tmp_path / "preview.jpg"), "naip"
+    )
+    with Image.open(output_path) as img:
+        assert img.size == (100, 67)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.int16])
+@pytest.mark.parametrize("stretch", [True, False])
+def test_normalize_rgb_lut_matches_float(dtype, stretch):
+    """Test the integer lookup-table path matches the float block path exactly.
+
+    Parameters
+    ----------
+    dtype : type
+        Integer input dtype
+    stretch : bool
+        Whether to apply percentile stretch
+
+    Returns
+    -------
+    None
+        Test passes if integer and float32 inputs normalize identically
+    """
+    from planetary_computer_mcp.core.visualization import normalize_rgb
+
+    info = np.iinfo(dtype)
+    rng = np.random.default_rng(0)
+    rgb = rng.integers(max(info.min, -5000), min(info.max, 10000), size=(300, 200, 3))
+    rgb = rgb.astype(dtype)
+
+    result = normalize_rgb(rgb, stretch=stretch)
+    np.testing.assert_array_equal(result, normalize_rgb(rgb.astype(np.float32), stretch=stretch))
+
+
+@pytest.mark.fast
+def test_create_colormap_visualization_continuous():
+    """Test continuous colormap visualization for elevation data.
+
+    Returns
+    -------
+    None
+        Test passes if a terrain-colored image is written
+    """
+    from planetary_computer_mcp.core.visualization import create_colormap_visualization
+
+    elevation = np.linspace(0, 1000, 30 * 40, dtype=np.float32).reshape(1, 30, 40)
+    ds = xr.Dataset({"data": (["time", "y", "x"], elevation)})
+
+    output_path = Path(tempfile.mkdtemp()) / "dem.jpg"
+    create_colormap_visualization(ds, str(output_path), "cop-dem-glo-30")
+
+    with Image.open(output_path) as img:
+        assert img.size == (40, 30)
+        assert img.mode == "RGB"
+
+
+@pytest.mark.fast
+def test_esa_worldcover_lut_matches_boundary_norm():
+    """Test the precomputed WorldCover LUT matches matplotlib BoundaryNorm binning.
+
+    Returns
+    -------
+    None
+        Test passes if every uint8 value maps to the same color
+    """
+    import matplotlib.colors as mcolors
+
+    from planetary_computer_mcp.core.visualization import (
+        ESA_WORLDCOVER_CMAP,
+        ESA_WORLDCOVER_LUT,
+    )
+
+    bounds = sorted(ESA_WORLDCOVER_CMAP)
+    cmap = mcolors.ListedColormap([np.array(ESA_WORLDCOVER_CMAP[v]) / 255 for v in bounds])
+    norm = mcolors.BoundaryNorm(bounds + [max(bounds) + 1], cmap.N)
+
+    values = np.arange(256)
+    expected = np.round(cmap(norm(values))[:, :3] * 255).astype(np.uint8)
+
+    np.testing.assert_array_equal(ESA_WORLDCOVER_LUT[values], expected)
@@ -0,0 +1,254 @@
+"""
+Fast unit tests for Zarr utilities.
+"""
+
+from typing import Any
+
+import numpy as np
+import pytest
+import xarray as xr
+from pyproj import CRS
+
+# Daymet-style Lambert Conformal Conic grid
+DAYMET_CRS = CRS.from_proj4(
+    "+proj=lcc +lat_1=25 +lat_2=60 +lat_0=42.5 +lon_0=-100 +x_0=0 +y_0=0 +ellps=WGS84 +units=m"
+)
+
+
+@pytest.fixture
+def mock_projected_dataset():
+    """Create a Daymet-like Dataset with a grid mapping data variable.
+
+    Returns
+    -------
+    xr.Dataset
+        Dataset with tmax/tmin on a projected x/y grid (dask-backed)
+    """
+    x = np.arange(-2000e3, -1000e3, 1000.0) + 500
+    y = np.arange(1000e3, 0, -1000.0) - 500
+    shape = (2, y.size, x.size)
+    attrs = {"grid_mapping": "lambert_conformal_conic"}
+
+    return xr.Dataset(
+        {
+            "tmax": (("time", "y", "x"), np.zeros(shape, dtype=np.float32), attrs),
+            "tmin": (("time", "y", "x"), np.zeros(shape, dtype=np.float32), attrs),
+            "lambert_conformal_conic": ((), 0, DAYMET_CRS.to_cf()),
+        },
+        coords={"time": [0, 1], "y": y, "x": x},
+    ).chunk({"y": 250, "x": 250})
+
+
+@pytest.mark.fast
+def test_clip_projected_grid(mock_projected_dataset):
+    """Test projected grids are clipped lazily to a lon/lat bbox.
+
+    Parameters
+    ----------
+    mock_projected_dataset : xr.Dataset
+        Mock projected dataset fixture
+
+    Returns
+    -------
+    None
+        Test passes if all variables share a smaller, still-lazy window
+    """
+    import dask.array as da
+
+    from planetary_computer_mcp.core.zarr_utils import (
+        _clip_projected_grid,
+        _get_grid_mapping_crs,
+    )
+
+    crs = _get_grid_mapping_crs(mock_projected_dataset)
+    assert crs == DAYMET_CRS
+
+    ds = mock_projected_dataset[["tmax", "tmin"]]
+    clipped = _clip_projected_grid(ds, [-120, 42, -118, 44], crs)
+
+    assert 0 < clipped.sizes["x"] < ds.sizes["x"]
+    assert 0 < clipped.sizes["y"] < ds.sizes["y"]
+    assert clipped["tmax"].shape == clipped["tmin"].shape
+    assert isinstance(clipped["tmax"].data, da.Array)
+
+    with pytest.raises(ValueError, match="No data found"):
+        _clip_projected_grid(ds, [10, 10, 11, 11], crs)
+
+    assert _clip_projected_grid(ds, [-120, 42, -118, 44], None) is ds
+
+
+@pytest.mark.fast
+def test_save_zarr_subset_as_netcdf_streams(tmp_path, monkeypatch):
+    """Test lazy subsets are written in time slices without computing them whole.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Pytest temporary directory
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+
+    Returns
+    -------
+    None
+        Test passes if the dataset reaches the writer still lazy, in chunks of
+        at most ZARR_TIME_CHUNK steps, and the NetCDF round-trips the data
+    """
+    import pandas as pd
+
+    from planetary_computer_mcp.core.zarr_utils import (
+        ZARR_TIME_CHUNK,
+        save_zarr_subset_as_netcdf,
+    )
+
+    time = pd.date_range("2024-01-01", periods=100, freq="h")
+    values = np.random.default_rng(0).random((100, 8, 6)).astype(np.float32)
+    ds = xr.Dataset(
+        {"tmax": (("time", "lat", "lon"), values)},
+        coords={"time": time, "lat": np.arange(8.0), "lon": np.arange(6.0)},
+    ).chunk({"time": -1})
+
+    written = []
+    to_netcdf = xr.Dataset.to_netcdf
+
+    def _record(self: xr.Dataset, *args: Any, **kwargs: Any) -> Any:
+        written.append(self.chunks)
+        return to_netcdf(self, *args, **kwargs)
+
+    monkeypatch.setattr(xr.Dataset, "to_netcdf", _record)
+    output_path = str(tmp_path / "subset.nc")
+    save_zarr_subset_as_netcdf(ds, output_path)
+
+    assert max(written[0]["time"]) == ZARR_TIME_CHUNK
+    with xr.open_dataset(output_path, engine="h5netcdf") as saved:
+        np.testing.assert_array_equal(saved["tmax"].values, values)
+        assert (saved["time"].values == time.values).all()
+
+
+@pytest.mark.fast
+def test_get_zarr_store_url_caches_asset(monkeypatch):
+    """Test the collection lookup is cached while signing runs on every call.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+
+    Returns
+    -------
+    None
+        Test passes if the STAC API is hit once and each call is re-signed
+    """
+    from types import SimpleNamespace
+
+    from pystac import Asset
+
+    from planetary_computer_mcp.core import zarr_utils
+
+    asset = Asset(
+        href="abfs://gridmet/gridmet.zarr",
+        extra_fields={
+            "xarray:open_kwargs": {
+                "consolidated": True,
+                "engine": "zarr",
+                "storage_options": {"account_name": "ai4edataeuwest"},
+            }
+        },
+    )
+    lookups = []
+
+    def _get_collection(collection_id: str) -> SimpleNamespace:
+        lookups.append(collection_id)
+        return SimpleNamespace(assets={"zarr-abfs": asset})
+
+    signed = []
+
+    def _sign(asset: Asset) -> Asset:
+        signed.append(asset)
+        return asset.clone()
+
+    fake_client = SimpleNamespace(get_collection=_get_collection)
+    # Set the cached_property value directly; setattr would read (open) it first
+    monkeypatch.setitem(zarr_utils.stac_client.__dict__, "client", fake_client)
+    monkeypatch.setattr(zarr_utils.pc, "sign", _sign)
+    zarr_utils._get_zarr_asset.cache_clear()
+
+    for _ in range(3):
+        url, storage_options, open_kwargs = zarr_utils.get_zarr_store_url("gridmet")
+        assert url == "abfs://gridmet/gridmet.zarr"
+        assert storage_options == {"account_name": "ai4edataeuwest"}
+        assert open_kwargs == {"consolidated": True}
+
+    assert lookups == ["gridmet"]
+    assert len(signed) == 3
+    # The cached asset is never mutated by the per-call kwargs cleanup
+    assert "engine" in asset.extra_fields["xarray:open_kwargs"]
+    zarr_utils._get_zarr_asset.cache_clear()
+
+
+@pytest.mark.fast
+def test_get_available_variables_from_zmetadata(mock_projected_dataset, tmp_path, monkeypatch):
+    """Test variables listed from .zmetadata match xarray's data variables.
+
+    Parameters
+    ----------
+    mock_projected_dataset : xr.Dataset
+        Mock projected dataset fixture
+    tmp_path : Path
+        Pytest temporary directory
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+
+    Returns
+    -------
+    None
+        Test passes if the metadata-only listing agrees with open_zarr and
+        the store is never opened with xarray
+    """
+    from planetary_computer_mcp.core import zarr_utils
+
+    store = str(tmp_path / "daymet.zarr")
+    ds = mock_projected_dataset.assign_coords(
+        lat=(("y", "x"), np.zeros((1000, 1000), dtype=np.float32))
+    )
+    ds.to_zarr(store, zarr_format=2, consolidated=True)
+    expected = [str(v) for v in xr.open_zarr(store).data_vars]
+
+    monkeypatch.setattr(zarr_utils, "get_zarr_store_url", lambda _: (store, {}, {}))
+    monkeypatch.setattr(zarr_utils.xr, "open_zarr", None)
+
+    assert sorted(zarr_utils.get_available_variables("daymet-daily-na")) == sorted(expected)
+    assert "lat" not in expected
+    assert "lambert_conformal_conic" in expected
+    assert zarr_utils._zmetadata_url("https://a.blob/daymet.zarr?st=1&sig=2") == (
+        "https://a.blob/daymet.zarr/.zmetadata?st=1&sig=2"
+    )
+
+
+@pytest.mark.fast
+def test_sanitize_attrs_for_netcdf():
+    """Test unencodable and nested attributes are dropped from a copy.
+
+    Returns
+    -------
+    None
+        Test passes if bad attributes are removed everywhere and the input
+        dataset keeps its original attributes
+    """
+    from planetary_computer_mcp.core.zarr_utils import _sanitize_attrs_for_netcdf
+
+    bad = {"ok": "température", "n": 3, "nested": {"a": 1}, "broken": "bad\udc80"}
+    ds = xr.Dataset(
+        {"tmax": (("time",), np.zeros(2), dict(bad))},
+        coords={"time": ("time", [0, 1], dict(bad))},
+        attrs=dict(bad),
+    )
+
+    cleaned = _sanitize_attrs_for_netcdf(ds)
+
+    expected = {"ok": "température", "n": 3}
+    assert cleaned.attrs == expected
+    assert cleaned["tmax"].attrs == expected
+    assert cleaned["time"].attrs == expected
+    assert ds.attrs == bad
+    assert ds["tmax"].attrs == bad